@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the VL and exclusion-list tooling.
+
+Every input is synthesized from fixed seeds: validator and publisher
+tokens carry real, correctly signed manifests and the exclusion lists use
+valid base58check account addresses, so the code paths timed here are
+the same ones a production run takes. Nothing touches the network.
+
+Covered:
+    parse_manifest          generate_vl.parse_manifest, with and without
+                            signature verification (cold verifier cache)
+    decode_token            generate_vl.decode_token
+    sign_blob               one blob signed with a secp256k1 and an
+                            Ed25519 publisher key
+    generate_vl             end-to-end VL generation from a config file at
+                            10, 100, 1k and 10k validators
+    create_signing_message  canonical exclusion-list message at 1k - 1M
+                            addresses
+    sign_exclusion_list     full exclusion-list signing at 1k - 1M addresses
+
+Each result records latency (min/median/mean/max seconds per call) and
+throughput (calls and items per second). Results are written as JSON and
+a previous run can be passed to --compare to flag regressions.
+
+Usage:
+    python3 scripts/benchmark_tools.py -o bench.json
+    python3 scripts/benchmark_tools.py --quick --compare bench.json
+    python3 scripts/benchmark_tools.py --only sign_blob --repeat 10
+
+Prerequisites:
+    pip3 install -r scripts/requirements.txt
+"""
+
+import argparse
+import base64
+import contextlib
+import fnmatch
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+import base58
+import nacl.signing
+
+import generate_vl
+import sign_exclusion_list
+import xrpl_manifest
+from secp256k1_backend import get_backend
+
+SCHEMA_VERSION = 1
+
+VL_SIZES = [10, 100, 1000, 10000]
+EXCLUSION_SIZES = [1000, 10000, 100000, 1000000]
+QUICK_VL_SIZES = [10, 100, 1000]
+QUICK_EXCLUSION_SIZES = [1000, 10000, 100000]
+
+RIPPLE_ALPHABET = b"rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz"
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+
+def _seed(label: str, i: int) -> bytes:
+    return hashlib.sha256(f"postfiat-bench:{label}:{i}".encode()).digest()
+
+
+def _vl_field(header: bytes, value: bytes) -> bytes:
+    # Manifest blobs are all well under 193 bytes, so one length byte suffices
+    return header + bytes([len(value)]) + value
+
+
+def synthetic_token(i: int, key_type: str = "ed25519", domain: Optional[str] = None) -> str:
+    """
+    Build a validator-keys style token for synthetic key pair `i`.
+
+    The manifest has an Ed25519 master key and an ephemeral signing key of
+    `key_type`, and both signatures are valid.
+    """
+    master = nacl.signing.SigningKey(_seed("master", i))
+    master_public = b"\xed" + bytes(master.verify_key)
+    secret = _seed(f"ephemeral-{key_type}", i)
+
+    if key_type == "secp256k1":
+        signing_public = get_backend().public_key(secret)
+    else:
+        signing_public = b"\xed" + bytes(nacl.signing.SigningKey(secret).verify_key)
+
+    # Canonical field order: sfSequence, sfPublicKey, sfSigningPubKey,
+    # sfSignature, sfDomain, sfMasterSignature
+    head = b"\x24" + (1).to_bytes(4, "big")
+    head += _vl_field(b"\x71", master_public) + _vl_field(b"\x73", signing_public)
+    tail = _vl_field(b"\x77", domain.encode("ascii")) if domain else b""
+
+    signing_data = xrpl_manifest.HASH_PREFIX_MANIFEST + head + tail
+    if key_type == "secp256k1":
+        signature = get_backend().sign_digest(secret, xrpl_manifest.sha512_half(signing_data))
+    else:
+        signature = nacl.signing.SigningKey(secret).sign(signing_data).signature
+    master_signature = master.sign(signing_data).signature
+
+    manifest = (
+        head
+        + _vl_field(b"\x76", signature)
+        + tail
+        + _vl_field(b"\x70\x12", master_signature)
+    )
+    token = {
+        "manifest": base64.b64encode(manifest).decode("ascii"),
+        "validation_secret_key": secret.hex().upper(),
+    }
+    return base64.b64encode(json.dumps(token).encode()).decode("ascii")
+
+
+def synthetic_validator_tokens(count: int) -> List[str]:
+    """Ed25519 validator tokens; every other one declares a domain."""
+    return [
+        synthetic_token(i, "ed25519", "example.com" if i % 2 else None)
+        for i in range(count)
+    ]
+
+
+def synthetic_address(i: int) -> str:
+    """A valid classic account address (base58check, type 0, 20-byte ID)."""
+    account_id = _seed("account", i)[:20]
+    return base58.b58encode_check(b"\x00" + account_id, alphabet=RIPPLE_ALPHABET).decode("ascii")
+
+
+def synthetic_exclusion_list(addresses: List[str]) -> dict:
+    return {
+        "version": "1.0",
+        "timestamp": "2025-09-24T16:30:00Z",
+        "issuer_address": addresses[0],
+        "exclusions": [
+            {
+                "address": address,
+                "reason": "benchmark",
+                "date_added": "2025-09-24T15:30:00Z",
+            }
+            for address in addresses
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def measure(
+    fn: Callable[[], object],
+    repeat: int,
+    number: int = 1,
+    setup: Optional[Callable[[], None]] = None,
+    warmup: bool = True,
+) -> List[float]:
+    """
+    Call `fn` `number` times per sample for `repeat` samples and return the
+    per-call latency of each sample in seconds. `setup` runs untimed
+    before every sample.
+    """
+    if warmup:
+        if setup is not None:
+            setup()
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def result(name: str, params: dict, items: int, samples: List[float], number: int) -> dict:
+    median = statistics.median(samples)
+    return {
+        "name": name,
+        "params": params,
+        "items": items,
+        "repeat": len(samples),
+        "number": number,
+        "min_s": min(samples),
+        "median_s": median,
+        "mean_s": statistics.fmean(samples),
+        "max_s": max(samples),
+        "ops_per_sec": 1 / median if median else 0.0,
+        "items_per_sec": items / median if median else 0.0,
+    }
+
+
+def result_key(entry: dict) -> str:
+    params = ",".join(f"{k}={v}" for k, v in sorted(entry["params"].items()))
+    return f"{entry['name']}[{params}]" if params else entry["name"]
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the progress output of the tools being timed."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+def bench_parse_manifest(tokens: List[str], repeat: int) -> List[dict]:
+    manifests = [generate_vl.decode_token(t)["manifest"] for t in tokens]
+
+    def parse(verify):
+        for m in manifests:
+            generate_vl.parse_manifest(m, verify)
+
+    results = []
+    for verify in (False, True):
+        samples = measure(
+            lambda: parse(verify),
+            repeat,
+            setup=xrpl_manifest._default_verifier.clear,
+        )
+        per_item = [s / len(manifests) for s in samples]
+        results.append(result(
+            "parse_manifest", {"verify": verify}, 1, per_item, len(manifests)
+        ))
+    return results
+
+
+def bench_decode_token(tokens: List[str], repeat: int) -> List[dict]:
+    def decode():
+        for t in tokens:
+            generate_vl.decode_token(t)
+
+    samples = measure(decode, repeat)
+    per_item = [s / len(tokens) for s in samples]
+    return [result("decode_token", {}, 1, per_item, len(tokens))]
+
+
+def bench_sign_blob(tokens: List[str], repeat: int, number: int = 50) -> List[dict]:
+    results = []
+    for key_type in ("secp256k1", "ed25519"):
+        builder = generate_vl.VLBuilder(synthetic_token(10 ** 6, key_type))
+        validators = [builder.validator_entry(generate_vl.decode_token(t)) for t in tokens]
+        blob = bytes(builder.serialize_blob(validators, 1, "2030-01-01"))
+
+        samples = measure(
+            lambda: generate_vl.sign_blob(blob, builder._secret, key_type),
+            repeat,
+            number,
+        )
+        results.append(result(
+            "sign_blob",
+            {"key_type": key_type, "blob_bytes": len(blob)},
+            1,
+            samples,
+            number,
+        ))
+    return results
+
+
+def bench_generate_vl(sizes: List[int], repeat: int, workdir: str) -> List[dict]:
+    publisher = synthetic_token(10 ** 6, "secp256k1")
+    all_tokens = synthetic_validator_tokens(max(sizes))
+
+    results = []
+    for size in sizes:
+        config_path = os.path.join(workdir, f"vl_{size}.json")
+        output_path = os.path.join(workdir, f"vl_{size}.out.json")
+        with open(config_path, "w") as f:
+            json.dump({
+                "publisher_token": publisher,
+                "sequence": 1,
+                "expiration": "2030-01-01",
+                "validator_tokens": all_tokens[:size],
+            }, f)
+
+        def run():
+            with _quiet():
+                generate_vl.generate_vl(config_path, output_path, 2)
+
+        # Every run starts with a cold manifest cache, like a fresh process
+        samples = measure(
+            run,
+            repeat,
+            setup=xrpl_manifest._default_verifier.clear,
+            warmup=size <= 1000,
+        )
+        results.append(result("generate_vl", {"validators": size}, size, samples, 1))
+    return results
+
+
+def bench_exclusion_list(sizes: List[int], repeat: int) -> List[dict]:
+    addresses = [synthetic_address(i) for i in range(max(sizes))]
+    secret = _seed("exclusion-issuer", 0).hex()
+
+    results = []
+    for size in sizes:
+        data = synthetic_exclusion_list(addresses[:size])
+        warmup = size <= 100000
+
+        samples = measure(
+            lambda: sign_exclusion_list.create_signing_message(data),
+            repeat,
+            warmup=warmup,
+        )
+        results.append(result(
+            "create_signing_message", {"addresses": size}, size, samples, 1
+        ))
+
+        def sign():
+            with _quiet():
+                sign_exclusion_list.sign_exclusion_list(dict(data), secret)
+
+        samples = measure(sign, repeat, warmup=warmup)
+        results.append(result(
+            "sign_exclusion_list", {"addresses": size}, size, samples, 1
+        ))
+    return results
+
+
+def run_benchmarks(
+    only: Optional[str] = None,
+    repeat: int = 5,
+    quick: bool = False,
+    progress: Callable[[str], None] = lambda message: None,
+) -> List[dict]:
+    """Run the suite (optionally filtered by an fnmatch pattern on the name)."""
+    vl_sizes = QUICK_VL_SIZES if quick else VL_SIZES
+    exclusion_sizes = QUICK_EXCLUSION_SIZES if quick else EXCLUSION_SIZES
+
+    def wanted(name):
+        return only is None or fnmatch.fnmatch(name, only)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="postfiat-bench-") as workdir:
+        tokens = None
+        if wanted("parse_manifest") or wanted("decode_token") or wanted("sign_blob"):
+            progress("generating synthetic validator tokens")
+            tokens = synthetic_validator_tokens(1000)
+
+        suite = [
+            ("parse_manifest", lambda: bench_parse_manifest(tokens, repeat)),
+            ("decode_token", lambda: bench_decode_token(tokens, repeat)),
+            ("sign_blob", lambda: bench_sign_blob(tokens[:100], repeat)),
+            ("generate_vl", lambda: bench_generate_vl(vl_sizes, repeat, workdir)),
+        ]
+        for name, run in suite:
+            if wanted(name):
+                progress(f"running {name}")
+                results.extend(run())
+
+        if wanted("create_signing_message") or wanted("sign_exclusion_list"):
+            progress("running create_signing_message / sign_exclusion_list")
+            results.extend(
+                r for r in bench_exclusion_list(exclusion_sizes, repeat)
+                if wanted(r["name"])
+            )
+    return results
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "secp256k1_backend": get_backend().name,
+    }
+
+
+def compare(current: List[dict], baseline: List[dict], threshold: float) -> List[dict]:
+    """
+    Match results by name and parameters and return one row per shared
+    benchmark with the median latency ratio (current / baseline).
+    """
+    previous = {result_key(r): r for r in baseline}
+    rows = []
+    for entry in current:
+        key = result_key(entry)
+        if key not in previous or not previous[key]["median_s"]:
+            continue
+        ratio = entry["median_s"] / previous[key]["median_s"]
+        rows.append({
+            "benchmark": key,
+            "baseline_s": previous[key]["median_s"],
+            "current_s": entry["median_s"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the VL and exclusion-list tooling with synthetic keys."
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Write results as JSON to this file",
+    )
+    parser.add_argument(
+        "--compare", metavar="BASELINE",
+        help="Compare against a previous results file; exits 1 on regression",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Median slowdown counted as a regression (default: 0.10 = 10%%)",
+    )
+    parser.add_argument(
+        "--only", metavar="PATTERN",
+        help="Only run benchmarks whose name matches this fnmatch pattern",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="Timed samples per benchmark (default: 5)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="Skip the largest sizes (10k validators, 1M addresses)",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        sys.exit("Error: --repeat must be at least 1")
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare) as f:
+                baseline = json.load(f)["results"]
+        except (OSError, ValueError, KeyError) as e:
+            sys.exit(f"Error: could not read baseline {args.compare}: {e}")
+
+    started = time.time()
+    results = run_benchmarks(
+        args.only,
+        args.repeat,
+        args.quick,
+        progress=lambda message: print(f"{message.capitalize()}...", file=sys.stderr),
+    )
+
+    print(f"{'benchmark':<52} {'median':>12} {'min':>12} {'items/s':>14}")
+    for entry in results:
+        print(f"{result_key(entry):<52} {_format_seconds(entry['median_s']):>12} "
+              f"{_format_seconds(entry['min_s']):>12} {entry['items_per_sec']:>14,.0f}")
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "started": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started)),
+        "duration_s": time.time() - started,
+        "environment": environment(),
+        "repeat": args.repeat,
+        "quick": args.quick,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if baseline is not None:
+        rows = compare(results, baseline, args.threshold)
+        print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(f"  {row['benchmark']:<52} {row['ratio']:>6.2f}x{flag}")
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
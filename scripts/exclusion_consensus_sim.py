@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Offline simulator for ExclusionManager's consensus exclusion set.
+
+Given each validator's sfExclusionList (a snapshot) and, optionally,
+signed exclusion lists that some or all validators adopt, this predicts
+which addresses a node would treat as excluded, exactly as
+ExclusionManager does:
+
+    - an address's vote count is the number of validators listing it
+    - only validators with a non-empty list count toward the total
+    - threshold = max(1, ceil(total * minCONSENSUS_PCT / 100))
+    - an address is excluded when its count reaches the threshold
+
+Votes are held as a bit-packed validators x addresses matrix (one bit per
+vote, NumPy uint8 rows). Validators that carry the same list share a row
+and are counted through a per-row weight, so 100+ validators adopting the
+same multi-million-address list cost one row. Counts are column sums
+computed in blocks, and a sweep over what-if UNL sizes reuses one
+histogram of counts, so every extra size is O(1).
+
+Snapshot input (--snapshot) is either the output of the exclusion_info RPC
+(with or without its "result" wrapper) or a plain object mapping each
+validator account to its list of addresses. Signed lists (--list) are read
+as RemoteExclusionListFetcher reads them (see parse_as_node), and their
+union is what --adopt and --validators hand to validators; check their
+signatures first with `sign_exclusion_list.py verify`.
+
+The sweep (--unl-sizes) keeps the votes fixed and changes how many
+validators count toward the threshold: sizes above the snapshot add
+validators whose lists exclude none of these addresses. For sizes below
+it, --subsets K also draws K random subsets of that many validators and
+reports the min / median / max excluded count.
+
+Usage:
+    python3 scripts/exclusion_consensus_sim.py --snapshot exclusion_info.json
+    python3 scripts/exclusion_consensus_sim.py --snapshot exclusion_info.json \\
+        --list signed.json --adopt rValidator1,rValidator2 --unl-sizes 20:60:5
+    python3 scripts/exclusion_consensus_sim.py --list signed.json --validators 35 \\
+        --unl-sizes 35,40,52 --json report.json --excluded-out excluded.txt
+
+Prerequisites:
+    pip3 install -r scripts/requirements.txt
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from sign_exclusion_list import parse_as_node
+
+# ConsensusParms::minCONSENSUS_PCT
+MIN_CONSENSUS_PCT = 67
+
+# Packed bytes (8 addresses each) unpacked per counting pass
+COLUMN_CHUNK = 1 << 16
+
+
+def consensus_threshold(total):
+    """ExclusionManager::getConsensusThreshold() for a scalar or array of totals."""
+    return np.maximum(1, (np.asarray(total) * MIN_CONSENSUS_PCT + 99) // 100)
+
+
+def unique_inverse(strings: np.ndarray):
+    """
+    Like np.unique(strings, return_inverse=True) for byte strings, but the
+    unique strings come back in no particular order. Each string is keyed
+    by a 64-bit mix of its 8-byte words and one integer argsort groups
+    equal keys; if two different strings share a key, all words are
+    lexsorted instead. Several times faster than sorting the strings.
+    """
+    width = max(8, -(-strings.dtype.itemsize // 8) * 8)
+    words = strings.astype(f"S{width}").view("<u8").reshape(len(strings), -1)
+    key = words[:, 0].copy()
+    for j in range(1, words.shape[1]):
+        key *= np.uint64(0x9E3779B97F4A7C15)
+        key ^= words[:, j]
+    key ^= key >> np.uint64(31)
+
+    order = np.argsort(key)
+    ordered = words[order]
+    changed = (ordered[1:] != ordered[:-1]).any(axis=1)
+    sorted_key = key[order]
+    if np.any(changed & (sorted_key[1:] == sorted_key[:-1])):
+        order = np.lexsort(words.T[::-1])
+        ordered = words[order]
+        changed = (ordered[1:] != ordered[:-1]).any(axis=1)
+
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = changed
+    inverse = np.empty(len(order), dtype=np.intp)
+    inverse[order] = np.cumsum(first) - 1
+    return strings[order[first]], inverse
+
+
+class VoteMatrix:
+    """Bit-packed votes: one row per distinct list, one column per address."""
+
+    def __init__(self, lists: Dict[str, Sequence[str]]):
+        self.validators = list(lists)
+        rows: Dict[bytes, int] = {}
+        row_lists: List[np.ndarray] = []
+        row_of = []
+        shared: Dict[int, int] = {}
+        for addresses in lists.values():
+            # Adopted lists are one object; lists published by one source
+            # arrive in the same order, so an order-sensitive digest will do
+            if id(addresses) not in shared:
+                key = hashlib.sha256("\n".join(addresses).encode()).digest()
+                if key not in rows:
+                    rows[key] = len(row_lists)
+                    row_lists.append(np.array(addresses, dtype="S"))
+                shared[id(addresses)] = rows[key]
+            row_of.append(shared[id(addresses)])
+        self.row_of = np.array(row_of, dtype=np.intp)
+
+        if row_lists and any(len(row) for row in row_lists):
+            self.addresses, inverse = unique_inverse(np.concatenate(row_lists))
+        else:
+            self.addresses, inverse = np.empty(0, dtype="S1"), np.empty(0, dtype=np.intp)
+
+        size = len(self.addresses)
+        self.bits = np.zeros((len(row_lists), (size + 7) // 8), dtype=np.uint8)
+        row_sizes = np.zeros(len(row_lists), dtype=np.intp)
+        offset = 0
+        for r, row in enumerate(row_lists):
+            votes = np.zeros(size, dtype=bool)
+            votes[inverse[offset:offset + len(row)]] = True
+            self.bits[r] = np.packbits(votes)
+            row_sizes[r] = np.count_nonzero(votes)
+            offset += len(row)
+
+        # Validators with an empty list are not counted by ExclusionManager
+        self.counting = row_sizes[self.row_of] > 0
+
+    def counts(self, selected: Optional[np.ndarray] = None) -> np.ndarray:
+        """Vote count per address over all validators, or only the `selected` ones."""
+        row_of = self.row_of if selected is None else self.row_of[selected]
+        weights = np.bincount(row_of, minlength=len(self.bits)).astype(np.uint32)
+        used = np.nonzero(weights)[0]
+        weights = weights[used]
+
+        size = len(self.addresses)
+        counts = np.zeros(size, dtype=np.uint32)
+        for start in range(0, self.bits.shape[1], COLUMN_CHUNK):
+            block = np.unpackbits(self.bits[used, start:start + COLUMN_CHUNK], axis=1)
+            first = start * 8
+            last = min(first + block.shape[1], size)
+            counts[first:last] = (weights @ block)[:last - first]
+        return counts
+
+
+def load_snapshot(path: str) -> Dict[str, List[str]]:
+    """Per-validator lists from exclusion_info output or a plain {account: [address]} map."""
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get("result"), dict):
+        data = data["result"]
+    if isinstance(data, dict) and isinstance(data.get("validators"), dict):
+        data = {
+            account: info.get("exclusion_list", []) if isinstance(info, dict) else []
+            for account, info in data["validators"].items()
+        }
+    if not isinstance(data, dict) or not all(isinstance(v, list) for v in data.values()):
+        raise ValueError(f"{path}: expected exclusion_info output or {{account: [address, ...]}}")
+    return {account: [str(address) for address in addresses] for account, addresses in data.items()}
+
+
+def load_signed_lists(paths: Sequence[str]) -> List[str]:
+    """Union of the addresses nodes take from the signed lists, in sorted order."""
+    combined = set()
+    for path in paths:
+        with open(path) as f:
+            _, entries, dropped = parse_as_node(json.load(f))
+        if dropped:
+            print(f"{path}: {dropped} invalid addresses dropped, as nodes drop them", file=sys.stderr)
+        combined.update(address for address, _, _ in entries)
+    return sorted(combined)
+
+
+def parse_sizes(value: str) -> List[int]:
+    """"35", "20,35,50" or "START:STOP[:STEP]" (STOP inclusive), mixed freely."""
+    sizes = set()
+    try:
+        for part in value.split(","):
+            if ":" in part:
+                start, stop, *step = (int(x) for x in part.split(":"))
+                sizes.update(range(start, stop + 1, step[0] if step else 1))
+            elif part.strip():
+                sizes.add(int(part))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list: {value!r}")
+    if not sizes or min(sizes) < 1:
+        raise argparse.ArgumentTypeError("UNL sizes must be positive")
+    return sorted(sizes)
+
+
+def sweep(
+    matrix: VoteMatrix,
+    counts: np.ndarray,
+    sizes: Sequence[int],
+    subsets: int,
+    rng: np.random.Generator,
+) -> List[dict]:
+    """Excluded-address counts for each what-if number of counting validators."""
+    # at_least[t] = addresses with at least t votes
+    histogram = np.bincount(counts, minlength=1)
+    at_least = np.append(np.cumsum(histogram[::-1])[::-1], 0)
+    counting = np.nonzero(matrix.counting)[0]
+
+    results = []
+    for size in sizes:
+        threshold = int(consensus_threshold(size))
+        row = {
+            "unl_size": size,
+            "threshold": threshold,
+            "excluded": int(at_least[min(threshold, len(at_least) - 1)]),
+        }
+        if subsets and size < len(counting):
+            excluded = []
+            for _ in range(subsets):
+                chosen = rng.choice(counting, size=size, replace=False)
+                excluded.append(int(np.count_nonzero(matrix.counts(chosen) >= threshold)))
+            row["subsets"] = {
+                "trials": subsets,
+                "min": min(excluded),
+                "median": float(np.median(excluded)),
+                "max": max(excluded),
+            }
+        results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Predict ExclusionManager's consensus exclusions offline")
+    parser.add_argument("--snapshot", help="exclusion_info output or {account: [address, ...]} JSON")
+    parser.add_argument("--list", action="append", default=[], metavar="FILE",
+                        help="Signed exclusion list; repeat for several sources (their union is adopted)")
+    parser.add_argument("--adopt", metavar="ACCOUNTS",
+                        help="'all' or comma-separated snapshot validators whose list becomes the signed lists' union")
+    parser.add_argument("--validators", type=int, default=0, metavar="N",
+                        help="Add N simulated validators carrying the signed lists' union")
+    parser.add_argument("--unl-sizes", type=parse_sizes, metavar="SIZES",
+                        help="What-if counting-validator totals, e.g. 20,35 or 20:60:5")
+    parser.add_argument("--subsets", type=int, default=0, metavar="K",
+                        help="Also sample K random validator subsets for sizes below the snapshot")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --subsets (default: 0)")
+    parser.add_argument("--json", metavar="FILE", help="Write the report as JSON")
+    parser.add_argument("--excluded-out", metavar="FILE", help="Write the excluded addresses, one per line")
+    args = parser.parse_args()
+
+    if (args.adopt or args.validators) and not args.list:
+        parser.error("--adopt and --validators need at least one --list")
+    if not args.snapshot and not args.validators:
+        parser.error("give --snapshot, or --list with --validators N")
+
+    started = time.perf_counter()
+    lists = load_snapshot(args.snapshot) if args.snapshot else {}
+    combined = load_signed_lists(args.list) if args.list else []
+
+    if args.adopt:
+        adopters = list(lists) if args.adopt == "all" else [a.strip() for a in args.adopt.split(",") if a.strip()]
+        unknown = [a for a in adopters if a not in lists]
+        if unknown:
+            parser.error(f"--adopt: not in the snapshot: {', '.join(unknown)}")
+        for account in adopters:
+            lists[account] = combined
+    for i in range(args.validators):
+        lists[f"simulated-{i + 1}"] = combined
+    loaded = time.perf_counter()
+
+    matrix = VoteMatrix(lists)
+    counts = matrix.counts()
+    total = int(np.count_nonzero(matrix.counting))
+    threshold = int(consensus_threshold(total))
+    excluded = counts >= threshold if total else np.zeros(len(counts), dtype=bool)
+    computed = time.perf_counter()
+
+    report = {
+        "validators": len(matrix.validators),
+        "counting_validators": total,
+        "distinct_lists": len(matrix.bits),
+        "addresses": len(matrix.addresses),
+        "threshold": threshold,
+        "excluded": int(np.count_nonzero(excluded)),
+        "one_vote_short": int(np.count_nonzero(counts == threshold - 1)) if total else 0,
+        "vote_histogram": {str(n): int(c) for n, c in enumerate(np.bincount(counts)) if n and c},
+    }
+    if args.unl_sizes:
+        report["sweep"] = sweep(matrix, counts, args.unl_sizes, args.subsets, np.random.default_rng(args.seed))
+    report["timings_s"] = {
+        "load": loaded - started,
+        "matrix": computed - loaded,
+        "sweep": time.perf_counter() - computed,
+    }
+
+    print(f"Validators:          {report['validators']} ({total} with a non-empty list, "
+          f"{report['distinct_lists']} distinct lists)")
+    print(f"Addresses:           {report['addresses']}")
+    print(f"Threshold:           {threshold}/{total} ({MIN_CONSENSUS_PCT}%)")
+    print(f"Excluded:            {report['excluded']}")
+    print(f"One vote short:      {report['one_vote_short']}")
+    for row in report.get("sweep", []):
+        line = f"  UNL {row['unl_size']:>5}: threshold {row['threshold']:>5}, excluded {row['excluded']}"
+        if "subsets" in row:
+            s = row["subsets"]
+            line += f" (subsets: min {s['min']}, median {s['median']:g}, max {s['max']})"
+        print(line)
+    timings = report["timings_s"]
+    print(f"Time:                load {timings['load']:.2f}s, matrix {timings['matrix']:.2f}s, "
+          f"sweep {timings['sweep']:.2f}s", file=sys.stderr)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.excluded_out:
+        with open(args.excluded_out, "wb") as f:
+            f.writelines(address + b"\n" for address in np.sort(matrix.addresses[excluded]))
+
+
+if __name__ == "__main__":
+    main()
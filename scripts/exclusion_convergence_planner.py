@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Convergence-time planner for ValidatorExclusionManager's rate limiting.
+
+Given the validators' current on-ledger exclusion lists and the list they
+are configured to converge on, this replays what each node's
+ValidatorExclusionManager will put into its validations:
+
+    - the change queue is built as updatePendingChanges builds it: every
+      add (target minus on-ledger), then every remove (on-ledger minus
+      target); within each group the order is a hash-set walk, so it is
+      shuffled per validator and per trial
+    - one change leaves every CHANGE_INTERVAL (10) ledgers
+    - legacy mode (--batch-bytes 0) sends one change per validation; an add
+      to a list already holding maxExclusionListSize (100) entries is
+      dropped by the ValidatorVote and not retried until the target changes
+    - batch mode sends as many entries as fit in the byte budget, pairing a
+      remove from the back of the queue with an add only when the list is
+      full, as getExclusionBatch does (requires PF_ExclusionBatch)
+
+From the per-validator timelines it reports how many ledgers (and, at
+--close-time seconds per ledger, how long) each validator needs, and how
+long until the target addresses reach ExclusionManager's consensus
+threshold (67% of validators with a non-empty list).
+
+Current lists (--snapshot) are exclusion_info output or a plain
+{account: [address, ...]} map, as for exclusion_consensus_sim.py. The
+target is the union of the signed lists (--list, read as
+RemoteExclusionListFetcher reads them) and the [validator_exclusions]
+section of --config. --validators N adds N validators that start with
+an empty list.
+
+Usage:
+    python3 scripts/exclusion_convergence_planner.py --snapshot exclusion_info.json --list signed.json
+    python3 scripts/exclusion_convergence_planner.py --list signed.json --validators 35 \\
+        --batch-bytes 512 --trials 20 --json plan.json
+    python3 scripts/exclusion_convergence_planner.py --snapshot exclusion_info.json \\
+        --config postfiatd.cfg --queue-for rValidator1 --queue-out queue.jsonl
+
+Prerequisites:
+    pip3 install -r scripts/requirements.txt
+"""
+
+import argparse
+import collections
+import json
+import random
+import statistics
+import sys
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from exclusion_consensus_sim import consensus_threshold, load_signed_lists, load_snapshot
+
+# ValidatorExclusionManager::CHANGE_INTERVAL
+CHANGE_INTERVAL = 10
+# maxExclusionListSize in Protocol.h
+MAX_LIST_SIZE = 100
+# ValidatorExclusionManager::BATCH_ENTRY_BYTES / BATCH_ARRAY_BYTES
+BATCH_ENTRY_BYTES = 25
+BATCH_ARRAY_BYTES = 3
+# Range accepted for [validator_exclusions_batch_bytes]
+MIN_BATCH_BYTES = 64
+MAX_BATCH_BYTES = 4096
+
+# (adds, removes) sent in one validation
+Step = Tuple[List[str], List[str]]
+
+
+def load_config_exclusions(path: str) -> List[str]:
+    """Addresses in the [validator_exclusions] section of a postfiatd config."""
+    addresses = []
+    section = None
+    with open(path) as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                section = line[1:-1].strip()
+            elif section == "validator_exclusions":
+                addresses.append(line)
+    return addresses
+
+
+def build_queue(current: Set[str], target: Set[str], rng: Optional[random.Random]) -> collections.deque:
+    """updatePendingChanges: (is_add, address) for every add, then every remove."""
+    adds = sorted(target - current)
+    removes = sorted(current - target)
+    if rng is not None:
+        rng.shuffle(adds)
+        rng.shuffle(removes)
+    return collections.deque([(True, a) for a in adds] + [(False, r) for r in removes])
+
+
+def legacy_steps(queue: collections.deque, size: int) -> List[Step]:
+    """getExclusionChange: one change per validation; Change.cpp drops adds to a full list."""
+    steps = []
+    while queue:
+        is_add, address = queue.popleft()
+        if is_add:
+            if size < MAX_LIST_SIZE:
+                size += 1
+                steps.append(([address], []))
+            else:
+                steps.append(([], []))
+        else:
+            size = max(size - 1, 0)
+            steps.append(([], [address]))
+    return steps
+
+
+def batch_steps(queue: collections.deque, size: int, max_bytes: int) -> List[Step]:
+    """getExclusionBatch: as many entries as fit, freeing slots only when the list is full."""
+    overhead = 2 * BATCH_ARRAY_BYTES
+    max_entries = (max_bytes - overhead) // BATCH_ENTRY_BYTES if max_bytes > overhead else 0
+    steps = []
+    while queue:
+        adds, removes = [], []
+        while len(adds) + len(removes) < max_entries and queue:
+            is_add, address = queue[0]
+            if not is_add:
+                removes.append(address)
+                queue.popleft()
+                size = max(size - 1, 0)
+                continue
+            if size >= MAX_LIST_SIZE:
+                if queue[-1][0] or len(adds) + len(removes) + 2 > max_entries:
+                    break
+                removes.append(queue.pop()[1])
+                size -= 1
+            adds.append(address)
+            queue.popleft()
+            size += 1
+        if not adds and not removes:
+            # Full list and only adds left: the node waits for the target to change
+            break
+        steps.append((adds, removes))
+    return steps
+
+
+def plan_validator(current: Set[str], target: Set[str], batch_bytes: int,
+                   rng: Optional[random.Random]) -> List[Step]:
+    queue = build_queue(current, target, rng)
+    if batch_bytes:
+        return batch_steps(queue, len(current), batch_bytes)
+    return legacy_steps(queue, len(current))
+
+
+def network_convergence(
+    lists: Dict[str, Set[str]],
+    plans: Dict[str, List[Step]],
+    target: Set[str],
+) -> Dict[str, object]:
+    """
+    Replay every validator's steps in lock-step and return, for the target
+    addresses, the step at which each first reaches the consensus threshold.
+    """
+    counts = collections.Counter()
+    for addresses in lists.values():
+        counts.update(addresses)
+    sizes = {v: len(addresses) for v, addresses in lists.items()}
+    counting = sum(1 for n in sizes.values() if n)
+
+    reached: Dict[str, int] = {}
+
+    def check(addresses, step):
+        threshold = consensus_threshold(counting) if counting else None
+        if threshold is None:
+            return
+        for address in addresses:
+            if address not in reached and address in target and counts[address] >= threshold:
+                reached[address] = step
+
+    check(target, 0)
+    horizon = max((len(steps) for steps in plans.values()), default=0)
+    for step in range(horizon):
+        touched = set()
+        before = counting
+        for validator, steps in plans.items():
+            if step >= len(steps):
+                continue
+            adds, removes = steps[step]
+            was_empty = sizes[validator] == 0
+            for address in removes:
+                counts[address] -= 1
+            for address in adds:
+                counts[address] += 1
+            sizes[validator] += len(adds) - len(removes)
+            counting += int(was_empty and sizes[validator] > 0) - int(not was_empty and sizes[validator] == 0)
+            touched.update(adds)
+        # A smaller total lowers the threshold for addresses nobody touched
+        check(target if counting != before else touched, step + 1)
+
+    threshold = consensus_threshold(counting) if counting else 0
+    return {
+        "reached": reached,
+        "final_counting": counting,
+        "final_threshold": int(threshold),
+        "final_excluded_targets": sum(1 for a in target if counting and counts[a] >= threshold),
+    }
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    return {"min": min(values), "median": statistics.median(values), "max": max(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan how long validators take to converge on an exclusion list")
+    parser.add_argument("--snapshot", help="Current lists: exclusion_info output or {account: [address, ...]} JSON")
+    parser.add_argument("--list", action="append", default=[], metavar="FILE",
+                        help="Signed exclusion list the validators fetch; repeat for several sources")
+    parser.add_argument("--config", metavar="FILE", help="postfiatd config whose [validator_exclusions] joins the target")
+    parser.add_argument("--validators", type=int, default=0, metavar="N",
+                        help="Add N validators that start with an empty on-ledger list")
+    parser.add_argument("--batch-bytes", type=int, default=0, metavar="BYTES",
+                        help="[validator_exclusions_batch_bytes]; 0 (default) plans one change per validation")
+    parser.add_argument("--interval", type=int, default=CHANGE_INTERVAL, metavar="LEDGERS",
+                        help=f"Ledgers between changes (default: {CHANGE_INTERVAL})")
+    parser.add_argument("--close-time", type=float, default=3.5, metavar="SECONDS",
+                        help="Average ledger close time (default: 3.5)")
+    parser.add_argument("--trials", type=int, default=1, metavar="K",
+                        help="Queue orders to sample; the node's order is a hash-set walk (default: 1, sorted order)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --trials (default: 0)")
+    parser.add_argument("--queue-for", metavar="ACCOUNT", help="Validator whose planned validations --queue-out writes")
+    parser.add_argument("--queue-out", metavar="FILE", help="Write one JSON line per validation carrying changes")
+    parser.add_argument("--json", metavar="FILE", help="Write the report as JSON")
+    args = parser.parse_args()
+
+    if args.batch_bytes and not MIN_BATCH_BYTES <= args.batch_bytes <= MAX_BATCH_BYTES:
+        parser.error(f"--batch-bytes must be 0 or {MIN_BATCH_BYTES}..{MAX_BATCH_BYTES}")
+    if args.interval < 1 or args.trials < 1:
+        parser.error("--interval and --trials must be positive")
+    if not args.list and not args.config:
+        parser.error("give the target with --list and/or --config")
+
+    current = {v: set(addresses) for v, addresses in (load_snapshot(args.snapshot) if args.snapshot else {}).items()}
+    for i in range(args.validators):
+        current[f"simulated-{i + 1}"] = set()
+    if not current:
+        parser.error("give --snapshot and/or --validators N")
+    target = set(load_signed_lists(args.list)) if args.list else set()
+    if args.config:
+        target.update(load_config_exclusions(args.config))
+
+    queue_for = args.queue_for or next(iter(current))
+    if queue_for not in current:
+        parser.error(f"--queue-for: unknown validator {queue_for}")
+
+    ledgers_per_step = args.interval
+    rng = random.Random(args.seed)
+    trials = []
+    example = None
+    for trial in range(args.trials):
+        plans = {v: plan_validator(addresses, target, args.batch_bytes, rng if args.trials > 1 else None)
+                 for v, addresses in current.items()}
+        if example is None:
+            example = plans[queue_for]
+        network = network_convergence(current, plans, target)
+        reached = network["reached"]
+        trials.append({
+            "steps": {v: len(steps) for v, steps in plans.items()},
+            "landed": {v: len(current[v] & target) + sum(len(adds) for adds, _ in steps)
+                       for v, steps in plans.items()},
+            "excluded_targets": len(reached),
+            "all_excluded_step": max(reached.values()) if len(reached) == len(target) and target else None,
+            "final_threshold": network["final_threshold"],
+            "final_counting": network["final_counting"],
+        })
+
+    def ledgers(steps):
+        # The first change goes out at once, then one every interval
+        return max(steps - 1, 0) * ledgers_per_step
+
+    slowest = [ledgers(max(t["steps"].values())) for t in trials]
+    all_excluded = [t["all_excluded_step"] for t in trials]
+    report = {
+        "mode": "batch" if args.batch_bytes else "legacy",
+        "batch_bytes": args.batch_bytes,
+        "entries_per_validation": ((args.batch_bytes - 2 * BATCH_ARRAY_BYTES) // BATCH_ENTRY_BYTES
+                                   if args.batch_bytes else 1),
+        "validators": len(current),
+        "target": len(target),
+        "max_list_size": MAX_LIST_SIZE,
+        "trials": args.trials,
+        "slowest_validator_ledgers": summarize(slowest),
+        "slowest_validator_seconds": summarize([n * args.close_time for n in slowest]),
+        "landed_per_validator": summarize([min(t["landed"].values()) for t in trials]),
+        "excluded_targets": summarize([t["excluded_targets"] for t in trials]),
+        "final_threshold": trials[0]["final_threshold"],
+        "final_counting": trials[0]["final_counting"],
+    }
+    if all(step is not None for step in all_excluded):
+        report["all_targets_excluded_ledgers"] = summarize([ledgers(step) for step in all_excluded])
+        report["all_targets_excluded_seconds"] = summarize(
+            [ledgers(step) * args.close_time for step in all_excluded])
+
+    print(f"Mode:                {report['mode']} ({report['entries_per_validation']} entries per validation, "
+          f"one every {args.interval} ledgers)")
+    print(f"Validators:          {report['validators']}")
+    print(f"Target addresses:    {report['target']} (on-ledger lists hold at most {MAX_LIST_SIZE})")
+    s = report["slowest_validator_ledgers"]
+    print(f"Slowest validator:   {s['median']:g} ledgers, ~{s['median'] * args.close_time / 60:.1f} min "
+          f"(min {s['min']:g}, max {s['max']:g} over {args.trials} trial(s))")
+    print(f"Landed per list:     {report['landed_per_validator']['min']:g} (fewest on any validator)")
+    print(f"Excluded targets:    {report['excluded_targets']['median']:g}/{len(target)} at threshold "
+          f"{report['final_threshold']}/{report['final_counting']}")
+    if "all_targets_excluded_ledgers" in report:
+        s = report["all_targets_excluded_ledgers"]
+        print(f"All targets excluded after {s['median']:g} ledgers, "
+              f"~{s['median'] * args.close_time / 60:.1f} min")
+    else:
+        print("Not every target address reaches the threshold: lists are capped at "
+              f"{MAX_LIST_SIZE} entries" + ("" if args.batch_bytes else " and legacy adds to a full list are dropped"))
+
+    if args.queue_out:
+        with open(args.queue_out, "w") as f:
+            for i, (adds, removes) in enumerate(example):
+                if adds or removes:
+                    f.write(json.dumps({"ledger_offset": i * ledgers_per_step, "adds": adds,
+                                        "removes": removes}) + "\n")
+        print(f"Wrote {len(example)} planned validations for {queue_for} to {args.queue_out}", file=sys.stderr)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
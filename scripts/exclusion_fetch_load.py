@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Load driver for exclusion-list fetching across many sources.
+
+Starts exclusion_source_server.py in a child process, serving one signed
+list (as written by sign_exclusion_list.py, with its .etag sidecar and
+precompressed siblings) as N virtual sources, and for each N in --sizes
+measures how long one fetch round takes to complete and the CPU it costs.
+
+By default the fetcher is emulated in-process, the way
+RemoteExclusionListFetcher runs a round: every source is requested at
+once with the node's Accept-Encoding and conditional headers, the body is
+decoded, parsed and its signature verified per source, and the round is
+complete when every source has succeeded or failed. A cold round (no cache)
+is followed by --warm-rounds conditional rounds, answered with 304 unless
+ETags are disabled. Each size is repeated --repeats times with a fresh
+cache. Client CPU is this process's CPU time; server CPU is read from the
+server's /_stats endpoint.
+
+With --node-cmd the real node is measured instead: for each size a copy
+of --base-config with N [validator_exclusions_sources] entries is written,
+the command is started with {config} replaced by its path, and the round
+is complete when every source has been answered (or, with --node-log, when
+the node logs the outcome of the round). Node CPU is read from
+/proc/<pid>/stat between the first request and completion, so this mode
+needs Linux.
+
+The server's fault options (--latency, --error-rate, --truncate-rate, ...,
+--fault K:SPEC) are passed through, so the same run shows how latency,
+errors and retries to the full list change completion time, and which
+rounds the all-sources-accessible check would reject.
+
+Usage:
+    python3 scripts/exclusion_fetch_load.py www/exclusions.json --sizes 1,10,25,50,100
+    python3 scripts/exclusion_fetch_load.py www/exclusions.json --sizes 1:100:10 \\
+        --latency 40 --jitter 20 --error-rate 0.02 --json load.json
+    python3 scripts/exclusion_fetch_load.py www/exclusions.json --sizes 1,50,100 \\
+        --node-cmd "build/postfiatd --conf {config} --standalone" \\
+        --base-config cfg/postfiatd-example.cfg --node-log /var/log/postfiatd/debug.log
+
+Prerequisites:
+    pip3 install -r scripts/requirements.txt
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import multiprocessing
+import os
+import re
+import shlex
+import statistics
+import subprocess
+import tempfile
+import time
+import urllib.request
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from exclusion_source_server import SOURCE_PREFIX, STATS_PATH, Faults, SourceServer, parse_overrides
+from sign_exclusion_list import (
+    NODE_PUBLIC_SIZE,
+    NODE_PUBLIC_TYPE,
+    decode_base58_token,
+    rebuild_signing_message,
+    verify_message_signature,
+)
+
+try:
+    import lz4.frame
+except ImportError:  # lz4 is only advertised when it can be decoded
+    lz4 = None
+
+# RemoteExclusionListFetcher's acceptEncoding
+ACCEPT_ENCODING = "gzip, deflate, lz4" if lz4 else "gzip, deflate"
+
+# Log lines onAllFetchesComplete writes for a finished round
+ROUND_DONE = re.compile(r"RemoteExclusionListFetcher: (All sources accessible|Only \d+/\d+ sources"
+                        r"|Initial fetch failed)")
+
+
+def parse_sizes(value: str) -> List[int]:
+    """"10", "1,10,100" or "START:STOP[:STEP]" (STOP inclusive), mixed freely."""
+    sizes = set()
+    try:
+        for part in value.split(","):
+            if ":" in part:
+                start, stop, *step = (int(x) for x in part.split(":"))
+                sizes.update(range(start, stop + 1, step[0] if step else 1))
+            elif part.strip():
+                sizes.add(int(part))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list: {value!r}")
+    if not sizes or min(sizes) < 1:
+        raise argparse.ArgumentTypeError("source counts must be positive")
+    return sorted(sizes)
+
+
+def run_server(root: str, sources: int, faults: Faults, overrides: Dict[int, Faults],
+               seed: Optional[int], ports):
+    """Child process: serve `root` on an ephemeral port and report the port."""
+    async def serve():
+        server = SourceServer(root, verbose=False, sources=sources, faults=faults,
+                              overrides=overrides, seed=seed)
+        listener = await server.start("127.0.0.1", 0)
+        ports.send(listener.sockets[0].getsockname()[1])
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def server_stats(base: str) -> dict:
+    with urllib.request.urlopen(base + STATS_PATH, timeout=10) as response:
+        return json.load(response)
+
+
+def source_key(path: str) -> str:
+    """The public key an operator configures for a source publishing `path`."""
+    with open(path) as f:
+        return json.load(f)["signature"]["public_key"]
+
+
+def decode_body(coding: str, body: bytes) -> bytes:
+    """RemoteExclusionListFetcher's decodeBody for the codings it advertises."""
+    coding = coding.strip().lower()
+    if coding in ("", "identity"):
+        return body
+    if coding == "gzip":
+        return gzip.decompress(body)
+    if coding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -15)  # raw deflate, as many servers send
+    if coding == "lz4" and lz4:
+        return lz4.frame.decompress(body)
+    raise ValueError(f"unsupported Content-Encoding '{coding}'")
+
+
+def verify_list(body: bytes, public_key: str) -> None:
+    """parseExclusionList + verifySignature; raises ValueError when the node would reject it."""
+    data = json.loads(body)
+    message, _, _ = rebuild_signing_message(data)
+    signature = data.get("signature") if isinstance(data, dict) else None
+    if not isinstance(signature, dict) or signature.get("public_key") != public_key:
+        raise ValueError("public key mismatch")
+    key, _ = decode_base58_token(public_key, NODE_PUBLIC_TYPE, NODE_PUBLIC_SIZE)
+    if key is None:
+        raise ValueError("invalid public key format")
+    reason = verify_message_signature(str(signature.get("algorithm")), message,
+                                      str(signature.get("signature")), key)
+    if reason:
+        raise ValueError(reason)
+
+
+async def http_get(host: str, port: int, path: str, headers: Dict[str, str],
+                   timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+    """One HTTP/1.1 GET on a fresh connection, as detail::WorkPlain makes it."""
+    async def exchange():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            lines = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}", "Connection: close"]
+            lines += [f"{name}: {value}" for name, value in headers.items()]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            await writer.drain()
+            status_line = (await reader.readline()).decode("latin-1").split()
+            if len(status_line) < 2:
+                raise ConnectionError("connection closed before a response")
+            response_headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1")
+                if line in ("\r\n", "\n", ""):
+                    break
+                name, _, value = line.partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+            length = int(response_headers.get("content-length", 0))
+            body = await reader.readexactly(length) if length else b""
+            return int(status_line[1]), response_headers, body
+        finally:
+            writer.close()
+
+    return await asyncio.wait_for(exchange(), timeout)
+
+
+class EmulatedFetcher:
+    """RemoteExclusionListFetcher's fetch round, over plain HTTP."""
+
+    def __init__(self, host: str, port: int, paths: List[str], keys: List[str], timeout: float):
+        self.host = host
+        self.port = port
+        self.paths = paths
+        self.keys = keys
+        self.timeout = timeout
+        # path -> (ETag, Last-Modified) of the cached, verified list
+        self.validators: Dict[str, Tuple[str, str]] = {}
+        self.initial_fetch_complete = False
+
+    async def fetch_one(self, index: int) -> Tuple[bool, str]:
+        path = self.paths[index]
+        headers = {"Accept-Encoding": ACCEPT_ENCODING}
+        cached = self.validators.get(path)
+        if cached:
+            etag, last_modified = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        try:
+            status, response_headers, body = await http_get(self.host, self.port, path, headers, self.timeout)
+        except asyncio.IncompleteReadError:
+            return False, "truncated"
+        except asyncio.TimeoutError:
+            return False, "timeout"
+        except (ConnectionError, OSError) as e:
+            return False, type(e).__name__
+        if status == 304 and cached:
+            return True, "304"
+        if status != 200:
+            return False, f"HTTP {status}"
+        try:
+            verify_list(decode_body(response_headers.get("content-encoding", ""), body), self.keys[index])
+        except (ValueError, OSError, EOFError, zlib.error):
+            self.validators.pop(path, None)
+            return False, "parse/verify"
+        self.validators[path] = (response_headers.get("etag", ""), response_headers.get("last-modified", ""))
+        return True, "200"
+
+    async def fetch_round(self) -> dict:
+        results = await asyncio.gather(*(self.fetch_one(i) for i in range(len(self.paths))))
+        successes = sum(1 for ok, _ in results if ok)
+        all_ok = successes == len(results)
+        # onAllFetchesComplete: exclusions are used only when every source
+        # answered, or after the initial fetch with at least one success
+        if all_ok:
+            outcome = "accessible"
+        elif self.initial_fetch_complete and successes:
+            outcome = "partial"
+        else:
+            outcome = "rejected"
+        self.initial_fetch_complete = True
+        outcomes: Dict[str, int] = {}
+        for _, what in results:
+            outcomes[what] = outcomes.get(what, 0) + 1
+        return {"outcome": outcome, "successes": successes, "results": outcomes}
+
+
+def measure_emulated(base: str, port: int, paths: List[str], keys: List[str],
+                     warm_rounds: int, timeout: float) -> List[dict]:
+    """One cold round and `warm_rounds` conditional rounds with a fresh cache."""
+    fetcher = EmulatedFetcher("127.0.0.1", port, paths, keys, timeout)
+    rounds = []
+    for i in range(1 + warm_rounds):
+        server_before = server_stats(base)["cpu_s"]
+        cpu_before = time.process_time()
+        started = time.perf_counter()
+        result = asyncio.run(fetcher.fetch_round())
+        result["wall_s"] = time.perf_counter() - started
+        result["client_cpu_s"] = time.process_time() - cpu_before
+        result["server_cpu_s"] = server_stats(base)["cpu_s"] - server_before
+        result["kind"] = "cold" if i == 0 else "warm"
+        rounds.append(result)
+    return rounds
+
+
+def process_cpu(pid: int) -> float:
+    """utime + stime of a process in seconds, from /proc/<pid>/stat."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def node_config(base_config: str, urls: List[Tuple[str, str]], interval: int) -> str:
+    """`base_config` with its exclusion source and interval sections replaced."""
+    replaced = {"validator_exclusions_sources", "validator_exclusions_interval"}
+    lines = []
+    skipping = False
+    with open(base_config) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("[") and stripped.endswith("]"):
+                skipping = stripped[1:-1].strip() in replaced
+            if not skipping:
+                lines.append(line.rstrip("\n"))
+    lines += ["", "[validator_exclusions_sources]"] + [f"{url}|{key}" for url, key in urls]
+    lines += ["", "[validator_exclusions_interval]", str(interval), ""]
+    return "\n".join(lines)
+
+
+def measure_node(args, base: str, urls: List[Tuple[str, str]], workdir: str) -> dict:
+    """Start the node with N sources and time its initial fetch round."""
+    config_path = os.path.join(workdir, f"postfiatd-{len(urls)}.cfg")
+    with open(config_path, "w") as f:
+        f.write(node_config(args.base_config, urls, args.interval))
+    log_offset = os.path.getsize(args.node_log) if args.node_log and os.path.exists(args.node_log) else 0
+    before = server_stats(base)
+    seen = {k: sum(v.values()) for k, v in before.get("sources", {}).items()}
+
+    node = subprocess.Popen(shlex.split(args.node_cmd.format(config=config_path)),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + args.node_timeout
+        first = cpu_first = None
+        outcome = "timeout"
+        while time.monotonic() < deadline and node.poll() is None:
+            stats = server_stats(base)
+            sources = stats.get("sources", {})
+            fresh = {k: sum(v.values()) - seen.get(k, 0) for k, v in sources.items()}
+            if first is None and any(fresh.values()):
+                first, cpu_first = time.perf_counter(), process_cpu(node.pid)
+            if first is not None:
+                if args.node_log:
+                    with open(args.node_log, errors="replace") as f:
+                        f.seek(log_offset)
+                        match = ROUND_DONE.search(f.read())
+                    if match:
+                        outcome = match.group(1).split()[0].lower()
+                        break
+                elif sum(1 for i in range(len(urls)) if fresh.get(str(i), 0) > 0) == len(urls):
+                    outcome = "answered"
+                    break
+            time.sleep(0.01)
+        result = {"outcome": outcome, "kind": "node"}
+        if first is not None:
+            result["wall_s"] = time.perf_counter() - first
+            result["node_cpu_s"] = process_cpu(node.pid) - cpu_first if node.poll() is None else None
+        if node.poll() is not None and outcome == "timeout":
+            result["outcome"] = f"exited {node.returncode}"
+        result["server_cpu_s"] = server_stats(base)["cpu_s"] - before["cpu_s"]
+        return result
+    finally:
+        node.terminate()
+        try:
+            node.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            node.kill()
+
+
+def summarize(rounds: List[dict], kind: str) -> Optional[dict]:
+    picked = [r for r in rounds if r["kind"] == kind and "wall_s" in r]
+    if not picked:
+        return None
+    summary = {"rounds": len(picked)}
+    for field in ("wall_s", "client_cpu_s", "node_cpu_s", "server_cpu_s"):
+        values = [r[field] for r in picked if r.get(field) is not None]
+        if values:
+            summary[field] = {"median": statistics.median(values), "max": max(values)}
+    outcomes: Dict[str, int] = {}
+    for r in picked:
+        outcomes[r["outcome"]] = outcomes.get(r["outcome"], 0) + 1
+    summary["outcomes"] = outcomes
+    responses: Dict[str, int] = {}
+    for r in picked:
+        for what, count in r.get("results", {}).items():
+            responses[what] = responses.get(what, 0) + count
+    if responses:
+        summary["responses"] = responses
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure exclusion-list fetch rounds as the source count grows")
+    parser.add_argument("list", help="Signed list written by sign_exclusion_list.py; its directory is served")
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("1,10,25,50,100"), metavar="SIZES",
+                        help="Source counts, e.g. 1,10,100 or 1:100:10 (default: 1,10,25,50,100)")
+    parser.add_argument("--repeats", type=int, default=3, help="Fresh-cache repetitions per size (default: 3)")
+    parser.add_argument("--warm-rounds", type=int, default=1,
+                        help="Conditional rounds after each cold round (default: 1)")
+    parser.add_argument("--timeout", type=float, default=30.0, metavar="SECONDS",
+                        help="Per-request timeout of the emulated fetcher (default: 30)")
+    faults = parser.add_argument_group("fault injection (see exclusion_source_server.py)")
+    faults.add_argument("--latency", type=float, default=0.0, metavar="MS")
+    faults.add_argument("--jitter", type=float, default=0.0, metavar="MS")
+    faults.add_argument("--reset-rate", type=float, default=0.0, metavar="P")
+    faults.add_argument("--error-rate", type=float, default=0.0, metavar="P")
+    faults.add_argument("--error-status", type=int, default=503)
+    faults.add_argument("--truncate-rate", type=float, default=0.0, metavar="P")
+    faults.add_argument("--corrupt-rate", type=float, default=0.0, metavar="P")
+    faults.add_argument("--no-etag", action="store_true")
+    faults.add_argument("--no-compress", action="store_true")
+    faults.add_argument("--fault", action="append", default=[], metavar="K:SPEC")
+    faults.add_argument("--seed", type=int, default=0, help="Seed for the fault draws (default: 0)")
+    node = parser.add_argument_group("real node")
+    node.add_argument("--node-cmd", metavar="CMD", help="Command starting postfiatd; {config} is the generated config")
+    node.add_argument("--base-config", metavar="FILE", help="Config the generated ones are copied from")
+    node.add_argument("--node-log", metavar="FILE", help="Node debug log; completion is the round's outcome line")
+    node.add_argument("--node-timeout", type=float, default=120.0, metavar="SECONDS",
+                      help="Give up on a node run after this long (default: 120)")
+    node.add_argument("--interval", type=int, default=3600, metavar="SECONDS",
+                      help="[validator_exclusions_interval] for the node, so only one round runs (default: 3600)")
+    parser.add_argument("--json", metavar="FILE", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    if args.node_cmd and not args.base_config:
+        parser.error("--node-cmd needs --base-config")
+    if args.node_cmd and "{config}" not in args.node_cmd:
+        parser.error("--node-cmd must contain {config}")
+    if args.repeats < 1 or args.warm_rounds < 0:
+        parser.error("--repeats must be positive and --warm-rounds not negative")
+    try:
+        base_faults = Faults(
+            latency=args.latency, jitter=args.jitter, reset_rate=args.reset_rate,
+            error_rate=args.error_rate, error_status=args.error_status,
+            truncate_rate=args.truncate_rate, corrupt_rate=args.corrupt_rate,
+            etag=not args.no_etag, compress=not args.no_compress,
+        )
+        overrides = parse_overrides(args.fault, base_faults)
+    except ValueError as e:
+        parser.error(str(e))
+
+    root = os.path.dirname(os.path.abspath(args.list))
+    name = os.path.basename(args.list)
+    sources = max(args.sizes)
+    # A source publishes <root>/<k>/<name> when present, else the shared list
+    keys = []
+    for i in range(sources):
+        own = os.path.join(root, str(i), name)
+        keys.append(source_key(own if os.path.isfile(own) else args.list))
+
+    receive, send = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(
+        target=run_server, args=(root, sources, base_faults, overrides, args.seed, send), daemon=True)
+    server.start()
+    port = receive.recv()
+    base = f"http://127.0.0.1:{port}"
+    paths = [f"{SOURCE_PREFIX}{i}/{name}" for i in range(sources)]
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            for size in args.sizes:
+                rounds = []
+                for _ in range(args.repeats):
+                    if args.node_cmd:
+                        urls = [(base + path, key) for path, key in zip(paths[:size], keys)]
+                        rounds.append(measure_node(args, base, urls, workdir))
+                    else:
+                        rounds += measure_emulated(base, port, paths[:size], keys[:size],
+                                                   args.warm_rounds, args.timeout)
+                entry = {"sources": size}
+                for kind in ("cold", "warm", "node"):
+                    summary = summarize(rounds, kind)
+                    if summary:
+                        entry[kind] = summary
+                results.append(entry)
+
+                line = f"{size:>4} sources:"
+                for kind in ("cold", "warm", "node"):
+                    s = entry.get(kind)
+                    if not s or "wall_s" not in s:
+                        continue
+                    cpu = s.get("client_cpu_s") or s.get("node_cpu_s")
+                    line += f"  {kind} {s['wall_s']['median'] * 1000:8.1f} ms"
+                    if cpu:
+                        line += f" ({cpu['median'] * 1000:.1f} ms CPU)"
+                    line += " " + ",".join(f"{k}={v}" for k, v in sorted(s["outcomes"].items()))
+                print(line)
+    finally:
+        server.terminate()
+        server.join()
+
+    if args.json:
+        report = {
+            "list": args.list,
+            "list_bytes": os.path.getsize(args.list),
+            "accept_encoding": ACCEPT_ENCODING,
+            "mode": "node" if args.node_cmd else "emulated",
+            "faults": vars(base_faults),
+            "overrides": {str(k): vars(v) for k, v in overrides.items()},
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
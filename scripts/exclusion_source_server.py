@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Local HTTP stand-in for exclusion-list sources.
+
+Serves a directory of files written by sign_exclusion_list.py the way a
+static host configured for conditional requests would, so
+RemoteExclusionListFetcher can be pointed at it instead of real HTTPS hosts:
+
+    - ETag is taken from the <file>.etag sidecar (or the file's SHA-256)
+    - Last-Modified is the file's mtime
+    - If-None-Match / If-Modified-Since answer 304 Not Modified
+    - precompressed siblings (<file>.gz, .zst, .lz4) are served with
+      Content-Encoding when the client's Accept-Encoding allows them
+    - everything else is 200, 404 or 405
+
+Every request is logged with its status so a test can assert which polls
+were served from the node's cache.
+
+With --sources N the same directory is also served as N virtual sources,
+/source/0/<file> ... /source/N-1/<file>; a source serves <root>/<k>/<file>
+when that exists, so sources can publish different lists. Each source has
+a fault profile (see Faults) for exercising the fetcher's all-sources-
+accessible and partial-update paths: added latency, error responses,
+connections reset before a response, bodies truncated below their
+Content-Length, corrupted bodies, and ETags or compression turned off.
+--fault K:SPEC overrides the profile of source K (or a range K-L).
+
+GET /_stats returns per-source counters and the server's CPU time as JSON;
+exclusion_fetch_load.py reads it.
+
+Usage:
+    python3 scripts/sign_exclusion_list.py --secret-key ... --input in.json --output www/exclusions.json
+    python3 scripts/exclusion_source_server.py www --port 8080
+
+    [validator_exclusions_sources]
+    http://127.0.0.1:8080/exclusions.json|nH...
+
+    python3 scripts/exclusion_source_server.py www --sources 20 --latency 50 --jitter 20 \
+        --fault 3:error_rate=1 --fault 10-12:truncate_rate=0.5,etag=0
+"""
+
+import argparse
+import asyncio
+import email.utils
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Sibling suffix for each content coding, in order of preference
+ENCODINGS = [("zstd", ".zst"), ("gzip", ".gz"), ("lz4", ".lz4")]
+
+_REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    429: "Too Many Requests", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable",
+}
+
+# Path prefix of the virtual sources and the statistics endpoint
+SOURCE_PREFIX = "/source/"
+STATS_PATH = "/_stats"
+
+
+def file_etag(path: str) -> str:
+    """The ETag a file is served with: its .etag sidecar, else a quoted SHA-256."""
+    try:
+        with open(path + ".etag") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        pass
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return f'"{digest.hexdigest()}"'
+
+
+def not_modified(headers: Dict[str, str], etag: str, mtime: float) -> bool:
+    """RFC 9110 evaluation: If-None-Match wins over If-Modified-Since."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison, as required for If-None-Match
+        return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(mtime) <= since
+    return False
+
+
+def accepted_encodings(header: Optional[str]) -> set:
+    """Codings listed in Accept-Encoding without q=0."""
+    accepted = set()
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip().lower()
+        try:
+            refused = q.startswith("q=") and float(q[2:] or 0) == 0
+        except ValueError:
+            refused = False
+        if coding and not refused:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class Faults:
+    """
+    Fault profile of one source. Rates are per-request probabilities,
+    drawn in order: reset, error, then (for a 200) truncate and corrupt.
+    """
+
+    # name -> parser, for --fault specs
+    FIELDS = {
+        "latency": float,  # milliseconds added before answering
+        "jitter": float,  # up to this many more milliseconds, uniformly
+        "reset_rate": float,  # close the connection without a response
+        "error_rate": float,  # answer error_status instead
+        "error_status": int,
+        "truncate_rate": float,  # send half the body, then close
+        "corrupt_rate": float,  # flip one byte in the middle of the body
+        "etag": lambda v: v.lower() not in ("0", "false", "no", "off"),  # send ETag / Last-Modified
+        "compress": lambda v: v.lower() not in ("0", "false", "no", "off"),  # serve precompressed siblings
+    }
+
+    def __init__(self, **values):
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.reset_rate = 0.0
+        self.error_rate = 0.0
+        self.error_status = 503
+        self.truncate_rate = 0.0
+        self.corrupt_rate = 0.0
+        self.etag = True
+        self.compress = True
+        for name, value in values.items():
+            if name not in self.FIELDS:
+                raise ValueError(f"unknown fault '{name}'")
+            setattr(self, name, value)
+        if self.error_status not in _REASONS or self.error_status < 400:
+            raise ValueError(f"unsupported error_status {self.error_status}")
+
+    def with_spec(self, spec: str) -> "Faults":
+        """A copy with "name=value,..." applied."""
+        values = dict(vars(self))
+        for item in spec.split(","):
+            name, sep, value = item.partition("=")
+            name = name.strip()
+            if not sep or name not in self.FIELDS:
+                raise ValueError(f"bad fault '{item}' (choose from {', '.join(self.FIELDS)})")
+            values[name] = self.FIELDS[name](value.strip())
+        return Faults(**values)
+
+    def delay(self, rng: random.Random) -> float:
+        return (self.latency + rng.uniform(0, self.jitter)) / 1000 if self.latency or self.jitter else 0.0
+
+
+class SourceServer:
+    """Serve files under `root` with conditional-request support."""
+
+    def __init__(self, root: str, verbose: bool = True, sources: int = 0,
+                 faults: Optional[Faults] = None, overrides: Optional[Dict[int, Faults]] = None,
+                 seed: Optional[int] = None):
+        self.root = os.path.realpath(root)
+        self.verbose = verbose
+        self.requests = 0
+        self.not_modified = 0
+        self.sources = sources
+        self.faults = faults or Faults()
+        self.overrides = overrides or {}
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def split_source(self, target: str) -> Tuple[Optional[int], str]:
+        """(source index or None, path within the source) for a request target."""
+        path = target.split("?", 1)[0]
+        if self.sources and path.startswith(SOURCE_PREFIX):
+            index, _, rest = path[len(SOURCE_PREFIX):].partition("/")
+            if index.isdigit() and int(index) < self.sources:
+                return int(index), rest
+            return -1, rest
+        return None, path
+
+    def faults_for(self, source: Optional[int]) -> Faults:
+        return self.overrides.get(source, self.faults)
+
+    def resolve(self, target: str, source: Optional[int] = None) -> Optional[str]:
+        candidates = [target.split("?", 1)[0].lstrip("/")]
+        if source is not None:
+            candidates.insert(0, os.path.join(str(source), candidates[0]))
+        for candidate in candidates:
+            path = os.path.realpath(os.path.join(self.root, candidate))
+            if os.path.commonpath([path, self.root]) == self.root and os.path.isfile(path):
+                return path
+        return None
+
+    def count(self, source: Optional[int], event: str):
+        counters = self.stats.setdefault("-" if source is None else str(source), {})
+        counters[event] = counters.get(event, 0) + 1
+
+    def stats_body(self) -> bytes:
+        cpu = os.times()
+        return json.dumps({
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "cpu_s": cpu.user + cpu.system,
+            "sources": self.stats,
+        }).encode()
+
+    def respond(self, method: str, target: str, headers: Dict[str, str],
+                source: Optional[int] = None) -> Tuple[int, Dict[str, str], bytes]:
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b""
+        if source == -1:
+            return 404, {}, b""
+        faults = self.faults_for(source)
+        path = self.resolve(target, source)
+        if path is None:
+            return 404, {}, b""
+        validators = {"Vary": "Accept-Encoding"}
+        accepted = accepted_encodings(headers.get("accept-encoding")) if faults.compress else set()
+        for coding, suffix in ENCODINGS:
+            if coding in accepted and os.path.isfile(path + suffix):
+                path += suffix
+                validators["Content-Encoding"] = coding
+                break
+        if faults.etag:
+            etag = file_etag(path)
+            mtime = os.path.getmtime(path)
+            validators.update({"ETag": etag, "Last-Modified": email.utils.formatdate(mtime, usegmt=True)})
+            if not_modified(headers, etag, mtime):
+                self.not_modified += 1
+                return 304, validators, b""
+        with open(path, "rb") as f:
+            body = f.read()
+        validators["Content-Type"] = "application/json"
+        return 200, validators, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode("latin-1").strip()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1")
+                if line in ("\r\n", "\n", ""):
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            parts = request_line.split()
+            source = None
+            fault = None
+            if len(parts) != 3:
+                status, extra, body = 400, {}, b""
+                method, target = "-", "-"
+            elif parts[0] == "GET" and parts[1].split("?", 1)[0] == STATS_PATH:
+                method, target, _ = parts
+                status, extra, body = 200, {"Content-Type": "application/json"}, self.stats_body()
+            else:
+                method, target, _ = parts
+                source, path = self.split_source(target)
+                faults = self.faults_for(source)
+                delay = faults.delay(self.rng)
+                if delay:
+                    await asyncio.sleep(delay)
+                if self.rng.random() < faults.reset_rate:
+                    self.requests += 1
+                    self.count(source, "reset")
+                    if self.verbose:
+                        print(f"{method} {target} reset", file=sys.stderr)
+                    return
+                if self.rng.random() < faults.error_rate:
+                    status, extra, body = faults.error_status, {}, b""
+                    fault = "injected"
+                else:
+                    status, extra, body = self.respond(method, path, headers, source)
+                if status == 200 and body and self.rng.random() < faults.truncate_rate:
+                    fault = "truncated"
+                elif status == 200 and body and self.rng.random() < faults.corrupt_rate:
+                    middle = len(body) // 2
+                    body = body[:middle] + bytes([body[middle] ^ 0xFF]) + body[middle + 1:]
+                    fault = "corrupted"
+            self.requests += 1
+            self.count(source, f"{status} {fault}" if fault else str(status))
+
+            head = [f"HTTP/1.1 {status} {_REASONS[status]}"]
+            head += [f"{name}: {value}" for name, value in extra.items()]
+            head += [f"Content-Length: {len(body)}", "Connection: close", "", ""]
+            writer.write("\r\n".join(head).encode("latin-1"))
+            if method != "HEAD":
+                # A truncated body still announces its full length
+                writer.write(body[:len(body) // 2] if fault == "truncated" else body)
+            await writer.drain()
+            if self.verbose:
+                print(f"{method} {target} {status} {len(body)}{f' ({fault})' if fault else ''}", file=sys.stderr)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        # Every source is polled at once, so allow a deep accept queue
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        address = server.sockets[0].getsockname()
+        print(f"Serving {self.root} on http://{address[0]}:{address[1]}/"
+              + (f" and {SOURCE_PREFIX}0..{self.sources - 1}/" if self.sources else ""), file=sys.stderr)
+        return server
+
+    async def serve(self, host: str, port: int):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def parse_overrides(specs: List[str], base: Faults) -> Dict[int, Faults]:
+    """--fault K:SPEC or K-L:SPEC, applied over `base` in order."""
+    overrides: Dict[int, Faults] = {}
+    for spec in specs:
+        which, sep, rest = spec.partition(":")
+        first, _, last = which.partition("-")
+        if not sep or not first.isdigit() or (last and not last.isdigit()):
+            raise ValueError(f"bad --fault '{spec}' (expected K:name=value,... or K-L:...)")
+        for index in range(int(first), int(last or first) + 1):
+            overrides[index] = overrides.get(index, base).with_spec(rest)
+    return overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve signed exclusion lists with ETag / 304 support")
+    parser.add_argument("root", help="Directory holding signed lists and their .etag sidecars")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to bind (default: 8080)")
+    parser.add_argument("--quiet", action="store_true", help="Do not log requests")
+    parser.add_argument("--sources", type=int, default=0, metavar="N",
+                        help=f"Also serve the directory as N virtual sources under {SOURCE_PREFIX}K/")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS", help="Delay every answer by MS")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="MS", help="Plus up to MS more, uniformly")
+    parser.add_argument("--reset-rate", type=float, default=0.0, metavar="P",
+                        help="Close the connection without answering with probability P")
+    parser.add_argument("--error-rate", type=float, default=0.0, metavar="P",
+                        help="Answer --error-status with probability P")
+    parser.add_argument("--error-status", type=int, default=503, help="Injected error status (default: 503)")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, metavar="P",
+                        help="Send only half of a 200 body with probability P")
+    parser.add_argument("--corrupt-rate", type=float, default=0.0, metavar="P",
+                        help="Flip a byte in a 200 body with probability P")
+    parser.add_argument("--no-etag", action="store_true", help="Send no ETag / Last-Modified and never 304")
+    parser.add_argument("--no-compress", action="store_true", help="Ignore Accept-Encoding")
+    parser.add_argument("--fault", action="append", default=[], metavar="K:SPEC",
+                        help="Per-source override, e.g. 3:error_rate=1 or 10-12:latency=500,etag=0")
+    parser.add_argument("--seed", type=int, help="Seed for the fault draws")
+    args = parser.parse_args()
+
+    try:
+        faults = Faults(
+            latency=args.latency, jitter=args.jitter, reset_rate=args.reset_rate,
+            error_rate=args.error_rate, error_status=args.error_status,
+            truncate_rate=args.truncate_rate, corrupt_rate=args.corrupt_rate,
+            etag=not args.no_etag, compress=not args.no_compress,
+        )
+        overrides = parse_overrides(args.fault, faults)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = SourceServer(args.root, verbose=not args.quiet, sources=args.sources,
+                          faults=faults, overrides=overrides, seed=args.seed)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,9 @@ Architecture:
         4. Hex-encode the DER signature
 
 Prerequisites:
-    pip3 install ecdsa
+    pip3 install -r scripts/requirements.txt
+    (or coincurve / a shared build of external/secp256k1 for native-speed
+    signing; see scripts/secp256k1_backend.py)
 
 Usage:
     1. Create a config file (see example below)
@@ -52,6 +54,25 @@ Config file format:
     - expiration: date (YYYY-MM-DD) when this VL expires (nodes reject expired VLs)
     - validator_tokens: tokens from each validator (generated with 'validator-keys create_token')
 
+Schedule mode (v2 only):
+    Instead of sequence/expiration, a config may list up to 5 future
+    epochs (ValidatorList::maxSupportedBlobs). All of them are emitted in
+    one VL as separate blobs_v2 entries, signed concurrently:
+
+    {
+        "publisher_token": "...",
+        "validator_tokens": [...],
+        "schedule": [
+            {"sequence": 10, "expiration": "2027-06-08"},
+            {"sequence": 11, "effective": "2027-06-01", "expiration": "2027-06-15",
+             "validator_tokens": [...]}
+        ]
+    }
+
+    - each epoch may carry its own validator_tokens (defaults to the top-level list)
+    - sequences and effective dates must be strictly increasing; nodes drop
+      a pending blob when a later one becomes effective at the same time
+
 Generating keys:
     Publisher key pair (one-time, store securely):
         validator-keys create_keys --keyfile publisher-keys.json
@@ -64,28 +85,129 @@ Generating keys:
     The master public key from publisher-keys.json (converted to hex with
     scripts/base58_to_hex.py) goes into [validator_list_keys] in validators-*.txt.
 
+Incremental updates:
+    Re-publish an existing VL with a new validator set without rebuilding
+    or re-signing the blobs that are still valid:
+        python3 scripts/generate_vl.py config.json --update testnet_vl.json -o testnet_vl.json
+
+    Expired and superseded blobs are dropped; a new blob is appended (with
+    the config's sequence, effective and expiration) only if the validator
+    set or dates changed.
+
+Reproducible output:
+    Signing is deterministic (RFC 6979 nonces for secp256k1; Ed25519 is
+    deterministic by design), so the same config always yields the same
+    bytes. Signatures can be cached on disk by blob and publisher manifest
+    (opt-in with --cache-dir; entries are verified before use), and an
+    output file that already holds the same bytes is not rewritten, so CDN
+    ETags stay stable between rounds.
+
+Token files:
+    Validator tokens can also be read from files (the output of
+    'validator-keys create_token', one token per file) instead of being
+    pasted into validator_tokens:
+        python3 scripts/generate_vl.py config.json --tokens-dir onboarding/ \
+            --tokens 'validators/*/token.txt'
+
+    Files are decoded and verified in a process pool (--workers). Tokens
+    are deduplicated by master public key, keeping the highest manifest
+    sequence; unreadable or invalid files are reported and skipped.
+
+Timings and profiling:
+    Every stage (token decode, manifest parse/verify, blob build, hash,
+    sign, write) is timed with negligible overhead; --timings-json writes
+    wall time, calls and bytes per stage, and --profile additionally runs
+    under cProfile (see scripts/stage_timings.py):
+        python3 scripts/generate_vl.py config.json --timings-json timings.json
+        python3 scripts/generate_vl.py config.json --profile vl.pstats
+
 Verification:
     Use --decode to inspect an existing VL without generating anything:
         python3 scripts/generate_vl.py --decode testnet_vl.json
+
+    Large files and archives can be decoded with bounded memory (see
+    scripts/vl_stream.py), either as one summary line per file or as one
+    JSON line per validator:
+        python3 scripts/generate_vl.py --decode --summary archive/*.json
+        python3 scripts/generate_vl.py --decode --jsonl archive/*.json
+
+    Use --verify to run the node's acceptance checks (ValidatorList::verify)
+    offline. The result is printed as JSON and the exit status is non-zero
+    unless every blob would be accepted or is pending:
+        python3 scripts/generate_vl.py --verify testnet_vl.json \
+            [--publisher-key ED...] [--current-sequence 41]
+
+Library use:
+    Long-lived services (e.g. the dynamic-UNL scoring service) can import
+    this module and keep a VLBuilder around instead of running the script
+    per round. The publisher token is decoded once; builds happen in memory
+    and errors are raised as VLError subclasses instead of exiting:
+
+        from generate_vl import VLBuilder
+
+        builder = VLBuilder(publisher_token)
+        vl, vl_bytes = builder.build(
+            validators=[manifest_b64, ...],
+            sequence=42,
+            expiration="2027-06-01",
+        )
 """
 
 import argparse
 import base64
+import functools
+import glob
 import hashlib
 import json
+import os
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
-
-try:
-    from ecdsa import SigningKey, SECP256k1, util as ecdsa_util
-except ImportError:
-    sys.exit(
-        "Missing dependency: 'ecdsa' package is required.\n"
-        "Install with: pip3 install ecdsa"
-    )
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from secp256k1_backend import get_backend
+from stage_timings import StageTimer, profiled
+from vl_stream import VLStreamError, iter_vl_records, summarize
+from xrpl_manifest import (
+    ManifestParseError,
+    manifest_problem,
+    parse_manifest_bytes,
+    public_key_type,
+    verify_signature,
+)
 
 RIPPLE_EPOCH = 946684800  # Jan 1, 2000 00:00:00 UTC
 
+# ValidatorList::maxSupportedBlobs: nodes treat larger v2 collections as malformed
+MAX_SUPPORTED_BLOBS = 5
+
+
+# Per-stage wall time and bytes for this process (see stage_timings.py);
+# cheap enough to always run, reported with --timings-json / --profile.
+timings = StageTimer()
+
+
+class VLError(Exception):
+    """Base class for all errors raised while building or decoding a VL."""
+
+
+class ConfigError(VLError):
+    """The generation config (or builder arguments) is missing or invalid."""
+
+
+class TokenError(VLError):
+    """A publisher or validator token could not be decoded."""
+
+
+class ManifestError(VLError):
+    """A serialized manifest is malformed or lacks a required field."""
+
+
+class SigningError(VLError):
+    """The blob could not be signed with the publisher's signing key."""
+
 
 def sha512_half(data: bytes) -> bytes:
     """XRPL SHA-512-Half: first 32 bytes of SHA-512."""
@@ -94,11 +216,14 @@ def sha512_half(data: bytes) -> bytes:
 
 def to_ripple_epoch(date_str: str) -> int:
     """Convert YYYY-MM-DD to XRPL epoch (seconds since Jan 1, 2000 UTC)."""
-    dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError as e:
+        raise ConfigError(f"invalid date '{date_str}': {e}") from e
     unix_ts = int(dt.timestamp())
     ripple_ts = unix_ts - RIPPLE_EPOCH
     if ripple_ts <= 0:
-        sys.exit(f"Error: expiration date {date_str} is before the XRPL epoch (2000-01-01)")
+        raise ConfigError(f"expiration date {date_str} is before the XRPL epoch (2000-01-01)")
     return ripple_ts
 
 
@@ -119,96 +244,73 @@ def clean_token(token_str: str) -> str:
 
 def decode_token(token_str: str) -> dict:
     """Decode a validator token (base64 JSON with manifest + signing key)."""
-    cleaned = clean_token(token_str)
-    try:
-        return json.loads(base64.b64decode(cleaned))
-    except Exception as e:
-        sys.exit(f"Error decoding token: {e}\nToken starts with: {cleaned[:40]}...")
+    with timings.stage("token_decode", len(token_str)):
+        cleaned = clean_token(token_str)
+        try:
+            return json.loads(base64.b64decode(cleaned))
+        except Exception as e:
+            raise TokenError(
+                f"could not decode token: {e}\nToken starts with: {cleaned[:40]}..."
+            ) from e
 
 
-def parse_manifest(manifest_b64: str) -> dict:
+def parse_manifest(manifest_b64: str, verify: bool = False) -> dict:
     """
     Parse an XRPL manifest (serialized STObject binary) to extract:
         - master_public_key: hex 33-byte Ed25519 master key (sfPublicKey)
         - signing_public_key: hex 33-byte ephemeral key (sfSigningPubKey)
         - signing_key_type: 'ed25519' or 'secp256k1'
+        - sequence: manifest sequence (sfSequence)
+        - domain: validator domain (sfDomain), when present
+
+    The wire format is handled by xrpl_manifest.py; use its Manifest
+    records directly when the raw fields, offsets or signatures are needed.
 
-    XRPL STObject wire format:
-        Each field starts with a type/field identifier byte:
-            high nibble = type code, low nibble = field code
-            if either is 0, the next byte(s) contain the extended code
-        Field types used in manifests:
-            2 = uint32 (4 bytes, big-endian)
-            7 = blob (variable-length: 1-byte length if < 193, else 2-byte)
+    With verify=True the master and ephemeral signatures are checked the
+    way the node's Manifest code does (results are LRU-cached by hash).
     """
-    data = base64.b64decode(manifest_b64)
-    result = {}
-    i = 0
-
-    while i < len(data):
-        byte = data[i]
-        i += 1
-
-        type_code = (byte >> 4) & 0x0F
-        field_code = byte & 0x0F
-
-        if type_code == 0:
-            if i >= len(data):
-                break
-            type_code = data[i]
-            i += 1
-        if field_code == 0:
-            if i >= len(data):
-                break
-            field_code = data[i]
-            i += 1
-
-        if type_code == 1:  # uint16
-            i += 2
-        elif type_code == 2:  # uint32
-            i += 4
-        elif type_code == 7:  # blob (variable length)
-            if i >= len(data):
-                break
-            length = data[i]
-            i += 1
-            if length > 192:
-                if i >= len(data):
-                    break
-                length = 193 + ((length - 193) * 256) + data[i]
-                i += 1
-
-            blob = data[i : i + length]
-
-            if field_code == 1:  # sfPublicKey (master public key)
-                result["master_public_key"] = blob.hex().upper()
-            elif field_code == 3:  # sfSigningPubKey (ephemeral signing key)
-                result["signing_public_key"] = blob.hex().upper()
-                if blob[0] == 0xED:
-                    result["signing_key_type"] = "ed25519"
-                elif blob[0] in (0x02, 0x03):
-                    result["signing_key_type"] = "secp256k1"
-                else:
-                    sys.exit(f"Error: unknown key type prefix 0x{blob[0]:02X}")
-
-            i += length
-        else:
-            break
+    with timings.stage("manifest_parse", len(manifest_b64)):
+        try:
+            manifest = parse_manifest_bytes(base64.b64decode(manifest_b64))
+        except (ManifestParseError, ValueError) as e:
+            raise ManifestError(f"malformed manifest: {e}") from e
+
+    if verify:
+        with timings.stage("manifest_verify", manifest.end - manifest.start):
+            reason = manifest_problem(manifest)
+        if reason:
+            raise ManifestError(f"manifest failed verification ({reason})")
+
+    if manifest.signing_public_key is not None and manifest.signing_key_type is None:
+        raise ManifestError(
+            f"unknown key type prefix 0x{manifest.signing_public_key[0]:02X}"
+        )
 
+    result = manifest.to_dict()
     if "master_public_key" not in result:
-        sys.exit("Error: could not extract master public key from manifest")
+        raise ManifestError("could not extract master public key from manifest")
 
     return result
 
 
-def sign_secp256k1(secret_key_hex: str, data: bytes) -> str:
+def sign_secp256k1(secret_key_hex: str, data: bytes, digest: Optional[bytes] = None) -> str:
     """
     Sign data with secp256k1 ECDSA using XRPL's SHA-512-Half digest.
     Returns hex-encoded DER signature with canonical low-S value.
+
+    The fastest available backend is used (see secp256k1_backend.py).
+    A precomputed SHA-512-Half `digest` of `data` skips hashing it again.
     """
-    digest = sha512_half(data)
-    sk = SigningKey.from_string(bytes.fromhex(secret_key_hex), curve=SECP256k1)
-    sig = sk.sign_digest(digest, sigencode=ecdsa_util.sigencode_der_canonize)
+    try:
+        backend = get_backend()
+    except ImportError as e:
+        raise SigningError(f"Missing secp256k1 backend: {e}") from e
+    if digest is None:
+        digest = sha512_half(data)
+    try:
+        sig = backend.sign_digest(bytes.fromhex(secret_key_hex), digest)
+    except ValueError as e:
+        raise SigningError(f"secp256k1 signing failed: {e}") from e
     return sig.hex().upper()
 
 
@@ -219,23 +321,31 @@ def sign_ed25519(secret_key_hex: str, data: bytes) -> str:
     """
     try:
         import nacl.signing
-    except ImportError:
-        sys.exit(
+    except ImportError as e:
+        raise SigningError(
             "Missing dependency: 'PyNaCl' package is required for Ed25519 signing.\n"
             "Install with: pip3 install pynacl"
-        )
+        ) from e
     sk = nacl.signing.SigningKey(bytes.fromhex(secret_key_hex))
-    return sk.sign(data).signature.hex().upper()
+    return sk.sign(bytes(data)).signature.hex().upper()
 
 
-def sign_blob(data: bytes, secret_key_hex: str, key_type: str) -> str:
-    """Sign raw blob bytes using the appropriate algorithm for the key type."""
+def sign_blob(
+    data: bytes,
+    secret_key_hex: str,
+    key_type: str,
+    digest: Optional[bytes] = None,
+) -> str:
+    """
+    Sign raw blob bytes using the appropriate algorithm for the key type.
+    `digest` is an optional precomputed SHA-512-Half (used by secp256k1 only).
+    """
     if key_type == "secp256k1":
-        return sign_secp256k1(secret_key_hex, data)
+        return sign_secp256k1(secret_key_hex, data, digest)
     elif key_type == "ed25519":
         return sign_ed25519(secret_key_hex, data)
     else:
-        sys.exit(f"Error: unsupported signing key type '{key_type}'")
+        raise SigningError(f"unsupported signing key type '{key_type}'")
 
 
 def decode_existing_vl(path: str):
@@ -251,15 +361,8 @@ def decode_existing_vl(path: str):
     print(f"Signing key type: {manifest_fields.get('signing_key_type', 'N/A')}")
     print(f"Signing key: {manifest_fields.get('signing_public_key', 'N/A')}")
 
-    blobs = []
-    if "blobs_v2" in vl:
-        blobs = [(b["blob"], b["signature"]) for b in vl["blobs_v2"]]
-    elif "blob" in vl:
-        blobs = [(vl["blob"], vl["signature"])]
-
-    for i, (blob_b64, sig) in enumerate(blobs):
-        blob_json = base64.b64decode(blob_b64).decode("utf-8")
-        blob = json.loads(blob_json)
+    for i, (blob_b64, sig) in enumerate(vl_blobs(vl)):
+        blob = decode_blob(blob_b64)
         print(f"\nBlob {i + 1}:")
         print(f"  Sequence: {blob['sequence']}")
         print(f"  Expiration: {from_ripple_epoch(blob['expiration'])}")
@@ -271,90 +374,1122 @@ def decode_existing_vl(path: str):
             print(f"    {j + 1}. {v['validation_public_key']}")
 
 
-def generate_vl(config_path: str, output_path: str, version: int):
-    """Generate a signed VL JSON file from a config file."""
+def stream_decode(paths: List[str], summary: bool, jsonl: bool):
+    """
+    Decode many VL files with flat memory use.
+
+    --summary prints one line per file, --jsonl one JSON line per validator,
+    and both together one JSON summary line per file.
+    """
+    for path in paths:
+        try:
+            if summary:
+                info = summarize(path)
+                if jsonl:
+                    print(json.dumps(dict(info, file=path), separators=(",", ":")))
+                    continue
+                blobs = ", ".join(
+                    f"seq {b.get('sequence')} ({b['validators']} validators, "
+                    f"expires {from_ripple_epoch(b['expiration']) if 'expiration' in b else '?'})"
+                    for b in info["blobs"]
+                )
+                print(f"{path}: v{info.get('version', '?')} "
+                      f"{info.get('public_key', 'N/A')} [{blobs}]")
+            else:
+                for record in iter_vl_records(path):
+                    if record.pop("type") == "validator":
+                        record["file"] = path
+                        print(json.dumps(record, separators=(",", ":")))
+        except (OSError, VLStreamError) as e:
+            print(f"Error: {path}: {e}", file=sys.stderr)
+
+
+def ripple_now() -> int:
+    """Current time as an XRPL epoch timestamp."""
+    return int(time.time()) - RIPPLE_EPOCH
+
+
+def vl_blobs(vl: dict) -> List[Tuple[str, str]]:
+    """Return (blob_b64, signature) pairs for a v1 or v2 VL document."""
+    if "blobs_v2" in vl:
+        return [(b["blob"], b["signature"]) for b in vl["blobs_v2"]]
+    if "blob" in vl:
+        return [(vl["blob"], vl["signature"])]
+    return []
+
+
+def decode_blob(blob_b64: str) -> dict:
+    """Decode a base64 VL blob into its JSON object."""
+    try:
+        return json.loads(base64.b64decode(blob_b64))
+    except Exception as e:
+        raise VLError(f"could not decode VL blob: {e}") from e
+
+
+# Characters that never need escaping inside a JSON string; hex keys and
+# base64 manifests always match, anything else goes through json.dumps.
+_JSON_SAFE = re.compile(r"[A-Za-z0-9+/=._:-]*")
+
+
+class BlobWriter:
+    """
+    Single-pass canonical writer for the inner VL blob.
+
+    Compact JSON is appended straight into one bytearray in the key order
+    the node expects ({"sequence","expiration"[,"effective"],"validators"}),
+    byte-identical to json.dumps(..., separators=(",", ":")). The bytes are
+    fed to a running SHA-512 in blocks while the buffer grows, so once the
+    last validator is written the digest only needs the tail, and base64
+    is produced from the same buffer without further copies.
+    """
+
+    HASH_BLOCK = 1 << 16
+
+    def __init__(self, sequence: int, expiration: int, effective: Optional[int] = None):
+        self.buf = bytearray(b'{"sequence":%d,"expiration":%d' % (sequence, expiration))
+        if effective is not None:
+            self.buf += b',"effective":%d' % effective
+        self.buf += b',"validators":['
+        self._sha = hashlib.sha512()
+        self._hashed = 0
+        self._count = 0
+        self._closed = False
+
+    @staticmethod
+    def _string(value: str) -> bytes:
+        # Anything that is not a plain string (e.g. from a hand-edited
+        # config) is serialized as json.dumps would have written it
+        if isinstance(value, str) and _JSON_SAFE.fullmatch(value):
+            return b'"' + value.encode("ascii") + b'"'
+        return json.dumps(value).encode("utf-8")
+
+    def add_validator(self, entry: dict):
+        """Append one {"validation_public_key", "manifest"} entry."""
+        if self._count:
+            self.buf += b","
+        self.buf += b'{"validation_public_key":'
+        self.buf += self._string(entry["validation_public_key"])
+        self.buf += b',"manifest":'
+        self.buf += self._string(entry["manifest"])
+        self.buf += b"}"
+        self._count += 1
+
+        if len(self.buf) - self._hashed >= self.HASH_BLOCK:
+            self._hash_tail()
+
+    def finish(self) -> bytearray:
+        """Close the JSON document and return the buffer."""
+        if not self._closed:
+            self.buf += b"]}"
+            self._hash_tail()
+            self._closed = True
+        return self.buf
+
+    def _hash_tail(self):
+        with timings.stage("hash", len(self.buf) - self._hashed):
+            with memoryview(self.buf) as view:
+                self._sha.update(view[self._hashed:])
+        self._hashed = len(self.buf)
+
+    def digest(self) -> bytes:
+        """SHA-512-Half of the finished blob."""
+        self.finish()
+        return self._sha.digest()[:32]
+
+    def base64(self) -> str:
+        return base64.b64encode(self.finish()).decode("ascii")
+
+
+class SignatureCache:
+    """
+    Content-addressed store of blob signatures.
+
+    Entries are keyed by SHA-512-Half over the publisher manifest and the
+    blob's own SHA-512-Half, so a signature is only reused for the exact
+    bytes it was made over with the same signing key. Signing is
+    deterministic (RFC 6979 / Ed25519), so a cached signature is the one a
+    fresh signature would produce and unchanged rounds publish identical
+    bytes. Entries live in memory and, when `directory` is set, as one
+    small file each under it (safe to delete at any time).
+
+    Files on disk are not trusted: an entry read from `directory` is only
+    returned if `check(signature)` accepts it, and is deleted otherwise.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._memory: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    @staticmethod
+    def key(manifest: str, blob_digest: bytes) -> str:
+        return sha512_half(manifest.encode("ascii") + b"\0" + blob_digest).hex()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str, check: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        signature = self._memory.get(key)
+        if signature is None and self.directory:
+            try:
+                with open(self._path(key)) as f:
+                    signature = f.read().strip()
+                bytes.fromhex(signature)
+            except (OSError, ValueError):
+                signature = None
+            if signature and check is not None and not check(signature):
+                # Stale or planted: never publish it, and stop reading it
+                self.rejected += 1
+                signature = None
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            if signature:
+                self._memory[key] = signature
+        if signature:
+            self.hits += 1
+            return signature
+        self.misses += 1
+        return None
+
+    def put(self, key: str, signature: str):
+        self._memory[key] = signature
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(signature)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # the cache is an optimization; never fail a build over it
+
+
+def default_cache_dir() -> str:
+    """$POSTFIAT_VL_CACHE, else the per-user cache directory."""
+    if os.environ.get("POSTFIAT_VL_CACHE"):
+        return os.environ["POSTFIAT_VL_CACHE"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "postfiat", "vl-signatures")
+
+
+def write_output(path: str, data: bytes) -> bool:
+    """
+    Atomically write `data` to `path` unless it already holds exactly
+    these bytes, so unchanged rounds keep the file (and its mtime/ETag)
+    untouched. Returns True if the file was written.
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with timings.stage("write", len(data)):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return True
+
+
+def _ripple_time(value: Union[int, str], label: str) -> int:
+    """Accept either an XRPL epoch timestamp or a YYYY-MM-DD date string."""
+    if isinstance(value, bool):
+        raise ConfigError(f"{label} must be an XRPL epoch integer or YYYY-MM-DD date")
+    if isinstance(value, int):
+        if value <= 0:
+            raise ConfigError(f"{label} {value} is before the XRPL epoch (2000-01-01)")
+        return value
+    if isinstance(value, str):
+        return to_ripple_epoch(value)
+    raise ConfigError(f"{label} must be an XRPL epoch integer or YYYY-MM-DD date")
+
+
+class VLBuilder:
+    """
+    Reusable, in-memory VL builder.
+
+    The publisher token is decoded and its manifest parsed once in the
+    constructor; every subsequent build only serializes, hashes and signs
+    the blob. Nothing is read from or written to disk and nothing is
+    printed. Failures raise VLError subclasses.
+
+    Validators passed to build() may be any mix of:
+        - a manifest as base64 string
+        - a decoded token dict (with a "manifest" key)
+        - a ready VL entry dict ({"validation_public_key", "manifest"})
+
+    Unless verify_manifests is False, the publisher manifest and every new
+    validator manifest must pass the node's signature checks, so a
+    corrupted token fails the build instead of being rejected by nodes.
+    """
+
+    def __init__(
+        self,
+        publisher_token: Union[str, dict],
+        verify_manifests: bool = True,
+        cache: Optional[SignatureCache] = None,
+    ):
+        self.verify_manifests = verify_manifests
+        # Signatures of blobs already signed by this publisher key
+        self.cache = cache if cache is not None else SignatureCache()
+        # manifest -> blob entry, so repeated builds skip manifest parsing
+        self._entries: Dict[str, dict] = {}
+
+        publisher = (
+            publisher_token if isinstance(publisher_token, dict)
+            else decode_token(publisher_token)
+        )
+        try:
+            self.manifest = publisher["manifest"]
+            self._secret = publisher["validation_secret_key"]
+        except (KeyError, TypeError) as e:
+            raise TokenError(f"publisher token is missing field {e}") from e
+
+        self.fields = parse_manifest(self.manifest, verify_manifests)
+        self.key_type = self.fields.get("signing_key_type")
+        if not self.key_type:
+            raise ManifestError(
+                "could not determine signing key type from publisher manifest"
+            )
+
+    @property
+    def public_key(self) -> str:
+        """Publisher master public key (the [validator_list_keys] value)."""
+        return self.fields["master_public_key"]
+
+    def adopt(self, entries: Iterable[dict]):
+        """
+        Seed the manifest cache with entries whose manifests were already
+        parsed and verified elsewhere (e.g. by load_token_files workers).
+        """
+        for entry in entries:
+            self._entries[entry["manifest"]] = {
+                "validation_public_key": entry["validation_public_key"],
+                "manifest": entry["manifest"],
+            }
+
+    def validator_entry(self, validator: Union[str, dict]) -> dict:
+        """Normalize one validator into the {validation_public_key, manifest} blob entry."""
+        if isinstance(validator, str):
+            manifest = validator
+        elif isinstance(validator, dict) and "manifest" in validator:
+            if "validation_public_key" in validator and not self.verify_manifests:
+                return {
+                    "validation_public_key": validator["validation_public_key"],
+                    "manifest": validator["manifest"],
+                }
+            manifest = validator["manifest"]
+        else:
+            raise ConfigError(f"unsupported validator entry: {validator!r:.60}")
+
+        entry = self._entries.get(manifest)
+        if entry is None:
+            fields = parse_manifest(manifest, self.verify_manifests)
+            entry = {
+                "validation_public_key": fields["master_public_key"],
+                "manifest": manifest,
+            }
+            self._entries[manifest] = entry
+        return dict(entry)
+
+    def serialize_blob(
+        self,
+        validators: Iterable[Union[str, dict]],
+        sequence: int,
+        expiration: Union[int, str],
+        effective: Optional[Union[int, str]] = None,
+    ) -> bytearray:
+        """Validate the blob parameters and return the raw (unsigned) blob JSON bytes."""
+        return self.write_blob(validators, sequence, expiration, effective).finish()
+
+    def write_blob(
+        self,
+        validators: Iterable[Union[str, dict]],
+        sequence: int,
+        expiration: Union[int, str],
+        effective: Optional[Union[int, str]] = None,
+    ) -> BlobWriter:
+        """Validate the blob parameters and stream the blob through a BlobWriter."""
+        if not isinstance(sequence, int) or isinstance(sequence, bool) or sequence < 0:
+            raise ConfigError(f"sequence must be a non-negative integer, got {sequence!r}")
+
+        expiration_ts = _ripple_time(expiration, "expiration")
+        now = to_ripple_epoch(datetime.now(timezone.utc).strftime("%Y-%m-%d"))
+        if expiration_ts <= now:
+            raise ConfigError(f"expiration date {expiration} is in the past")
+
+        effective_ts = None
+        if effective is not None:
+            effective_ts = _ripple_time(effective, "effective")
+            if effective_ts >= expiration_ts:
+                raise ConfigError("effective date must be before the expiration date")
+
+        # Compact JSON with no whitespace, in XRPL key order
+        with timings.stage("blob_build"):
+            writer = BlobWriter(sequence, expiration_ts, effective_ts)
+            for v in validators:
+                writer.add_validator(self.validator_entry(v))
+            writer.finish()
+        timings.add_bytes("blob_build", len(writer.buf))
+        return writer
+
+    def build_blob(
+        self,
+        validators: Iterable[Union[str, dict]],
+        sequence: int,
+        expiration: Union[int, str],
+        effective: Optional[Union[int, str]] = None,
+    ) -> dict:
+        """Serialize and sign one blob; returns {"signature", "blob"} as in blobs_v2."""
+        writer = self.write_blob(validators, sequence, expiration, effective)
+
+        # Sign the raw JSON bytes (NOT the base64-encoded version)
+        [signature] = self.sign_blobs([writer.buf], 1, [writer.digest()])
+
+        return {"signature": signature, "blob": writer.base64()}
+
+    def sign_blobs(
+        self,
+        blobs: List[bytes],
+        workers: Optional[int] = None,
+        digests: Optional[List[bytes]] = None,
+    ) -> List[str]:
+        """
+        Sign several raw blobs, concurrently in a process pool when there is
+        more than one. workers=1 forces serial signing in this process.
+        Precomputed SHA-512-Half `digests` are passed through to sign_blob.
+        Blobs found in the signature cache are not signed again.
+        """
+        if digests is None:
+            digests = [None] * len(blobs)
+        if any(d is None for d in digests):
+            with timings.stage("hash", sum(len(b) for b, d in zip(blobs, digests) if d is None)):
+                digests = [d if d is not None else sha512_half(b) for b, d in zip(blobs, digests)]
+        keys = [SignatureCache.key(self.manifest, d) for d in digests]
+        signing_key = bytes.fromhex(self.fields["signing_public_key"])
+
+        def valid_for(blob: bytes) -> Callable[[str], bool]:
+            return lambda sig: verify_signature(signing_key, blob, bytes.fromhex(sig))
+
+        with timings.stage("cache"):
+            signatures = [self.cache.get(k, valid_for(b)) for k, b in zip(keys, blobs)]
+        todo = [i for i, sig in enumerate(signatures) if sig is None]
+        if not todo:
+            return signatures
+
+        if workers is None:
+            workers = min(len(todo), os.cpu_count() or 1)
+        with timings.stage("sign", sum(len(blobs[i]) for i in todo)):
+            if len(todo) <= 1 or workers <= 1:
+                fresh = [
+                    sign_blob(blobs[i], self._secret, self.key_type, digests[i])
+                    for i in todo
+                ]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    fresh = list(pool.map(
+                        sign_blob,
+                        [blobs[i] for i in todo],
+                        [self._secret] * len(todo),
+                        [self.key_type] * len(todo),
+                        [digests[i] for i in todo],
+                    ))
+
+        for i, sig in zip(todo, fresh):
+            signatures[i] = sig
+            self.cache.put(keys[i], sig)
+        return signatures
+
+    def build_schedule(
+        self,
+        epochs: List[dict],
+        workers: Optional[int] = None,
+    ) -> Tuple[dict, bytes]:
+        """
+        Build a v2 VL holding one blob per epoch.
+
+        Each epoch is a dict with "sequence", "expiration", "validators" and
+        an optional "effective". The schedule is checked against the rules
+        ValidatorList applies to pending blobs before anything is signed.
+        """
+        validate_schedule(epochs)
+        writers = [
+            self.write_blob(
+                e["validators"], e["sequence"], e["expiration"], e.get("effective")
+            )
+            for e in epochs
+        ]
+        signatures = self.sign_blobs(
+            [w.buf for w in writers], workers, [w.digest() for w in writers]
+        )
+        blobs = [
+            {"signature": sig, "blob": w.base64()}
+            for sig, w in zip(signatures, writers)
+        ]
+        vl = self.assemble(blobs, 2)
+        return vl, json.dumps(vl, separators=(",", ":")).encode("utf-8")
+
+    def update(
+        self,
+        existing_vl: dict,
+        validators: Iterable[Union[str, dict]],
+        sequence: int,
+        expiration: Union[int, str],
+        effective: Optional[Union[int, str]] = None,
+        workers: Optional[int] = None,
+    ) -> Tuple[dict, bytes, dict]:
+        """
+        Incrementally update a published VL instead of rebuilding it.
+
+        The existing VL is first verified as a node would (publisher
+        manifest and every blob signature); ConfigError is raised if any
+        blob fails. Existing blobs are kept byte-for-byte (signature
+        included) unless the publisher manifest changed, in which case only
+        the kept blobs are re-signed with the new key. Expired blobs, and blobs a node would
+        never use again because a later sequence is effective no later than
+        they are, are dropped. A new blob is appended only when the validator
+        set or its dates differ from the latest kept blob.
+
+        Returns (vl_dict, compact JSON bytes, report). The report lists the
+        "dropped" and "kept" sequences, the "appended" sequence (or None)
+        and how many blobs were "resigned".
+        """
+        existing_key = existing_vl.get("public_key", "").upper()
+        if existing_key and existing_key != self.public_key:
+            raise ConfigError(
+                f"existing VL was published by {existing_key}, not {self.public_key}"
+            )
+
+        now = ripple_now()
+
+        # Only blobs a node would accept from this publisher are kept (and
+        # possibly re-signed); a tampered or corrupted VL is rejected outright
+        check = verify_vl(existing_vl, self.public_key, now=now, workers=workers)
+        rejected = [
+            b for b in check["blobs"]
+            if b["disposition"] not in ("accepted", "pending", "expired")
+        ]
+        if not check["blobs"] or rejected:
+            blob = rejected[0] if rejected else None
+            where = f"blob {blob['index']}: " if blob else ""
+            reason = (blob.get("reason") or blob["disposition"]) if blob else check["reason"]
+            raise ConfigError(f"existing VL failed verification ({where}{reason})")
+
+        current = []
+        dropped = []
+        for blob_b64, signature in vl_blobs(existing_vl):
+            meta = decode_blob(blob_b64)
+            for v in meta["validators"]:
+                self._entries.setdefault(v["manifest"], dict(v))
+            if meta["expiration"] <= now:
+                dropped.append(meta["sequence"])
+                continue
+            current.append({
+                "sequence": meta["sequence"],
+                "effective": meta.get("effective", 0),
+                "expiration": meta["expiration"],
+                "validators": meta["validators"],
+                "blob": blob_b64,
+                "signature": signature,
+            })
+        current.sort(key=lambda b: b["sequence"])
+
+        entries = [self.validator_entry(v) for v in validators]
+        expiration_ts = _ripple_time(expiration, "expiration")
+        effective_ts = _ripple_time(effective, "effective") if effective is not None else 0
+
+        latest = current[-1] if current else None
+        appended = None
+        if (
+            latest is None
+            or latest["validators"] != entries
+            or latest["expiration"] != expiration_ts
+            or latest["effective"] != effective_ts
+        ):
+            if latest is not None and sequence <= latest["sequence"]:
+                raise ConfigError(
+                    f"sequence {sequence} must be above the latest published "
+                    f"sequence {latest['sequence']}"
+                )
+            writer = self.write_blob(entries, sequence, expiration, effective)
+            current.append({
+                "sequence": sequence,
+                "effective": effective_ts,
+                "expiration": expiration_ts,
+                "validators": entries,
+                "raw": writer.buf,
+                "digest": writer.digest(),
+                "blob": writer.base64(),
+            })
+            appended = sequence
+
+        # Keep a blob only while no later sequence is effective at or before
+        # the time it becomes (or already is) effective.
+        kept = []
+        for i, blob in enumerate(current):
+            starts = max(blob["effective"], now)
+            if any(later["effective"] <= starts for later in current[i + 1:]):
+                dropped.append(blob["sequence"])
+            else:
+                kept.append(blob)
+
+        if len(kept) > MAX_SUPPORTED_BLOBS:
+            raise ConfigError(
+                f"update would publish {len(kept)} blobs; nodes accept at most "
+                f"{MAX_SUPPORTED_BLOBS}"
+            )
+
+        # Only blobs without a valid signature from the current key get signed
+        rotated = existing_vl.get("manifest") != self.manifest
+        to_sign = []
+        for blob in kept:
+            if "raw" not in blob and rotated:
+                blob["raw"] = base64.b64decode(blob["blob"])
+            if "raw" in blob:
+                to_sign.append(blob)
+        signatures = self.sign_blobs(
+            [b["raw"] for b in to_sign], workers, [b.get("digest") for b in to_sign]
+        )
+        for blob, sig in zip(to_sign, signatures):
+            blob["signature"] = sig
+
+        vl = self.assemble(
+            [{"signature": b["signature"], "blob": b["blob"]} for b in kept], 2
+        )
+        report = {
+            "kept": [b["sequence"] for b in kept],
+            "dropped": sorted(dropped),
+            "appended": appended,
+            "resigned": len(to_sign) - (1 if appended is not None else 0),
+        }
+        return vl, json.dumps(vl, separators=(",", ":")).encode("utf-8"), report
+
+    def assemble(self, blobs: List[dict], version: int = 2) -> dict:
+        """Wrap signed blobs into the outer VL document."""
+        if version == 1:
+            if len(blobs) != 1:
+                raise ConfigError("a v1 VL carries exactly one blob")
+            return {
+                "public_key": self.public_key,
+                "manifest": self.manifest,
+                "blob": blobs[0]["blob"],
+                "signature": blobs[0]["signature"],
+                "version": 1,
+            }
+        if version == 2:
+            return {
+                "public_key": self.public_key,
+                "manifest": self.manifest,
+                "blobs_v2": blobs,
+                "version": 2,
+            }
+        raise ConfigError(f"unsupported VL version {version}")
+
+    def build(
+        self,
+        validators: Iterable[Union[str, dict]],
+        sequence: int,
+        expiration: Union[int, str],
+        effective: Optional[Union[int, str]] = None,
+        version: int = 2,
+    ) -> Tuple[dict, bytes]:
+        """Build a signed single-blob VL; returns (vl_dict, compact JSON bytes)."""
+        blob = self.build_blob(validators, sequence, expiration, effective)
+        vl = self.assemble([blob], version)
+        return vl, json.dumps(vl, separators=(",", ":")).encode("utf-8")
+
+
+def validate_schedule(epochs: List[dict]):
+    """
+    Check a multi-blob schedule against what nodes will accept and keep:
+    at most MAX_SUPPORTED_BLOBS blobs, strictly increasing sequences and
+    strictly increasing effective times (a pending blob whose successor is
+    effective at the same time or earlier is discarded by ValidatorList).
+    """
+    if not epochs:
+        raise ConfigError("schedule must contain at least one epoch")
+    if len(epochs) > MAX_SUPPORTED_BLOBS:
+        raise ConfigError(
+            f"schedule has {len(epochs)} blobs; nodes accept at most {MAX_SUPPORTED_BLOBS}"
+        )
+
+    prev_sequence = None
+    prev_effective = None
+    for i, epoch in enumerate(epochs):
+        for key in ("sequence", "expiration", "validators"):
+            if key not in epoch:
+                raise ConfigError(f"schedule epoch {i + 1} is missing '{key}'")
+
+        sequence = epoch["sequence"]
+        effective = _ripple_time(epoch["effective"], "effective") if "effective" in epoch else 0
+        if i > 0 and "effective" not in epoch:
+            raise ConfigError(f"schedule epoch {i + 1} needs an 'effective' date")
+        if prev_sequence is not None and sequence <= prev_sequence:
+            raise ConfigError(
+                f"schedule epoch {i + 1}: sequence {sequence} is not above {prev_sequence}"
+            )
+        if prev_effective is not None and effective <= prev_effective:
+            raise ConfigError(
+                f"schedule epoch {i + 1}: effective date must be later than the previous epoch"
+            )
+        prev_sequence = sequence
+        prev_effective = effective
+
+
+# ValidatorList's ListDisposition, best first
+LIST_DISPOSITIONS = [
+    "accepted",
+    "expired",
+    "pending",
+    "same_sequence",
+    "known_sequence",
+    "stale",
+    "untrusted",
+    "unsupported_version",
+    "invalid",
+]
+
+
+def _verify_blob(
+    signing_key: bytes,
+    blob_b64: str,
+    signature_hex: str,
+    now: int,
+    current_sequence: Optional[int],
+) -> dict:
+    """Signature and content checks for one blob, as in ValidatorList::verify."""
+    result = {"disposition": "invalid", "reason": "", "warnings": []}
+    try:
+        data = base64.b64decode(blob_b64, validate=True)
+        signature = bytes.fromhex(signature_hex)
+    except ValueError:
+        result["reason"] = "bad_encoding"
+        return result
+
+    if not verify_signature(signing_key, data, signature):
+        result["reason"] = "bad_signature"
+        return result
+
+    try:
+        blob = json.loads(data)
+    except ValueError:
+        result["reason"] = "bad_json"
+        return result
+
+    def is_int(key):
+        return isinstance(blob.get(key), int) and not isinstance(blob.get(key), bool)
+
+    if not (
+        isinstance(blob, dict)
+        and is_int("sequence")
+        and is_int("expiration")
+        and ("effective" not in blob or is_int("effective"))
+        and isinstance(blob.get("validators"), list)
+    ):
+        result["reason"] = "bad_fields"
+        return result
+
+    sequence = blob["sequence"]
+    valid_from = blob.get("effective", 0)
+    valid_until = blob["expiration"]
+    result.update(
+        sequence=sequence,
+        effective=valid_from,
+        expiration=valid_until,
+        validators=len(blob["validators"]),
+    )
+
+    for i, v in enumerate(blob["validators"]):
+        key = v.get("validation_public_key") if isinstance(v, dict) else None
+        try:
+            key_bytes = bytes.fromhex(key) if isinstance(key, str) else None
+        except ValueError:
+            key_bytes = None
+        if public_key_type(key_bytes) is None:
+            # The node logs and skips these entries rather than rejecting the list
+            result["warnings"].append(f"validator {i + 1}: invalid validation_public_key")
+
+    if valid_until <= valid_from:
+        result["reason"] = "expiration_before_effective"
+    elif current_sequence is not None and sequence < current_sequence:
+        result["disposition"] = "stale"
+    elif current_sequence is not None and sequence == current_sequence:
+        result["disposition"] = "same_sequence"
+    elif valid_until <= now:
+        result["disposition"] = "expired"
+    elif valid_from > now:
+        result["disposition"] = "pending"
+    else:
+        result["disposition"] = "accepted"
+    return result
+
+
+def verify_vl(
+    vl: dict,
+    publisher_key: Optional[str] = None,
+    current_sequence: Optional[int] = None,
+    now: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> dict:
+    """
+    Run the node's acceptance checks on a VL document without a node.
+
+    Mirrors ValidatorList::parseBlobs, applyList and verify: structure and
+    version checks, publisher manifest checks (including the trusted key
+    when publisher_key is given), then per-blob signature, field and
+    sequence/date rules. Blobs are verified concurrently in threads; the
+    native signature backends release the GIL.
+
+    Returns {"ok", "disposition", "reason", "blobs": [...], "warnings": [...]}
+    where "disposition" is the worst blob's ListDisposition name. "ok" is
+    true only if every blob is accepted or pending.
+    """
+    report = {"ok": False, "disposition": "invalid", "reason": "", "blobs": [], "warnings": []}
+    now = ripple_now() if now is None else now
+
+    version = vl.get("version")
+    if version not in (1, 2):
+        report["disposition"] = "unsupported_version"
+        report["reason"] = f"version {version!r}"
+        return report
+
+    if version == 1:
+        if not (isinstance(vl.get("blob"), str) and isinstance(vl.get("signature"), str)) \
+                or "blobs_v2" in vl:
+            report["reason"] = "malformed_v1"
+            return report
+        entries = [{"blob": vl["blob"], "signature": vl["signature"]}]
+    else:
+        entries = vl.get("blobs_v2")
+        if not isinstance(entries, list) or "blob" in vl or "signature" in vl:
+            report["reason"] = "malformed_v2"
+            return report
+        if not entries or len(entries) > MAX_SUPPORTED_BLOBS:
+            report["reason"] = f"blob_count_{len(entries)}"
+            return report
+        for entry in entries:
+            if not (
+                isinstance(entry, dict)
+                and isinstance(entry.get("blob"), str)
+                and isinstance(entry.get("signature"), str)
+                and isinstance(entry.get("manifest", ""), str)
+            ):
+                report["reason"] = "malformed_v2_entry"
+                return report
+
+    if not isinstance(vl.get("manifest"), str):
+        report["reason"] = "missing_manifest"
+        return report
+
+    expected_key = (publisher_key or vl.get("public_key") or "").upper()
+
+    # Resolve and check every manifest (global or per-blob) up front
+    jobs = []
+    for entry in entries:
+        manifest_b64 = entry.get("manifest", vl["manifest"])
+        try:
+            manifest = parse_manifest_bytes(base64.b64decode(manifest_b64))
+            reason = manifest_problem(manifest)
+        except (ManifestParseError, ValueError):
+            manifest, reason = None, "malformed"
+
+        if reason:
+            jobs.append({"disposition": "invalid", "reason": f"manifest_{reason}"})
+        elif manifest.revoked:
+            jobs.append({"disposition": "untrusted", "reason": "manifest_revoked"})
+        elif expected_key and manifest.public_key.hex().upper() != expected_key:
+            jobs.append({"disposition": "untrusted", "reason": "publisher_key_mismatch"})
+        else:
+            jobs.append((manifest.signing_public_key, entry["blob"], entry["signature"]))
+
+    pending = [j for j in jobs if isinstance(j, tuple)]
+    if workers is None:
+        workers = min(len(pending), os.cpu_count() or 1)
+    if len(pending) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_verify_blob, *job, now, current_sequence) for job in pending
+            ]
+            results = iter([f.result() for f in futures])
+    else:
+        results = iter([_verify_blob(*job, now, current_sequence) for job in pending])
+
+    blobs = [next(results) if isinstance(j, tuple) else j for j in jobs]
+    for i, blob in enumerate(blobs):
+        blob["index"] = i
+    report["blobs"] = blobs
+
+    # Same checks as applyLists' cleanup: blobs a node would never use
+    sequences = [b.get("sequence") for b in blobs if "sequence" in b]
+    if len(set(sequences)) != len(sequences):
+        report["warnings"].append("duplicate blob sequences")
+    ordered = sorted((b for b in blobs if "sequence" in b), key=lambda b: b["sequence"])
+    for i, blob in enumerate(ordered):
+        starts = max(blob["effective"], now)
+        if any(later["effective"] <= starts for later in ordered[i + 1:]):
+            report["warnings"].append(
+                f"blob sequence {blob['sequence']} is superseded and will be discarded"
+            )
+
+    worst = max(blobs, key=lambda b: LIST_DISPOSITIONS.index(b["disposition"]))
+    report["disposition"] = worst["disposition"]
+    report["reason"] = worst.get("reason", "")
+    report["ok"] = all(b["disposition"] in ("accepted", "pending") for b in blobs)
+    return report
+
+
+def iter_token_paths(
+    dirs: Iterable[str] = (),
+    patterns: Iterable[str] = (),
+) -> Iterable[str]:
+    """
+    Lazily yield token file paths: the regular, non-hidden files directly
+    inside each directory, then the files matching each glob pattern
+    ('**' recurses). Each source is yielded in sorted order.
+    """
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.is_file() and not e.name.startswith(".")
+                )
+        except OSError as e:
+            raise ConfigError(f"cannot read tokens directory: {e}") from e
+        for name in names:
+            yield os.path.join(directory, name)
+
+    for pattern in patterns:
+        matches = sorted(p for p in glob.iglob(pattern, recursive=True) if os.path.isfile(p))
+        if not matches:
+            raise ConfigError(f"no token files match '{pattern}'")
+        yield from matches
+
+
+def _load_token_file(path: str, verify: bool = True) -> Tuple[str, Optional[dict], str]:
+    """
+    Read, decode and parse one token file; returns (path, entry, error).
+    Runs in worker processes, so failures are returned rather than raised.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            token = decode_token(f.read())
+        if not isinstance(token, dict) or "manifest" not in token:
+            raise TokenError("token has no manifest")
+        fields = parse_manifest(token["manifest"], verify)
+    except (OSError, UnicodeDecodeError) as e:
+        return path, None, f"unreadable: {e}"
+    except VLError as e:
+        return path, None, str(e).splitlines()[0]
+    return path, {
+        "validation_public_key": fields["master_public_key"],
+        "manifest": token["manifest"],
+        "sequence": fields.get("sequence", 0),
+    }, ""
+
+
+def load_token_files(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    verify: bool = True,
+    seen: Optional[Dict[str, int]] = None,
+) -> Tuple[List[dict], List[Tuple[str, str]]]:
+    """
+    Decode validator token files, in a process pool unless workers=1.
+
+    Returns (entries, problems): blob entries in input order, deduplicated
+    by master public key (the highest manifest sequence wins), and a
+    (path, reason) pair for every file that was skipped. `seen` maps
+    master keys already taken (e.g. from inline tokens) to their manifest
+    sequence; files repeating one of those keys are skipped.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    load = functools.partial(_load_token_file, verify=verify)
+
+    taken = dict(seen or {})
+    slots: Dict[str, int] = {}
+    entries: List[Optional[dict]] = []
+    sources: List[str] = []
+    problems: List[Tuple[str, str]] = []
+
+    def ingest(results):
+        for path, entry, error in results:
+            if entry is None:
+                problems.append((path, error))
+                continue
+            key = entry.pop("validation_public_key")
+            sequence = entry.pop("sequence")
+            if key in slots and sequence > taken[key]:
+                # A rotated manifest replaces the older token in place
+                problems.append((sources[slots[key]], f"superseded by {path}"))
+                entries[slots[key]] = {"validation_public_key": key, **entry}
+                sources[slots[key]] = path
+                taken[key] = sequence
+            elif key in taken:
+                problems.append((path, f"duplicate master key {key}"))
+            else:
+                taken[key] = sequence
+                slots[key] = len(entries)
+                entries.append({"validation_public_key": key, **entry})
+                sources.append(path)
+
+    # Per-file decode/parse stages run in the workers; time the whole load
+    with timings.stage("token_files"):
+        if workers <= 1:
+            ingest(map(load, paths))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                ingest(pool.map(load, paths, chunksize=16))
+
+    return entries, problems
+
+
+def _report_output(builder: VLBuilder, output_path: str, vl_bytes: bytes):
+    """Write the VL if it changed and print what happened."""
+    if write_output(output_path, vl_bytes):
+        print(f"\nVL written to {output_path}")
+    else:
+        print(f"\nVL unchanged, {output_path} not rewritten")
+    if builder.cache.hits:
+        print(f"  Signatures reused from cache: {builder.cache.hits}")
+    if builder.cache.rejected:
+        print(f"  Cached signatures rejected and re-signed: {builder.cache.rejected}")
+
+
+def generate_vl(
+    config_path: str,
+    output_path: str,
+    version: int,
+    workers: Optional[int] = None,
+    update_path: Optional[str] = None,
+    token_dirs: Iterable[str] = (),
+    token_patterns: Iterable[str] = (),
+    cache_dir: Optional[str] = None,
+):
+    """
+    Generate a signed VL JSON file from a config file. Blob signatures are
+    reused from `cache_dir` when given, and an output file that already
+    holds the same bytes is left untouched.
+    """
     with open(config_path) as f:
         config = json.load(f)
 
-    required = ["publisher_token", "sequence", "expiration", "validator_tokens"]
+    token_dirs, token_patterns = list(token_dirs), list(token_patterns)
+    if "schedule" in config:
+        required = ["publisher_token", "schedule"]
+    else:
+        required = ["publisher_token", "sequence", "expiration"]
+        if not token_dirs and not token_patterns:
+            required.append("validator_tokens")
     for key in required:
         if key not in config:
-            sys.exit(f"Error: missing required field '{key}' in config")
+            raise ConfigError(f"missing required field '{key}' in config")
 
-    # Parse publisher token
-    publisher = decode_token(config["publisher_token"])
-    publisher_manifest_b64 = publisher["manifest"]
-    publisher_fields = parse_manifest(publisher_manifest_b64)
-    publisher_secret = publisher["validation_secret_key"]
-    key_type = publisher_fields.get("signing_key_type")
+    builder = VLBuilder(config["publisher_token"], cache=SignatureCache(cache_dir))
 
-    if not key_type:
-        sys.exit("Error: could not determine signing key type from publisher manifest")
-
-    print(f"Publisher master key: {publisher_fields['master_public_key']}")
-    print(f"Signing key type: {key_type}")
+    print(f"Publisher master key: {builder.public_key}")
+    print(f"Signing key type: {builder.key_type}")
 
     # Parse validator tokens and extract their manifests + public keys
     validators = []
-    for i, vtoken_str in enumerate(config["validator_tokens"]):
-        vtoken = decode_token(vtoken_str)
-        vfields = parse_manifest(vtoken["manifest"])
-        validators.append({
-            "validation_public_key": vfields["master_public_key"],
-            "manifest": vtoken["manifest"],
-        })
-        print(f"Validator {i + 1}: {vfields['master_public_key']}")
-
-    # Build inner blob JSON (key order and compact format must match XRPL expectations)
-    sequence = config["sequence"]
-    expiration = to_ripple_epoch(config["expiration"])
-    now = to_ripple_epoch(datetime.now(timezone.utc).strftime("%Y-%m-%d"))
-
-    if expiration <= now:
-        sys.exit(f"Error: expiration date {config['expiration']} is in the past")
-
-    blob_obj = {"sequence": sequence, "expiration": expiration}
-    if "effective" in config:
-        blob_obj["effective"] = to_ripple_epoch(config["effective"])
-    blob_obj["validators"] = validators
-
-    # Compact JSON with no whitespace (matches XRPL C++ construction)
-    blob_json = json.dumps(blob_obj, separators=(",", ":"))
-    blob_bytes = blob_json.encode("utf-8")
-
-    # Sign the raw JSON bytes (NOT the base64-encoded version)
-    signature = sign_blob(blob_bytes, publisher_secret, key_type)
-
-    # Base64-encode the blob for the output
-    blob_b64 = base64.b64encode(blob_bytes).decode("ascii")
-
-    # Assemble outer VL JSON
-    if version == 1:
-        vl = {
-            "public_key": publisher_fields["master_public_key"],
-            "manifest": publisher_manifest_b64,
-            "blob": blob_b64,
-            "signature": signature,
-            "version": 1,
-        }
-    else:
-        vl = {
-            "public_key": publisher_fields["master_public_key"],
-            "manifest": publisher_manifest_b64,
-            "blobs_v2": [{"signature": signature, "blob": blob_b64}],
-            "version": 2,
-        }
+    for i, vtoken_str in enumerate(config.get("validator_tokens", [])):
+        entry = builder.validator_entry(decode_token(vtoken_str))
+        validators.append(entry)
+        print(f"Validator {i + 1}: {entry['validation_public_key']}")
+
+    if token_dirs or token_patterns:
+        seen = {}
+        for v in validators:
+            seen[v["validation_public_key"]] = parse_manifest(v["manifest"]).get("sequence", 0)
+        loaded, problems = load_token_files(
+            iter_token_paths(token_dirs, token_patterns), workers, seen=seen
+        )
+        builder.adopt(loaded)
+        for entry in loaded:
+            validators.append(entry)
+            print(f"Validator {len(validators)}: {entry['validation_public_key']}")
+        for path, reason in problems:
+            print(f"Skipped {path}: {reason}", file=sys.stderr)
+        print(f"Token files: {len(loaded)} loaded, {len(problems)} skipped")
+
+    if "schedule" in config:
+        if version != 2:
+            raise ConfigError("schedule mode requires --version 2")
+        epochs = []
+        for epoch in config["schedule"]:
+            epoch = dict(epoch)
+            if "validator_tokens" in epoch:
+                epoch["validators"] = [
+                    builder.validator_entry(decode_token(t))
+                    for t in epoch.pop("validator_tokens")
+                ]
+            else:
+                epoch["validators"] = validators
+            epochs.append(epoch)
+
+        vl, vl_bytes = builder.build_schedule(epochs, workers)
+
+        _report_output(builder, output_path, vl_bytes)
+        print(f"  Format: v2 ({len(epochs)} blobs)")
+        for epoch in epochs:
+            effective = epoch.get("effective", "now")
+            print(f"  Sequence {epoch['sequence']}: effective {effective}, "
+                  f"expires {epoch['expiration']}, {len(epoch['validators'])} validators")
+        print(f"\n[validator_list_keys] value for node configs:")
+        print(f"  {builder.public_key}")
+        return
+
+    if update_path:
+        if version != 2:
+            raise ConfigError("update mode requires --version 2")
+        with open(update_path) as f:
+            existing = json.load(f)
+
+        vl, vl_bytes, report = builder.update(
+            existing,
+            validators,
+            config["sequence"],
+            config["expiration"],
+            config.get("effective"),
+            workers,
+        )
 
-    with open(output_path, "w") as f:
-        json.dump(vl, f, separators=(",", ":"))
+        _report_output(builder, output_path, vl_bytes)
+        print(f"  Updated from {update_path}")
+        if report["appended"] is None:
+            print("  Validator set and dates unchanged, no new blob")
+        else:
+            print(f"  Appended sequence: {report['appended']}")
+        print(f"  Dropped sequences: {report['dropped'] or 'none'}")
+        print(f"  Published sequences: {report['kept']}")
+        print(f"  Re-signed existing blobs: {report['resigned']}")
+        return
+
+    vl, vl_bytes = builder.build(
+        validators,
+        config["sequence"],
+        config["expiration"],
+        config.get("effective"),
+        version,
+    )
 
-    print(f"\nVL written to {output_path}")
+    _report_output(builder, output_path, vl_bytes)
     print(f"  Format: v{version}")
-    print(f"  Sequence: {sequence}")
-    print(f"  Expiration: {config['expiration']} ({from_ripple_epoch(expiration)})")
+    print(f"  Sequence: {config['sequence']}")
+    print(f"  Expiration: {config['expiration']} "
+          f"({from_ripple_epoch(to_ripple_epoch(config['expiration']))})")
     print(f"  Validators: {len(validators)}")
     print(f"\n[validator_list_keys] value for node configs:")
-    print(f"  {publisher_fields['master_public_key']}")
+    print(f"  {builder.public_key}")
 
 
 def main():
@@ -363,7 +1498,8 @@ def main():
     )
     parser.add_argument(
         "config",
-        help="Path to JSON config file (generation mode) or VL JSON file (decode mode)",
+        nargs="+",
+        help="Path to JSON config file (generation mode) or VL JSON file(s) (decode mode)",
     )
     parser.add_argument(
         "-o", "--output",
@@ -377,17 +1513,136 @@ def main():
         default=2,
         help="VL format version (default: 2)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to sign schedule blobs and decode token files "
+             "(default: up to CPU count)",
+    )
+    parser.add_argument(
+        "--tokens-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Read validator tokens from every file in DIR (repeatable)",
+    )
+    parser.add_argument(
+        "--tokens",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Read validator tokens from files matching GLOB, e.g. "
+             "'validators/*/token.txt' (repeatable)",
+    )
+    parser.add_argument(
+        "--update",
+        metavar="EXISTING_VL",
+        help="Incrementally update an existing VL: keep its unexpired blobs, "
+             "append a blob for the config's validator set, drop stale blobs",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        const=default_cache_dir(),
+        default=None,
+        help="Keep a content-addressed cache of blob signatures on disk, so unchanged "
+             "rounds skip signing; cached signatures are verified before use "
+             "(default: off; without a value $POSTFIAT_VL_CACHE or ~/.cache/postfiat/vl-signatures)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore --cache-dir: always sign, without reading or writing the cache",
+    )
+    parser.add_argument(
+        "--timings-json",
+        metavar="FILE",
+        help="Write wall time, calls and bytes per stage (token decode, "
+             "manifest parse, blob build, hash, sign, write) to FILE as JSON",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PSTATS_FILE",
+        help="Run under cProfile, dump pstats to PSTATS_FILE and print the "
+             "stage timings and top functions to stderr",
+    )
     parser.add_argument(
         "--decode",
         action="store_true",
         help="Decode and display an existing VL file instead of generating one",
     )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="With --decode: stream each file and print a one-line summary",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="With --decode: stream validators as JSON lines (summaries with --summary)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Run the node's acceptance checks on an existing VL file; prints "
+             "a JSON report and exits non-zero unless every blob is accepted or pending",
+    )
+    parser.add_argument(
+        "--publisher-key",
+        help="Expected publisher master key (hex, as in [validator_list_keys]) for --verify",
+    )
+    parser.add_argument(
+        "--current-sequence",
+        type=int,
+        help="Sequence nodes currently hold, to flag stale blobs in --verify",
+    )
     args = parser.parse_args()
 
-    if args.decode:
-        decode_existing_vl(args.config)
-    else:
-        generate_vl(args.config, args.output, args.version)
+    if args.decode and (args.summary or args.jsonl):
+        stream_decode(args.config, args.summary, args.jsonl)
+        return
+    if len(args.config) > 1 and not args.decode:
+        parser.error("only --decode accepts more than one file")
+
+    if args.verify:
+        try:
+            with open(args.config[0]) as f:
+                vl = json.load(f)
+            report = verify_vl(
+                vl, args.publisher_key, args.current_sequence, workers=args.workers
+            )
+        except (OSError, ValueError) as e:
+            report = {"ok": False, "disposition": "invalid", "reason": "unreadable",
+                      "error": str(e), "blobs": [], "warnings": []}
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["ok"] else 1)
+
+    try:
+        with profiled(args.profile):
+            if args.decode:
+                for i, path in enumerate(args.config):
+                    if i:
+                        print()
+                    decode_existing_vl(path)
+            else:
+                generate_vl(
+                    args.config[0],
+                    args.output,
+                    args.version,
+                    args.workers,
+                    args.update,
+                    args.tokens_dir,
+                    args.tokens,
+                    None if args.no_cache else args.cache_dir,
+                )
+    except VLError as e:
+        sys.exit(f"Error: {e}")
+    finally:
+        if args.profile:
+            print(timings.format(), file=sys.stderr)
+        if args.timings_json:
+            timings.write_json(args.timings_json, script="generate_vl.py")
 
 
 if __name__ == "__main__":
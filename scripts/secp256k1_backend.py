@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Pluggable secp256k1 ECDSA backends for the PostFiat signing scripts.
+
+The pure-Python 'ecdsa' package needs milliseconds per signature, which
+dominates VL generation once several blobs or networks are signed in one
+run. This module keeps a small registry of backends and picks the fastest
+one that is importable/loadable on this machine:
+
+    libsecp256k1   the vendored external/secp256k1 library, loaded via ctypes
+    coincurve      cffi bindings to libsecp256k1 (pip3 install coincurve)
+    ecdsa          pure Python fallback (pip3 install ecdsa)
+
+Every backend returns the same wire format that postfiatd verifies:
+a strict DER-encoded signature with a canonical (low-S) S value, computed
+over a caller-supplied 32-byte digest (SHA-512-Half for XRPL).
+
+Nonces are derived deterministically (RFC 6979 with HMAC-SHA256, as in
+libsecp256k1's default nonce function), so the same key and digest give
+byte-identical signatures on every backend and every run.
+
+Selecting a backend:
+    - POSTFIAT_SECP256K1_BACKEND=<name> forces a specific backend
+    - POSTFIAT_SECP256K1_LIB=/path/to/libsecp256k1.so points the ctypes
+      backend at a specific shared library
+
+Building the vendored library as a shared object:
+    cmake -S external/secp256k1 -B external/secp256k1/build -DBUILD_SHARED_LIBS=ON
+    cmake --build external/secp256k1/build
+
+Benchmark:
+    python3 scripts/secp256k1_backend.py --bench [--iterations 2000]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import glob
+import hashlib
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+# Order of preference when no backend is forced
+PREFERENCE = ["libsecp256k1", "coincurve", "ecdsa"]
+
+# How to make each backend available
+INSTALL_HINTS = {
+    "libsecp256k1": "build external/secp256k1 as a shared library or set POSTFIAT_SECP256K1_LIB",
+    "coincurve": "pip3 install coincurve",
+    "ecdsa": "pip3 install ecdsa",
+}
+
+# secp256k1 group order, used for low-S canonicalization checks
+SECP256K1_ORDER = int(
+    "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141", 16
+)
+
+
+class BackendUnavailableError(ImportError):
+    """The requested secp256k1 backend is unknown or cannot be loaded."""
+
+
+class Secp256k1Backend:
+    """Interface implemented by every signing backend."""
+
+    name = "abstract"
+
+    def sign_digest(self, secret_key: bytes, digest: bytes) -> bytes:
+        """Sign a 32-byte digest (RFC 6979 nonce) and return a canonical low-S DER signature."""
+        raise NotImplementedError
+
+    def verify_digest(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        """Verify a DER signature over a 32-byte digest with a compressed public key."""
+        raise NotImplementedError
+
+    def public_key(self, secret_key: bytes) -> bytes:
+        """Derive the 33-byte compressed public key for a secret key."""
+        raise NotImplementedError
+
+
+class EcdsaBackend(Secp256k1Backend):
+    """Pure Python backend built on the 'ecdsa' package."""
+
+    name = "ecdsa"
+
+    def __init__(self):
+        from ecdsa import SigningKey, VerifyingKey, SECP256k1
+        from ecdsa import util as ecdsa_util
+
+        self._SigningKey = SigningKey
+        self._VerifyingKey = VerifyingKey
+        self._curve = SECP256k1
+        self._util = ecdsa_util
+        # Rebuilding a SigningKey from hex costs as much as a signature,
+        # so keep the decoded keys around for repeated signing.
+        self._keys: Dict[bytes, object] = {}
+
+    def _signing_key(self, secret_key: bytes):
+        sk = self._keys.get(secret_key)
+        if sk is None:
+            sk = self._SigningKey.from_string(secret_key, curve=self._curve)
+            self._keys[secret_key] = sk
+        return sk
+
+    def sign_digest(self, secret_key: bytes, digest: bytes) -> bytes:
+        sk = self._signing_key(secret_key)
+        return sk.sign_digest_deterministic(
+            digest,
+            hashfunc=hashlib.sha256,
+            sigencode=self._util.sigencode_der_canonize,
+        )
+
+    def verify_digest(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        try:
+            vk = self._VerifyingKey.from_string(public_key, curve=self._curve)
+            return vk.verify_digest(
+                signature, digest, sigdecode=self._util.sigdecode_der
+            )
+        except Exception:
+            return False
+
+    def public_key(self, secret_key: bytes) -> bytes:
+        return self._signing_key(secret_key).get_verifying_key().to_string("compressed")
+
+
+class CoincurveBackend(Secp256k1Backend):
+    """libsecp256k1 through the 'coincurve' cffi bindings."""
+
+    name = "coincurve"
+
+    def __init__(self):
+        import coincurve
+
+        self._coincurve = coincurve
+        self._keys: Dict[bytes, object] = {}
+
+    def _private_key(self, secret_key: bytes):
+        pk = self._keys.get(secret_key)
+        if pk is None:
+            pk = self._coincurve.PrivateKey(secret_key)
+            self._keys[secret_key] = pk
+        return pk
+
+    def sign_digest(self, secret_key: bytes, digest: bytes) -> bytes:
+        # hasher=None signs the digest as-is; libsecp256k1 always emits low-S
+        # and uses its RFC 6979 nonce function by default
+        return self._private_key(secret_key).sign(digest, hasher=None)
+
+    def verify_digest(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        try:
+            return self._coincurve.PublicKey(public_key).verify(
+                signature, digest, hasher=None
+            )
+        except Exception:
+            return False
+
+    def public_key(self, secret_key: bytes) -> bytes:
+        return self._private_key(secret_key).public_key.format(compressed=True)
+
+
+class LibSecp256k1Backend(Secp256k1Backend):
+    """The vendored libsecp256k1 loaded directly with ctypes."""
+
+    name = "libsecp256k1"
+
+    _CONTEXT_SIGN = (1 << 0) | (1 << 9)
+    _CONTEXT_VERIFY = (1 << 0) | (1 << 8)
+    _EC_COMPRESSED = (1 << 1) | (1 << 8)
+
+    def __init__(self):
+        path = find_libsecp256k1()
+        if path is None:
+            raise OSError("libsecp256k1 shared library not found")
+        lib = ctypes.CDLL(path)
+
+        lib.secp256k1_context_create.restype = ctypes.c_void_p
+        lib.secp256k1_context_create.argtypes = [ctypes.c_uint]
+        lib.secp256k1_ecdsa_sign.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+            ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p,
+        ]
+        lib.secp256k1_ecdsa_signature_serialize_der.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_size_t), ctypes.c_char_p,
+        ]
+        lib.secp256k1_ecdsa_signature_parse_der.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t,
+        ]
+        lib.secp256k1_ecdsa_signature_normalize.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+        ]
+        lib.secp256k1_ecdsa_verify.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p,
+        ]
+        lib.secp256k1_ec_pubkey_parse.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t,
+        ]
+        lib.secp256k1_ec_pubkey_create.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+        ]
+        lib.secp256k1_ec_pubkey_serialize.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_size_t), ctypes.c_char_p, ctypes.c_uint,
+        ]
+
+        self._lib = lib
+        self._path = path
+        self._ctx = lib.secp256k1_context_create(
+            self._CONTEXT_SIGN | self._CONTEXT_VERIFY
+        )
+        if not self._ctx:
+            raise OSError("secp256k1_context_create failed")
+
+    def sign_digest(self, secret_key: bytes, digest: bytes) -> bytes:
+        if len(digest) != 32 or len(secret_key) != 32:
+            raise ValueError("secp256k1 signing needs a 32-byte key and digest")
+        sig = ctypes.create_string_buffer(64)
+        # A NULL nonce function selects secp256k1_nonce_function_rfc6979
+        if not self._lib.secp256k1_ecdsa_sign(
+            self._ctx, sig, digest, secret_key, None, None
+        ):
+            raise ValueError("secp256k1_ecdsa_sign failed (invalid secret key?)")
+        der = ctypes.create_string_buffer(72)
+        der_len = ctypes.c_size_t(72)
+        self._lib.secp256k1_ecdsa_signature_serialize_der(
+            self._ctx, der, ctypes.byref(der_len), sig
+        )
+        return der.raw[: der_len.value]
+
+    def verify_digest(self, public_key: bytes, digest: bytes, signature: bytes) -> bool:
+        pub = ctypes.create_string_buffer(64)
+        if not self._lib.secp256k1_ec_pubkey_parse(
+            self._ctx, pub, public_key, len(public_key)
+        ):
+            return False
+        sig = ctypes.create_string_buffer(64)
+        if not self._lib.secp256k1_ecdsa_signature_parse_der(
+            self._ctx, sig, signature, len(signature)
+        ):
+            return False
+        # A non-zero return means the signature was high-S; postfiatd
+        # rejects those for VL blobs, so treat them as invalid here too.
+        if self._lib.secp256k1_ecdsa_signature_normalize(self._ctx, None, sig):
+            return False
+        return bool(self._lib.secp256k1_ecdsa_verify(self._ctx, sig, digest, pub))
+
+    def public_key(self, secret_key: bytes) -> bytes:
+        pub = ctypes.create_string_buffer(64)
+        if not self._lib.secp256k1_ec_pubkey_create(self._ctx, pub, secret_key):
+            raise ValueError("invalid secp256k1 secret key")
+        out = ctypes.create_string_buffer(33)
+        out_len = ctypes.c_size_t(33)
+        self._lib.secp256k1_ec_pubkey_serialize(
+            self._ctx, out, ctypes.byref(out_len), pub, self._EC_COMPRESSED
+        )
+        return out.raw[: out_len.value]
+
+
+BACKENDS = {
+    LibSecp256k1Backend.name: LibSecp256k1Backend,
+    CoincurveBackend.name: CoincurveBackend,
+    EcdsaBackend.name: EcdsaBackend,
+}
+
+_instances: Dict[str, Secp256k1Backend] = {}
+
+
+def find_libsecp256k1() -> Optional[str]:
+    """Locate a libsecp256k1 shared library (env override, build tree, system)."""
+    override = os.environ.get("POSTFIAT_SECP256K1_LIB")
+    if override:
+        return override if os.path.exists(override) else None
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    patterns = [
+        os.path.join(repo_root, "external", "secp256k1", "build*", "lib", "libsecp256k1.*"),
+        os.path.join(repo_root, "external", "secp256k1", "build*", "src", "libsecp256k1.*"),
+        os.path.join(repo_root, "external", "secp256k1", ".libs", "libsecp256k1.*"),
+    ]
+    for pattern in patterns:
+        for candidate in sorted(glob.glob(pattern)):
+            if candidate.endswith((".so", ".dylib", ".dll")) or ".so." in candidate:
+                return candidate
+
+    return ctypes.util.find_library("secp256k1")
+
+
+def available_backends() -> List[str]:
+    """Names of the backends that can be loaded on this machine, best first."""
+    names = []
+    for name in PREFERENCE:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name: Optional[str] = None) -> Secp256k1Backend:
+    """
+    Return a (cached) backend instance.
+
+    With no name, POSTFIAT_SECP256K1_BACKEND is honoured, otherwise the
+    first loadable backend in PREFERENCE order is used.
+    """
+    where = ""
+    if name is None:
+        name = os.environ.get("POSTFIAT_SECP256K1_BACKEND")
+        where = " in POSTFIAT_SECP256K1_BACKEND"
+    if name is None:
+        for candidate in PREFERENCE:
+            try:
+                return get_backend(candidate)
+            except ImportError:
+                continue
+        raise BackendUnavailableError(
+            f"No secp256k1 backend available (tried {', '.join(PREFERENCE)}).\n"
+            "Install with: pip3 install ecdsa (or coincurve for native speed)"
+        )
+
+    if name not in BACKENDS:
+        raise BackendUnavailableError(
+            f"Unknown secp256k1 backend '{name}'{where} (choose from {', '.join(PREFERENCE)})"
+        )
+    if name not in _instances:
+        try:
+            _instances[name] = BACKENDS[name]()
+        except (ImportError, OSError, AttributeError) as e:
+            raise BackendUnavailableError(
+                f"secp256k1 backend '{name}' is not available ({e}); {INSTALL_HINTS[name]}, "
+                f"or choose another of {', '.join(PREFERENCE)}"
+            ) from e
+    return _instances[name]
+
+
+def is_low_s_der(signature: bytes) -> bool:
+    """Check that a DER signature is strictly encoded and carries a low S value."""
+    if len(signature) < 8 or signature[0] != 0x30 or signature[1] != len(signature) - 2:
+        return False
+    if signature[2] != 0x02:
+        return False
+    r_len = signature[3]
+    s_off = 4 + r_len
+    if s_off + 2 > len(signature) or signature[s_off] != 0x02:
+        return False
+    s_len = signature[s_off + 1]
+    if s_off + 2 + s_len != len(signature):
+        return False
+    s = int.from_bytes(signature[s_off + 2 :], "big")
+    return 0 < s <= SECP256K1_ORDER // 2
+
+
+def benchmark(iterations: int = 1000) -> List[dict]:
+    """
+    Time sign/verify on every available backend over the same digests.
+
+    Each backend's signatures are cross-checked against every other backend
+    so a broken native build cannot silently produce unverifiable VLs, and
+    must be byte-identical to theirs since all nonces follow RFC 6979.
+    """
+    secret = hashlib.sha256(b"postfiat-secp256k1-bench").digest()
+    digests = [
+        hashlib.sha512(i.to_bytes(4, "big")).digest()[:32]
+        for i in range(iterations)
+    ]
+    names = available_backends()
+    backends = {name: get_backend(name) for name in names}
+
+    results = []
+    for name, backend in backends.items():
+        backend.sign_digest(secret, digests[0])  # warm key caches
+
+        start = time.perf_counter()
+        sigs = [backend.sign_digest(secret, d) for d in digests]
+        sign_elapsed = time.perf_counter() - start
+
+        pub = backend.public_key(secret)
+        start = time.perf_counter()
+        ok = all(backend.verify_digest(pub, d, s) for d, s in zip(digests, sigs))
+        verify_elapsed = time.perf_counter() - start
+
+        cross_ok = all(
+            other.verify_digest(other.public_key(secret), digests[0], sigs[0])
+            and other.sign_digest(secret, digests[0]) == sigs[0]
+            for other in backends.values()
+        )
+
+        results.append({
+            "backend": name,
+            "iterations": iterations,
+            "sign_us": sign_elapsed / iterations * 1e6,
+            "verify_us": verify_elapsed / iterations * 1e6,
+            "signs_per_sec": iterations / sign_elapsed if sign_elapsed else 0.0,
+            "low_s_der": all(is_low_s_der(s) for s in sigs),
+            "verified": ok and cross_ok,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inspect and benchmark the available secp256k1 signing backends."
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Run the sign/verify micro-benchmark on every available backend",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1000,
+        help="Signatures per backend in benchmark mode (default: 1000)",
+    )
+    args = parser.parse_args()
+
+    names = available_backends()
+    if not names:
+        sys.exit("No secp256k1 backend available (pip3 install ecdsa or coincurve)")
+
+    print(f"Available backends: {', '.join(names)}")
+    try:
+        print(f"Selected backend: {get_backend().name}")
+    except BackendUnavailableError as e:
+        sys.exit(str(e))
+    if "libsecp256k1" in names:
+        print(f"libsecp256k1: {get_backend('libsecp256k1')._path}")
+
+    if not args.bench:
+        return
+
+    print(f"\n{'backend':<14} {'sign (us)':>10} {'verify (us)':>12} {'signs/s':>10}  checks")
+    for r in benchmark(args.iterations):
+        checks = "ok" if r["low_s_der"] and r["verified"] else "FAILED"
+        print(
+            f"{r['backend']:<14} {r['sign_us']:>10.1f} {r['verify_us']:>12.1f} "
+            f"{r['signs_per_sec']:>10.0f}  {checks}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,22 +7,239 @@ and adds a signature to the JSON that can be verified by the RemoteExclusionList
 
 Usage:
     python3 sign_exclusion_list.py --secret-key <hex_secret_key> --input exclusions.json --output signed_exclusions.json
+
+Add --timings-json FILE to record wall time and bytes per stage (read,
+message, sign, write) and --profile FILE to dump cProfile stats.
+
+Sanctions-scale lists (hundreds of thousands to millions of addresses) can
+be signed with --stream: the input is read incrementally, addresses are
+sorted with a bounded-memory external merge sort (--run-size addresses per
+in-memory run, spilled to --tmp-dir), and the canonical message is built
+in one preallocated buffer and signed with libsodium. Only the message's
+SHA-256 digest is ever logged.
+
+Signed files can be checked offline exactly as nodes check them with the
+verify subcommand (see verify_main):
+
+    python3 sign_exclusion_list.py verify --config validators.txt list.json [...]
+
+With --delta-from PREVIOUS the script also writes OUTPUT.delta: the added
+and removed entries relative to the previously published list, bound to the
+SHA-512-Half of both lists' signing messages ("snapshot hashes") and signed.
+Publish it next to the full list at <url>.delta; nodes whose cached list
+matches base_hash apply it instead of downloading the full list. Without
+--delta-from, a delta left by an earlier run is deleted, since it no longer
+leads to the list just written; remove it from the host as well.
+
+Every file written also gets a <file>.etag sidecar holding a strong ETag
+(the quoted SHA-256 of its bytes); serve it as the ETag header so nodes'
+conditional polls are answered with 304 until the list changes
+(exclusion_source_server.py does this for local testing).
+
+Precompressed siblings (--compress, default gz; zstd and lz4 need the
+zstandard / lz4 packages) are written next to the output for hosts that
+serve them with Content-Encoding. Nodes advertise Accept-Encoding and
+inflate the body before parsing; the signature is unaffected.
+
+Before signing, every address (and the issuer address) is decoded as a
+base58check AccountID the way RemoteExclusionListFetcher::parseExclusionList
+does. The fetcher silently drops entries it cannot parse and then verifies
+the signature over the rest, so a single typo would make the list fail
+verification on every node; all bad entries are reported in one pass and
+nothing is signed. Validation runs in parallel chunks (--no-validate skips it).
 """
 
 import json
 import hashlib
+import heapq
+import io
 import argparse
+import collections
+import os
 import sys
-from typing import Dict, List, Any
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 import base58
 import nacl.signing
 import nacl.encoding
 
+from stage_timings import StageTimer, profiled
+from vl_stream import JSONReader
+
+# Addresses held in memory per sorted run before spilling to disk (--stream)
+DEFAULT_RUN_SIZE = 250000
+
+# XRPL uses a custom base58 alphabet (Ripple alphabet)
+RIPPLE_ALPHABET = b'rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz'
+
+# Byte -> base58 digit lookup for bytes.translate; 0xFF marks invalid characters
+_B58_DIGITS = bytearray(b'\xff' * 256)
+for _i, _c in enumerate(RIPPLE_ALPHABET):
+    _B58_DIGITS[_c] = _i
+_B58_DIGITS = bytes(_B58_DIGITS)
+
+# TokenType::AccountID, 20-byte account ID, 4-byte checksum
+ACCOUNT_ID_TYPE = 0
+ACCOUNT_TOKEN_SIZE = 1 + 20 + 4
+
+# Addresses validated per worker task
+VALIDATE_CHUNK_SIZE = 50000
+
+# Precompressed siblings written next to the signed file (--compress)
+COMPRESSED_SUFFIXES = {"gz": ".gz", "zstd": ".zst", "lz4": ".lz4"}
+
+# What RemoteExclusionListFetcher signs for an entry or issuer it could not fill in
+ZERO_ACCOUNT = "rrrrrrrrrrrrrrrrrrrrrhoLvTp"
+
+# TokenType::NodePublic and the 33-byte public key it wraps
+NODE_PUBLIC_TYPE = 0x1C
+NODE_PUBLIC_SIZE = 33
+
+# Per-stage wall time and bytes, reported with --timings-json / --profile
+timings = StageTimer()
+
 def decode_xrpl_address(address: str) -> bytes:
     """Decode an XRPL address to bytes"""
     # XRPL addresses use base58 with specific alphabet
     return base58.b58decode(address)
 
+def decode_base58_token(token: Any, token_type: int, size: int) -> Tuple[Optional[bytes], str]:
+    """
+    Decode a base58check token as parseBase58<T>(TokenType, ...) does.
+    Returns (payload, "") on success or (None, reason). Decoding is
+    table-driven: one bytes.translate maps the string to base58 digits.
+    """
+    if not isinstance(token, str):
+        return None, "not a string"
+    try:
+        digits = token.encode("ascii").translate(_B58_DIGITS)
+    except UnicodeEncodeError:
+        return None, "invalid character"
+    if b"\xff" in digits:
+        return None, "invalid character"
+
+    n = 0
+    for d in digits:
+        n = n * 58 + d
+    # Each leading 'r' is one leading zero byte; the rest is the big-endian value
+    total = 1 + size + 4
+    zeros = len(digits) - len(digits.lstrip(b"\x00"))
+    if zeros + (n.bit_length() + 7) // 8 != total:
+        return None, "wrong length"
+    raw = n.to_bytes(total, "big")
+    if raw[0] != token_type:
+        return None, "wrong token type"
+    if hashlib.sha256(hashlib.sha256(raw[:-4]).digest()).digest()[:4] != raw[-4:]:
+        return None, "bad checksum"
+    return raw[1:-4], ""
+
+def check_account_address(address: Any) -> str:
+    """Decode a classic address as parseBase58<AccountID> does; "" if valid, else a reason."""
+    _, reason = decode_base58_token(address, ACCOUNT_ID_TYPE, ACCOUNT_TOKEN_SIZE - 5)
+    return "not an account address" if reason == "wrong token type" else reason
+
+def _check_address_chunk(chunk: List[Tuple[int, Any]]) -> List[Tuple[int, Any, str]]:
+    """Worker: validate (index, address) pairs and return the bad ones."""
+    bad = []
+    for index, address in chunk:
+        reason = check_account_address(address)
+        if reason:
+            bad.append((index, address, reason))
+    return bad
+
+class InvalidEntriesError(ValueError):
+    """The exclusion list has entries the fetcher would drop or alter."""
+
+    def __init__(self, problems: List[Tuple[str, Any, str]]):
+        super().__init__(f"{len(problems)} invalid entr{'y' if len(problems) == 1 else 'ies'}")
+        self.problems = problems
+
+class AddressValidator:
+    """
+    Batch validation of exclusion addresses.
+
+    Addresses are queued with add() and checked VALIDATE_CHUNK_SIZE at a time
+    in a process pool, with a bounded number of chunks in flight so streamed
+    input stays memory-bounded. Lists that fit in one chunk are checked in
+    this process. finish() returns every problem as (location, value, reason),
+    ordered by position in the list.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = VALIDATE_CHUNK_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._chunk: List[Tuple[int, Any]] = []
+        self._bad: List[Tuple[int, Any, str]] = []
+        self._pending = collections.deque()
+        self._pool = None
+
+    def add(self, index: int, address: Any):
+        self._chunk.append((index, address))
+        self.count += 1
+        if len(self._chunk) >= self.chunk_size:
+            self._submit()
+
+    def check_entry(self, index: int, entry: Any):
+        """Queue one element of the "exclusions" array."""
+        if not isinstance(entry, dict):
+            self._bad.append((index, entry, f"entry is not an object (nodes would sign {ZERO_ACCOUNT})"))
+        elif "address" not in entry:
+            self._bad.append((index, None, f"missing address (nodes would sign {ZERO_ACCOUNT})"))
+        else:
+            self.add(index, entry["address"])
+
+    def check_issuer(self, header: Dict[str, Any]):
+        # Sorted ahead of every exclusion entry
+        if "issuer_address" not in header:
+            self._bad.append((-1, None, f"missing (nodes would sign {ZERO_ACCOUNT})"))
+            return
+        reason = check_account_address(header["issuer_address"])
+        if reason:
+            self._bad.append((-1, header["issuer_address"], f"{reason} (nodes reject the whole list)"))
+
+    def _submit(self):
+        chunk, self._chunk = self._chunk, []
+        if self.workers <= 1:
+            self._bad.extend(_check_address_chunk(chunk))
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._pending.append(self._pool.submit(_check_address_chunk, chunk))
+        while len(self._pending) > 2 * self.workers:
+            self._bad.extend(self._pending.popleft().result())
+
+    def finish(self) -> List[Tuple[str, Any, str]]:
+        if self._chunk:
+            if self._pool is None:
+                self._bad.extend(_check_address_chunk(self._chunk))
+                self._chunk = []
+            else:
+                self._submit()
+        try:
+            while self._pending:
+                self._bad.extend(self._pending.popleft().result())
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        self._bad.sort(key=lambda bad: bad[0])
+        return [
+            ("issuer_address" if i < 0 else f"exclusions[{i}]", value, reason)
+            for i, value, reason in self._bad
+        ]
+
+def validate_exclusion_list(exclusion_data: Dict[str, Any], workers: Optional[int] = None) -> List[Tuple[str, Any, str]]:
+    """Validate the issuer and every exclusion address; returns all problems."""
+    validator = AddressValidator(workers)
+    validator.check_issuer(exclusion_data)
+    exclusions = exclusion_data.get("exclusions")
+    if isinstance(exclusions, list):
+        for i, entry in enumerate(exclusions):
+            validator.check_entry(i, entry)
+    return validator.finish()
+
 def create_signing_message(exclusion_data: Dict[str, Any]) -> str:
     """
     Create the canonical message for signing, matching the C++ implementation
@@ -82,9 +299,6 @@ def derive_public_key_ed25519(secret_key_hex: str) -> str:
     """
     Derive Ed25519 public key from secret key and return as base58 node public key
     """
-    # XRPL uses a custom base58 alphabet (Ripple alphabet)
-    RIPPLE_ALPHABET = b'rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz'
-
     # Convert hex secret key to bytes
     secret_key_bytes = bytes.fromhex(secret_key_hex)
 
@@ -121,14 +335,17 @@ def sign_exclusion_list(exclusion_data: Dict[str, Any], secret_key_hex: str, alg
     Sign an exclusion list and add the signature to the JSON
     """
     # Create the message to sign
-    message = create_signing_message(exclusion_data)
+    with timings.stage("message"):
+        message = create_signing_message(exclusion_data)
+    timings.add_bytes("message", len(message))
 
-    print(f"Message to sign:\n{message}")
     print(f"Message length: {len(message)} bytes")
+    print(f"Message SHA-256: {hashlib.sha256(message.encode('utf-8')).hexdigest()}")
 
     if algorithm == "ed25519":
         # Sign the message
-        signature_hex = sign_message_ed25519(message, secret_key_hex)
+        with timings.stage("sign", len(message)):
+            signature_hex = sign_message_ed25519(message, secret_key_hex)
 
         # Derive public key
         public_key_base58 = derive_public_key_ed25519(secret_key_hex)
@@ -147,23 +364,761 @@ def sign_exclusion_list(exclusion_data: Dict[str, Any], secret_key_hex: str, alg
 
     return exclusion_data
 
+class AddressSorter:
+    """
+    Bounded-memory external merge sort for address strings.
+
+    Addresses are buffered up to `run_size` at a time; each full run is
+    sorted and spilled to a temporary file, one address per line. sorted()
+    merges the spilled runs with the final in-memory run. Python compares
+    str by code point, which for UTF-8 is the same order as the bytewise
+    std::sort in RemoteExclusionListFetcher::verifySignature.
+    """
+
+    def __init__(self, run_size: int = DEFAULT_RUN_SIZE, tmp_dir: Optional[str] = None):
+        if run_size < 1:
+            raise ValueError("run size must be at least 1")
+        self.run_size = run_size
+        self.tmp_dir = tmp_dir
+        self.count = 0
+        self.nbytes = 0
+        self._run: List[str] = []
+        self._files = []
+
+    def add(self, address: str):
+        if "\n" in address:
+            raise ValueError("address contains a newline")
+        self._run.append(address)
+        self.count += 1
+        self.nbytes += len(address.encode("utf-8"))
+        if len(self._run) >= self.run_size:
+            self._spill()
+
+    def _spill(self):
+        self._run.sort()
+        f = tempfile.TemporaryFile("w+", encoding="utf-8", dir=self.tmp_dir)
+        f.writelines(address + "\n" for address in self._run)
+        f.seek(0)
+        self._files.append(f)
+        self._run = []
+
+    def sorted(self) -> Iterator[str]:
+        """Yield every address in sorted order (consumes the sorter)."""
+        self._run.sort()
+        if not self._files:
+            yield from self._run
+            return
+        runs = [(line[:-1] for line in f) for f in self._files]
+        runs.append(iter(self._run))
+        yield from heapq.merge(*runs)
+
+    @property
+    def runs(self) -> int:
+        return len(self._files) + (1 if self._run else 0)
+
+    def close(self):
+        for f in self._files:
+            f.close()
+        self._files = []
+        self._run = []
+
+def build_signing_message_buffer(header: Dict[str, Any], sorter: AddressSorter) -> bytearray:
+    """
+    Assemble the canonical message into one preallocated buffer:
+    "v1:" + version + ":" + timestamp + ":" + issuer_address + ":" followed by
+    every sorted address terminated by "\n" (same bytes as create_signing_message).
+    """
+    version = header.get("version", "1.0")
+    timestamp = header.get("timestamp", "")
+    issuer_address = header.get("issuer_address", "")
+    prefix = f"v1:{version}:{timestamp}:{issuer_address}:".encode("utf-8")
+
+    size = len(prefix) + sorter.nbytes + sorter.count
+    buf = bytearray(size)
+    view = memoryview(buf)
+    view[:len(prefix)] = prefix
+    pos = len(prefix)
+    for address in sorter.sorted():
+        data = address.encode("utf-8")
+        end = pos + len(data)
+        view[pos:end] = data
+        view[end] = 0x0A
+        pos = end + 1
+    view.release()
+    if pos != size:
+        raise RuntimeError("message buffer size mismatch")
+    return buf
+
+def sign_buffer_ed25519(message, secret_key_hex: str) -> str:
+    """
+    Ed25519-sign a bytes-like message (e.g. the buffer built by
+    build_signing_message_buffer) with libsodium. PyNaCl needs immutable
+    bytes, so the message is copied once. The signature is identical to
+    sign_message_ed25519.
+    """
+    secret_key_bytes = bytes.fromhex(secret_key_hex)
+    if len(secret_key_bytes) != 32:
+        raise ValueError(f"Ed25519 secret key must be 32 bytes, got {len(secret_key_bytes)}")
+    return nacl.signing.SigningKey(secret_key_bytes).sign(bytes(message)).signature.hex()
+
+def sign_exclusion_list_stream(
+    input_path: str,
+    output_path: str,
+    secret_key_hex: str,
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmp_dir: Optional[str] = None,
+    chunk_size: int = 1 << 16,
+    validate: bool = True,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Sign an exclusion list file without loading it whole.
+
+    One pass over the input collects the header fields and the addresses
+    (into an AddressSorter, and an AddressValidator unless validate is
+    False) while copying every top-level member except an old "signature"
+    to a temporary output file; the signature is appended once the message
+    has been built and signed. Returns the signature object and raises
+    InvalidEntriesError, leaving no output, if any entry is invalid.
+    """
+    header: Dict[str, Any] = {}
+    sorter = AddressSorter(run_size, tmp_dir)
+    validator = AddressValidator(workers) if validate else None
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    tmp_fd, tmp_path = tempfile.mkstemp(prefix=".exclusions-", dir=out_dir)
+    try:
+        out = os.fdopen(tmp_fd, "w", encoding="utf-8")
+        with out, open(input_path, "r", encoding="utf-8") as src:
+            reader = JSONReader(iter(lambda: src.read(chunk_size), ""))
+            first = True
+            with timings.stage("read"):
+                for key in reader.members():
+                    if key == "signature":
+                        reader.value()
+                        continue
+                    out.write("{\n" if first else ",\n")
+                    first = False
+                    out.write(f"  {json.dumps(key)}: ")
+                    if key == "exclusions" and reader.peek() == "[":
+                        out.write("[")
+                        for i, _ in enumerate(reader.elements()):
+                            entry = reader.value()
+                            if validator is not None:
+                                validator.check_entry(i, entry)
+                            if isinstance(entry, dict) and "address" in entry:
+                                sorter.add(str(entry["address"]))
+                            out.write(",\n    " if i else "\n    ")
+                            out.write(json.dumps(entry))
+                        out.write("\n  ]")
+                    else:
+                        value = reader.value()
+                        if key in ("version", "timestamp", "issuer_address"):
+                            header[key] = value
+                        out.write(json.dumps(value))
+                if reader.peek() != "":
+                    raise ValueError("trailing data after exclusion list")
+                timings.add_bytes("read", src.tell())
+
+            if validator is not None:
+                with timings.stage("validate"):
+                    validator.check_issuer(header)
+                    problems = validator.finish()
+                if problems:
+                    raise InvalidEntriesError(problems)
+
+            with timings.stage("message"):
+                message = build_signing_message_buffer(header, sorter)
+            timings.add_bytes("message", len(message))
+            print(f"Addresses: {sorter.count} (sorted in {max(sorter.runs, 1)} run(s))")
+            sorter.close()
+
+            print(f"Message length: {len(message)} bytes")
+            print(f"Message SHA-256: {hashlib.sha256(message).hexdigest()}")
+
+            with timings.stage("sign", len(message)):
+                signature = {
+                    "algorithm": "ed25519",
+                    "public_key": derive_public_key_ed25519(secret_key_hex),
+                    "signature": sign_buffer_ed25519(message, secret_key_hex),
+                }
+            del message
+
+            print(f"Public key (base58): {signature['public_key']}")
+            print(f"Signature (hex): {signature['signature']}")
+
+            with timings.stage("write"):
+                out.write("{\n" if first else ",\n")
+                out.write(f'  "signature": {json.dumps(signature)}\n}}\n')
+                timings.add_bytes("write", out.tell())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if validator is not None:
+            validator.finish()
+        sorter.close()
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return signature
+
+def _as_string(value: Any) -> str:
+    """Json::Value::asString(): scalars convert, arrays and objects throw."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return f"{value:.6f}"  # std::to_string(double)
+    raise ValueError("Type is not convertible to string")
+
+def _member(obj: Any, key: str) -> Any:
+    """json[key] as the fetcher reads it: missing members (and non-objects) give null."""
+    return obj.get(key) if isinstance(obj, dict) else None
+
+def parse_as_node(exclusion_data: Any) -> Tuple[Tuple[str, str, str], List[Tuple[str, str, str]], int]:
+    """
+    Read a list the way RemoteExclusionListFetcher::parseExclusionList does:
+    invalid addresses are dropped, entries without an address (or that are
+    not objects) become the zero account, and an invalid issuer rejects the
+    list (ValueError). Returns ((version, timestamp, issuer),
+    [(address, reason, date_added), ...], dropped_entries).
+    """
+    version = _as_string(_member(exclusion_data, "version"))
+    timestamp = _as_string(_member(exclusion_data, "timestamp"))
+    issuer = ZERO_ACCOUNT
+    if isinstance(exclusion_data, dict) and "issuer_address" in exclusion_data:
+        issuer = _as_string(exclusion_data["issuer_address"])
+        if check_account_address(issuer):
+            raise ValueError("invalid issuer address")
+
+    entries = []
+    dropped = 0
+    exclusions = _member(exclusion_data, "exclusions")
+    if isinstance(exclusions, list):
+        for entry in exclusions:
+            address = ZERO_ACCOUNT
+            if isinstance(entry, dict) and "address" in entry:
+                address = _as_string(entry["address"])
+                if check_account_address(address):
+                    dropped += 1
+                    continue
+            entries.append((address, _as_string(_member(entry, "reason")), _as_string(_member(entry, "date_added"))))
+    return (version, timestamp, issuer), entries, dropped
+
+def rebuild_signing_message(exclusion_data: Any) -> Tuple[bytes, int, int]:
+    """
+    Rebuild the message RemoteExclusionListFetcher::verifySignature checks
+    (see parse_as_node). Returns (message, signed_entries, dropped_entries).
+    """
+    (version, timestamp, issuer), entries, dropped = parse_as_node(exclusion_data)
+    # Valid base58 addresses are ASCII, so str order is std::sort's byte order
+    addresses = sorted(address for address, _, _ in entries)
+    body = "".join(address + "\n" for address in addresses)
+    message = f"v1:{version}:{timestamp}:{issuer}:{body}".encode("utf-8")
+    return message, len(addresses), dropped
+
+def snapshot_hash(message: bytes) -> str:
+    """SHA-512-Half of a list's signing message, as nodes record it (uppercase hex)."""
+    return hashlib.sha512(message).digest()[:32].hex().upper()
+
+def create_delta(base_data: Any, new_data: Any) -> Dict[str, Any]:
+    """
+    Build the (unsigned) delta that takes a node holding the signed list
+    `base_data` to `new_data`. Entries whose reason or date changed are
+    removed and re-added so nodes pick up the new metadata.
+    """
+    base_message, _, _ = rebuild_signing_message(base_data)
+    new_message, _, _ = rebuild_signing_message(new_data)
+    _, base_entries, _ = parse_as_node(base_data)
+    (version, timestamp, issuer), new_entries, _ = parse_as_node(new_data)
+
+    # getExclusionReasons() keeps the last entry for a repeated address
+    base = {address: (reason, date) for address, reason, date in base_entries}
+    new = {address: (reason, date) for address, reason, date in new_entries}
+    removed = sorted(address for address, meta in base.items() if new.get(address) != meta)
+    added = [
+        {"address": address, "reason": new[address][0], "date_added": new[address][1]}
+        for address in sorted(address for address, meta in new.items() if base.get(address) != meta)
+    ]
+    return {
+        "type": "delta",
+        "version": version,
+        "timestamp": timestamp,
+        "issuer_address": issuer,
+        "base_hash": snapshot_hash(base_message),
+        "snapshot_hash": snapshot_hash(new_message),
+        "added": added,
+        "removed": removed,
+    }
+
+def create_delta_message(delta: Dict[str, Any]) -> str:
+    """
+    The message RemoteExclusionListFetcher::applyDelta verifies: both
+    snapshot hashes, the new header, then "+address" and "-address" lines,
+    each group sorted.
+    """
+    added = sorted(entry["address"] for entry in delta["added"])
+    removed = sorted(delta["removed"])
+    body = "".join("+" + address + "\n" for address in added) + "".join("-" + address + "\n" for address in removed)
+    return (
+        f"v1-delta:{delta['base_hash']}:{delta['snapshot_hash']}:"
+        f"{delta['version']}:{delta['timestamp']}:{delta['issuer_address']}:{body}"
+    )
+
+def rebuild_delta_message(delta_data: Any) -> Tuple[bytes, int, int]:
+    """
+    Rebuild the message applyDelta verifies. Unlike full lists, any invalid
+    address or hash rejects the whole delta (ValueError).
+    Returns (message, added, removed).
+    """
+    (version, timestamp, issuer), _, _ = parse_as_node(delta_data)
+    hashes = []
+    for key in ("base_hash", "snapshot_hash"):
+        value = _as_string(_member(delta_data, key))
+        if len(value) != 64 or any(c not in "0123456789abcdefABCDEF" for c in value):
+            raise ValueError(f"{key} is not a 256-bit hex hash")
+        hashes.append(value.upper())
+    added = _member(delta_data, "added")
+    removed = _member(delta_data, "removed")
+    if not isinstance(added, list) or not isinstance(removed, list):
+        raise ValueError("added and removed must be arrays")
+    added = [_as_string(_member(entry, "address")) for entry in added]
+    removed = [_as_string(address) for address in removed]
+    for address in added + removed:
+        if check_account_address(address):
+            raise ValueError(f"invalid address {address!r}")
+    delta = {
+        "base_hash": hashes[0], "snapshot_hash": hashes[1], "version": version, "timestamp": timestamp,
+        "issuer_address": issuer, "added": [{"address": address} for address in added], "removed": removed,
+    }
+    return create_delta_message(delta).encode("utf-8"), len(added), len(removed)
+
+def write_etag_sidecar(path: str) -> str:
+    """
+    Write <path>.etag holding a strong ETag for the published bytes (the
+    quoted SHA-256 of the file) so static hosting can serve it and nodes
+    can poll with If-None-Match. Returns the ETag.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    etag = f'"{digest.hexdigest()}"'
+    with open(path + ".etag", "w") as f:
+        f.write(etag + "\n")
+    return etag
+
+def _compressor(fmt: str, out):
+    """A writable stream compressing into the binary file `out`."""
+    if fmt == "gz":
+        import gzip
+        # mtime=0 and no file name keep the .gz byte-identical across runs
+        return gzip.GzipFile(filename="", mode="wb", fileobj=out, compresslevel=9, mtime=0)
+    if fmt == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd output needs the 'zstandard' package: pip3 install zstandard") from e
+        return zstandard.ZstdCompressor(level=19).stream_writer(out, closefd=False)
+    if fmt == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ImportError("lz4 output needs the 'lz4' package: pip3 install lz4") from e
+        return lz4.frame.LZ4FrameFile(out, mode="wb", compression_level=lz4.frame.COMPRESSIONLEVEL_MINHC)
+    raise ValueError(f"Unsupported compression format: {fmt}")
+
+def write_compressed_siblings(path: str, formats: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Write precompressed siblings of a published file (<path>.gz, .zst,
+    .lz4) for hosts that serve them with Content-Encoding, each with its
+    own ETag sidecar. The signature lives inside the JSON, so it covers the
+    canonical message whatever encoding the bytes travel in.
+    Returns [(path, etag), ...].
+    """
+    written = []
+    for fmt in formats:
+        target = path + COMPRESSED_SUFFIXES[fmt]
+        with timings.stage("compress"), open(path, "rb") as src, open(target, "wb") as out:
+            with _compressor(fmt, out) as stream:
+                for block in iter(lambda: src.read(1 << 20), b""):
+                    stream.write(block)
+            timings.add_bytes("compress", src.tell())
+        written.append((target, write_etag_sidecar(target)))
+    return written
+
+def remove_stale_delta(path: str):
+    """
+    Delete a delta (and its ETag sidecar) left by an earlier run. It is
+    based on an older snapshot than the list just written, and a host that
+    keeps serving it answers nodes' conditional polls with 304.
+    """
+    for target in (path, path + ".etag"):
+        if os.path.exists(target):
+            os.remove(target)
+            print(f"Removed stale {target}")
+
+def _report_compressed(path: str, formats: List[str]):
+    size = os.path.getsize(path)
+    for target, etag in write_compressed_siblings(path, formats):
+        print(f"Wrote {target} ({os.path.getsize(target) * 100 / max(size, 1):.1f}% of {size} bytes, ETag: {etag})")
+
+def sign_delta(delta: Dict[str, Any], secret_key_hex: str) -> Dict[str, Any]:
+    """Add an Ed25519 signature over create_delta_message(delta)."""
+    with timings.stage("delta"):
+        message = create_delta_message(delta)
+        delta["signature"] = {
+            "algorithm": "ed25519",
+            "public_key": derive_public_key_ed25519(secret_key_hex),
+            "signature": sign_message_ed25519(message, secret_key_hex),
+        }
+    print(f"Delta: +{len(delta['added'])} -{len(delta['removed'])}, {delta['base_hash'][:16]}... -> {delta['snapshot_hash'][:16]}...")
+    return delta
+
+def _low_s_der(signature: bytes) -> Optional[bytes]:
+    """
+    Parse a strict DER ECDSA signature and return it with S normalized to
+    the low half, or None if it is not DER or R/S are out of range (what
+    ecdsaCanonicality rejects even without mustBeFullyCanonical).
+    """
+    from secp256k1_backend import SECP256K1_ORDER
+
+    if len(signature) < 8 or len(signature) > 72 or signature[0] != 0x30 or signature[1] != len(signature) - 2:
+        return None
+    values = []
+    pos = 2
+    for _ in range(2):
+        if pos + 2 > len(signature) or signature[pos] != 0x02:
+            return None
+        length = signature[pos + 1]
+        item = signature[pos + 2:pos + 2 + length]
+        if length == 0 or len(item) != length or item[0] & 0x80:
+            return None
+        if length > 1 and item[0] == 0 and not item[1] & 0x80:
+            return None
+        values.append(int.from_bytes(item, "big"))
+        pos += 2 + length
+    r, s = values
+    if pos != len(signature) or not (0 < r < SECP256K1_ORDER and 0 < s < SECP256K1_ORDER):
+        return None
+    s = min(s, SECP256K1_ORDER - s)
+
+    def der_int(x: int) -> bytes:
+        data = x.to_bytes((x.bit_length() + 8) // 8, "big")
+        return b"\x02" + bytes([len(data)]) + data
+
+    body = der_int(r) + der_int(s)
+    return b"\x30" + bytes([len(body)]) + body
+
+def verify_message_signature(algorithm: str, message: bytes, signature_hex: str, public_key: bytes) -> str:
+    """
+    verifyEd25519Signature / verifySecp256k1Signature: returns "" when the
+    signature is valid, otherwise the reason it is not.
+    """
+    try:
+        signature = bytes.fromhex(signature_hex)
+    except ValueError:
+        return "signature is not hex"
+
+    if algorithm == "ed25519":
+        # ripple::verify(..., mustBeFullyCanonical=true) picks the scheme from the key
+        if len(signature) != 64:
+            return "invalid Ed25519 signature size"
+        from xrpl_manifest import verify_signature
+        return "" if verify_signature(public_key, message, signature) else "bad signature"
+
+    if algorithm == "secp256k1":
+        # verifyDigest(pubkey, sha512Half(message), sig, false): high S is accepted
+        if public_key[0] not in (0x02, 0x03):
+            return "public key is not secp256k1"
+        normalized = _low_s_der(signature)
+        if normalized is None:
+            return "signature is not canonical DER"
+        from secp256k1_backend import get_backend
+        try:
+            backend = get_backend()
+        except ImportError as e:
+            return f"cannot verify secp256k1 signatures: {e}"
+        digest = hashlib.sha512(message).digest()[:32]
+        return "" if backend.verify_digest(public_key, digest, normalized) else "bad signature"
+
+    return f"unsupported algorithm '{algorithm}'"
+
+def _diagnose_prehash(algorithm: str, message: bytes, signature_hex: str, public_key: bytes) -> Optional[str]:
+    """Name the digest a failed signature was made over, if it is a common one."""
+    for name in ("sha256", "sha512"):
+        digest = hashlib.new(name, message).digest()
+        for variant, data in ((name, digest), (f"{name} hex", digest.hex().encode("ascii"))):
+            if not verify_message_signature(algorithm, data, signature_hex, public_key):
+                return variant
+    return None
+
+def verify_exclusion_file(path: str, expected_public_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Check one signed exclusion list the way a node fetching it would.
+    `expected_public_key` is the pubkey configured for its source
+    (url|pubkey); without it only the embedded key is checked.
+    """
+    report: Dict[str, Any] = {"file": path, "ok": False, "reason": "", "warnings": []}
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        exclusion_data = json.loads(raw)
+    except (OSError, ValueError) as e:
+        report["reason"] = f"unreadable: {e}"
+        return report
+
+    is_delta = _member(exclusion_data, "type") == "delta"
+    try:
+        if is_delta:
+            message, added, removed = rebuild_delta_message(exclusion_data)
+            report.update({"added": added, "removed": removed, "snapshot_hash": exclusion_data["snapshot_hash"].upper()})
+            dropped = 0
+        else:
+            message, signed, dropped = rebuild_signing_message(exclusion_data)
+            report.update({"entries": signed, "dropped": dropped, "snapshot_hash": snapshot_hash(message)})
+    except ValueError as e:
+        report["reason"] = f"rejected by {'applyDelta' if is_delta else 'parseExclusionList'}: {e}"
+        return report
+    report.update({
+        "message_bytes": len(message),
+        "message_sha256": hashlib.sha256(message).hexdigest(),
+    })
+    if dropped:
+        report["warnings"].append(f"{dropped} invalid address(es) are dropped by nodes and not covered by the signature")
+
+    sig = _member(exclusion_data, "signature")
+    if not isinstance(exclusion_data, dict) or "signature" not in exclusion_data:
+        report["reason"] = "no signature"
+        return report
+    try:
+        algorithm = _as_string(_member(sig, "algorithm"))
+        public_key_str = _as_string(_member(sig, "public_key"))
+        signature_hex = _as_string(_member(sig, "signature"))
+    except ValueError as e:
+        report["reason"] = f"malformed signature object: {e}"
+        return report
+    report["algorithm"] = algorithm
+    report["public_key"] = public_key_str
+
+    if isinstance(sig, dict) and "message_hash" in sig:
+        report["warnings"].append(
+            f"signature.message_hash ({sig['message_hash']!r}) is ignored by nodes: "
+            "ed25519 signs the raw message, secp256k1 its SHA-512-Half"
+        )
+
+    if expected_public_key is None:
+        report["warnings"].append("no configured public key; only the embedded key was checked")
+    elif public_key_str != expected_public_key:
+        report["reason"] = "public key mismatch with the configured source"
+        return report
+
+    public_key, reason = decode_base58_token(public_key_str, NODE_PUBLIC_TYPE, NODE_PUBLIC_SIZE)
+    if public_key is None or public_key[0] not in (0xED, 0x02, 0x03):
+        report["reason"] = "invalid public key format"
+        return report
+
+    reason = verify_message_signature(algorithm, message, signature_hex, public_key)
+    if reason == "bad signature":
+        prehash = _diagnose_prehash(algorithm, message, signature_hex, public_key)
+        if prehash:
+            reason += f" (it was made over the {prehash} digest of the message; nodes verify the message itself)"
+    report["reason"] = reason
+    report["ok"] = not reason
+    return report
+
+def parse_sources(lines: Iterable[str]) -> List[Tuple[str, str]]:
+    """Parse url|pubkey lines with the checks Config applies to [validator_exclusions_sources]."""
+    sources = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        pos = line.find("|")
+        if pos <= 0 or pos >= len(line) - 1:
+            raise ValueError(f"invalid source format (expected url|pubkey): {line}")
+        url, pubkey = line[:pos], line[pos + 1:]
+        if not (url.startswith("http://") or url.startswith("https://")):
+            raise ValueError(f"URL must start with http:// or https://: {url}")
+        sources.append((url, pubkey))
+    return sources
+
+def read_config_sources(path: str) -> List[Tuple[str, str]]:
+    """The [validator_exclusions_sources] section of a postfiatd config file."""
+    lines = []
+    in_section = False
+    with open(path) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("[") and stripped.endswith("]"):
+                in_section = stripped == "[validator_exclusions_sources]"
+            elif in_section:
+                lines.append(stripped)
+    return parse_sources(lines)
+
+def _source_key(path: str, sources: List[Tuple[str, str]]) -> Tuple[Optional[str], Optional[str]]:
+    """Pick the source a local file was published to: same file name as the URL, or the only source."""
+    name = os.path.basename(path)
+    matches = [(url, key) for url, key in sources if url.rstrip("/").rsplit("/", 1)[-1] == name]
+    if len(matches) == 1:
+        return matches[0]
+    if len(sources) == 1:
+        return sources[0]
+    return None, None
+
+def verify_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sign_exclusion_list.py verify",
+        description="Verify signed exclusion lists offline exactly as RemoteExclusionListFetcher does",
+    )
+    parser.add_argument("files", nargs="+", help="Signed exclusion list JSON files")
+    parser.add_argument("--pubkey", help="Expected signer (the pubkey half of url|pubkey) for every file")
+    parser.add_argument("--source", action="append", default=[], metavar="URL|PUBKEY", help="A configured source; files are matched to sources by the URL's file name (repeatable)")
+    parser.add_argument("--config", help="Read sources from the [validator_exclusions_sources] section of a postfiatd config")
+    parser.add_argument("--workers", type=int, default=None, help="Processes used to verify files (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print one JSON report per file")
+    args = parser.parse_args(argv)
+
+    try:
+        sources = parse_sources(args.source)
+        if args.config:
+            sources += read_config_sources(args.config)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    expected = []
+    unmatched = set()
+    for path in args.files:
+        if args.pubkey:
+            expected.append(args.pubkey)
+            continue
+        url, key = _source_key(path, sources) if sources else (None, None)
+        if sources and key is None:
+            unmatched.add(path)
+        expected.append(key)
+
+    workers = args.workers or min(len(args.files), os.cpu_count() or 1)
+    if workers <= 1 or len(args.files) == 1:
+        reports = list(map(verify_exclusion_file, args.files, expected))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(verify_exclusion_file, args.files, expected))
+
+    for report in reports:
+        if report["file"] in unmatched:
+            report["ok"] = False
+            report["reason"] = "no configured source matches this file"
+            report["warnings"] = [w for w in report["warnings"] if not w.startswith("no configured public key")]
+        if args.json:
+            print(json.dumps(report))
+            continue
+        status = "OK" if report["ok"] else f"FAILED ({report['reason']})"
+        print(f"{report['file']}: {status}")
+        if "entries" in report:
+            print(f"  {report['entries']} entries, message {report['message_bytes']} bytes, sha256 {report['message_sha256']}")
+        elif "added" in report:
+            print(f"  delta +{report['added']} -{report['removed']}, message {report['message_bytes']} bytes, sha256 {report['message_sha256']}")
+        if "snapshot_hash" in report:
+            print(f"  snapshot {report['snapshot_hash']}")
+        for warning in report["warnings"]:
+            print(f"  warning: {warning}")
+    return 0 if all(report["ok"] for report in reports) else 1
+
+def _compress_formats(value: str) -> List[str]:
+    formats = [fmt.strip() for fmt in value.split(",") if fmt.strip()]
+    if formats == ["none"]:
+        return []
+    for fmt in formats:
+        if fmt not in COMPRESSED_SUFFIXES:
+            raise argparse.ArgumentTypeError(f"unknown format '{fmt}' (choose from gz, zstd, lz4, none)")
+        # Fail before signing rather than after, if a compressor is missing
+        try:
+            _compressor(fmt, io.BytesIO()).close()
+        except ImportError as e:
+            raise argparse.ArgumentTypeError(str(e))
+    return formats
+
 def main():
-    parser = argparse.ArgumentParser(description="Sign an exclusion list JSON file")
+    if len(sys.argv) > 1 and sys.argv[1] == "verify":
+        sys.exit(verify_main(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description="Sign an exclusion list JSON file (or 'verify' signed files)")
     parser.add_argument("--secret-key", required=True, help="Secret key in hex format")
     parser.add_argument("--input", required=True, help="Input JSON file path")
     parser.add_argument("--output", required=True, help="Output signed JSON file path")
     parser.add_argument("--algorithm", default="ed25519", choices=["ed25519"], help="Signing algorithm (currently only ed25519 supported)")
+    parser.add_argument("--no-validate", action="store_true", help="Skip base58check validation of the issuer and exclusion addresses")
+    parser.add_argument("--workers", type=int, default=None, help="Processes used to validate addresses (default: CPU count)")
+    parser.add_argument("--stream", action="store_true", help="Stream the input and sort addresses externally (for very large lists)")
+    parser.add_argument("--run-size", type=int, default=DEFAULT_RUN_SIZE, help=f"With --stream: addresses sorted in memory per run before spilling to disk (default: {DEFAULT_RUN_SIZE})")
+    parser.add_argument("--tmp-dir", help="With --stream: directory for sorted runs (default: system temp dir)")
+    parser.add_argument("--compress", type=_compress_formats, default=["gz"], metavar="FORMATS", help="Comma-separated precompressed siblings to write: gz, zstd, lz4 or none (default: gz)")
+    parser.add_argument("--delta-from", metavar="PREVIOUS", help="Also write a signed delta from the previously published signed list PREVIOUS")
+    parser.add_argument("--delta-output", metavar="FILE", help="Where to write the delta, or the stale delta to delete without --delta-from (default: OUTPUT.delta, the URL nodes poll)")
+    parser.add_argument("--timings-json", metavar="FILE", help="Write wall time, calls and bytes per stage to FILE as JSON")
+    parser.add_argument("--profile", metavar="PSTATS_FILE", help="Run under cProfile, dump pstats to PSTATS_FILE and print a summary to stderr")
 
     args = parser.parse_args()
 
+    try:
+        with profiled(args.profile):
+            run(args)
+    finally:
+        if args.profile:
+            print(timings.format(), file=sys.stderr)
+        if args.timings_json:
+            timings.write_json(args.timings_json, script="sign_exclusion_list.py")
+
+def print_problems(problems: List[Tuple[str, Any, str]]):
+    print(f"Error: {len(problems)} invalid entr{'y' if len(problems) == 1 else 'ies'}, nothing was signed:", file=sys.stderr)
+    for location, value, reason in problems:
+        shown = "" if value is None else f" {value!r}"
+        print(f"  {location}:{shown} {reason}", file=sys.stderr)
+
+def run(args):
+    if args.delta_from and args.stream:
+        print("Error: --delta-from is not supported with --stream", file=sys.stderr)
+        sys.exit(1)
+
+    if args.stream:
+        try:
+            sign_exclusion_list_stream(
+                args.input, args.output, args.secret_key, args.run_size, args.tmp_dir,
+                validate=not args.no_validate, workers=args.workers,
+            )
+        except InvalidEntriesError as e:
+            print_problems(e.problems)
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error signing exclusion list: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Successfully signed exclusion list and wrote to {args.output}")
+        print(f"ETag: {write_etag_sidecar(args.output)}")
+        _report_compressed(args.output, args.compress)
+        remove_stale_delta(args.delta_output or args.output + ".delta")
+        return
+
     # Read input JSON
     try:
-        with open(args.input, 'r') as f:
+        with timings.stage("read"), open(args.input, 'r') as f:
             exclusion_data = json.load(f)
+            timings.add_bytes("read", f.tell())
     except Exception as e:
         print(f"Error reading input file: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Validate every address before anything is signed
+    if not args.no_validate:
+        with timings.stage("validate"):
+            problems = validate_exclusion_list(exclusion_data, args.workers)
+        if problems:
+            print_problems(problems)
+            sys.exit(1)
+
     # Sign the exclusion list
     try:
         signed_data = sign_exclusion_list(exclusion_data, args.secret_key, args.algorithm)
@@ -173,12 +1128,31 @@ def main():
 
     # Write output JSON
     try:
-        with open(args.output, 'w') as f:
+        with timings.stage("write"), open(args.output, 'w') as f:
             json.dump(signed_data, f, indent=2)
+            timings.add_bytes("write", f.tell())
         print(f"Successfully signed exclusion list and wrote to {args.output}")
+        print(f"ETag: {write_etag_sidecar(args.output)}")
+        _report_compressed(args.output, args.compress)
     except Exception as e:
         print(f"Error writing output file: {e}", file=sys.stderr)
         sys.exit(1)
 
+    delta_output = args.delta_output or args.output + ".delta"
+    if not args.delta_from:
+        remove_stale_delta(delta_output)
+        return
+
+    try:
+        with timings.stage("read"), open(args.delta_from, 'r') as f:
+            base_data = json.load(f)
+        delta = sign_delta(create_delta(base_data, signed_data), args.secret_key)
+        with timings.stage("write"), open(delta_output, 'w') as f:
+            json.dump(delta, f, indent=2)
+    except Exception as e:
+        print(f"Error writing delta: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote delta to {delta_output} (ETag: {write_etag_sidecar(delta_output)})")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Lightweight per-stage timing and cProfile hooks for the signing scripts.
+
+generate_vl.py and sign_exclusion_list.py wrap each pipeline stage (token
+decode, manifest parse, blob build, hash, sign, write, ...) in
+StageTimer.stage(). A stage costs two perf_counter() calls and a few
+attribute updates, so the timers stay on in production runs and only
+--timings-json / --profile decide whether anything is reported.
+
+Stages may nest (building a blob parses any manifests it has not seen).
+Every stage therefore reports both its inclusive wall time and its self
+time with nested stages subtracted; self times add up to the timed total.
+
+Work done in worker processes is timed as a single stage in the parent.
+
+Usage:
+    python3 scripts/generate_vl.py config.json --timings-json timings.json
+    python3 scripts/generate_vl.py config.json --profile vl.pstats
+    python3 -m pstats vl.pstats
+"""
+
+import cProfile
+import contextlib
+import io
+import json
+import pstats
+import sys
+import time
+from typing import Dict, Iterator, Optional
+
+_clock = time.perf_counter
+
+
+class _Stage:
+    """Reusable context manager for one named stage."""
+
+    __slots__ = ("timer", "name", "calls", "wall", "self_time", "nbytes",
+                 "_start", "_child", "_depth")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self.timer = timer
+        self.name = name
+        self.calls = 0
+        self.wall = 0.0
+        self.self_time = 0.0
+        self.nbytes = 0
+        self._start = 0.0
+        self._child = 0.0
+        self._depth = 0
+
+    def __enter__(self):
+        self._depth += 1
+        if self._depth == 1:
+            self.timer._stack.append(self)
+            self._child = 0.0
+            self._start = _clock()
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth:
+            return False  # re-entered the same stage; the outer call times it
+        elapsed = _clock() - self._start
+        self.calls += 1
+        self.wall += elapsed
+        self.self_time += elapsed - self._child
+        stack = self.timer._stack
+        stack.pop()
+        if stack:
+            stack[-1]._child += elapsed
+        return False
+
+
+class StageTimer:
+    """Accumulates wall time, call counts and bytes per named stage."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._stages: Dict[str, _Stage] = {}
+        self._stack = []
+        self._started = _clock()
+
+    def stage(self, name: str, nbytes: int = 0) -> _Stage:
+        """Context manager timing one pass through `name`, processing `nbytes`."""
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = _Stage(self, name)
+        stage.nbytes += nbytes
+        return stage
+
+    def add_bytes(self, name: str, nbytes: int):
+        """Credit bytes to a stage once they are known (e.g. after it ran)."""
+        self.stage(name).nbytes += nbytes
+
+    def to_dict(self) -> dict:
+        total = _clock() - self._started
+        stages = {}
+        for name, s in self._stages.items():
+            if not s.calls:
+                continue
+            stages[name] = {
+                "calls": s.calls,
+                "wall_s": s.wall,
+                "self_s": s.self_time,
+                "bytes": s.nbytes,
+                "mb_per_s": s.nbytes / s.wall / 1e6 if s.wall and s.nbytes else None,
+            }
+        return {"total_s": total, "stages": stages}
+
+    def format(self) -> str:
+        report = self.to_dict()
+        lines = [f"{'stage':<16} {'calls':>8} {'wall (ms)':>11} {'self (ms)':>11} {'bytes':>14}"]
+        for name, s in report["stages"].items():
+            lines.append(
+                f"{name:<16} {s['calls']:>8} {s['wall_s'] * 1e3:>11.2f} "
+                f"{s['self_s'] * 1e3:>11.2f} {s['bytes']:>14,}"
+            )
+        lines.append(f"{'total':<16} {'':>8} {report['total_s'] * 1e3:>11.2f}")
+        return "\n".join(lines)
+
+    def write_json(self, path: str, **extra):
+        """Write the report (plus any `extra` top-level fields) as JSON."""
+        report = dict(extra)
+        report.update(self.to_dict())
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+@contextlib.contextmanager
+def profiled(pstats_path: Optional[str], top: int = 25) -> Iterator[None]:
+    """
+    Run the body under cProfile when `pstats_path` is set: raw stats are
+    dumped to that file and the `top` entries by cumulative time are
+    printed to stderr. A None path makes this a no-op.
+    """
+    if not pstats_path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(pstats_path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+        print(out.getvalue(), file=sys.stderr)
+        print(f"Profile written to {pstats_path}", file=sys.stderr)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Streaming, memory-bounded decoder for Validator List (VL) JSON files.
+
+decode_existing_vl() in generate_vl.py loads the whole document, then
+base64-decodes and parses every blob in memory. For auditing archives of
+historical VLs with large validator sets this module instead:
+
+    - reads the outer JSON in fixed-size chunks
+    - base64-decodes each blob string as it streams past
+    - parses the inner blob JSON incrementally, one validator at a time
+
+Peak memory is bounded by the chunk size plus the largest single
+validator entry, regardless of file size or how many files are read.
+
+Records are yielded lazily by iter_vl_records():
+
+    {"type": "validator", "blob": i, "validation_public_key": ..., "manifest": ...}
+    {"type": "blob", "blob": i, "sequence": ..., "expiration": ...,
+     "effective": ..., "validators": <count>, "signature": ...}
+    {"type": "vl", "version": ..., "public_key": ..., "manifest": ..., "blobs": <count>}
+
+Blob fields that appear after the validators array are only known once
+the blob record is emitted, so validator records carry just the blob index.
+
+Usage:
+    python3 scripts/generate_vl.py --decode --summary archive/*.json
+    python3 scripts/generate_vl.py --decode --jsonl archive/*.json > validators.jsonl
+"""
+
+import base64
+import binascii
+import codecs
+import json
+from typing import Callable, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class VLStreamError(ValueError):
+    """The VL document is not well-formed JSON of the expected shape."""
+
+
+class JSONReader:
+    """Pull-based JSON tokenizer over an iterator of text chunks."""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise VLStreamError(f"expected '{ch}', found '{self.peek() or 'EOF'}'")
+        self._pos += 1
+
+    def value(self):
+        """Decode one complete JSON value (kept small by the callers)."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise VLStreamError("truncated or invalid JSON value")
+            if not self._fill():
+                if self._eof and self._pos < len(self._buf):
+                    continue
+                raise VLStreamError("unexpected end of document")
+
+    def string_chunks(self) -> Iterator[str]:
+        """Stream the contents of a JSON string (only '\\/' escapes are expected)."""
+        self.expect('"')
+        while True:
+            end = self._buf.find('"', self._pos)
+            if end >= 0:
+                piece = self._buf[self._pos:end]
+                self._pos = end + 1
+                if piece:
+                    yield piece.replace("\\/", "/")
+                return
+            # Hold back a trailing backslash so an escape is never split
+            keep = 1 if self._buf.endswith("\\") else 0
+            piece = self._buf[self._pos:len(self._buf) - keep]
+            self._pos = len(self._buf) - keep
+            if piece:
+                yield piece.replace("\\/", "/")
+            if not self._fill():
+                raise VLStreamError("unterminated string")
+
+    def members(self) -> Iterator[str]:
+        """Iterate the keys of an object; the caller consumes each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise VLStreamError("object key is not a string")
+            self.expect(":")
+            yield key
+            ch = self.peek()
+            self._pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                raise VLStreamError(f"expected ',' or '}}', found '{ch or 'EOF'}'")
+
+    def elements(self) -> Iterator[None]:
+        """Iterate the elements of an array; the caller consumes each value."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            ch = self.peek()
+            self._pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise VLStreamError(f"expected ',' or ']', found '{ch or 'EOF'}'")
+
+
+def _base64_text(pieces: Iterator[str]) -> Iterator[str]:
+    """Base64-decode a stream of text pieces and decode the result as UTF-8."""
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    try:
+        for piece in pieces:
+            pending += piece
+            usable = len(pending) - len(pending) % 4
+            if usable:
+                text = utf8.decode(base64.b64decode(pending[:usable]))
+                pending = pending[usable:]
+                if text:
+                    yield text
+        if pending:
+            raise VLStreamError("base64 blob length is not a multiple of 4")
+        tail = utf8.decode(b"", final=True)
+        if tail:
+            yield tail
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise VLStreamError(f"bad blob encoding: {e}") from e
+
+
+def _stream_blob(reader: JSONReader, index: int, info: dict) -> Iterator[dict]:
+    """Yield validator records from one base64 blob, filling `info` with its fields."""
+    pieces = reader.string_chunks()
+    inner = JSONReader(_base64_text(pieces))
+    count = 0
+    for key in inner.members():
+        if key == "validators":
+            for _ in inner.elements():
+                entry = inner.value()
+                count += 1
+                record = {"type": "validator", "blob": index}
+                if isinstance(entry, dict):
+                    record.update(entry)
+                yield record
+        else:
+            info[key] = inner.value()
+    info["validators"] = count
+    # Drain anything after the inner object so the outer reader is in sync
+    for _ in pieces:
+        pass
+
+
+def iter_vl_records(
+    source: Union[str, "object"],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """
+    Lazily yield validator, blob and vl records from a VL file path or
+    text-mode file object, reading `chunk_size` characters at a time.
+    """
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_vl_records(f, chunk_size)
+        return
+
+    reader = JSONReader(iter(lambda: source.read(chunk_size), ""))
+    header = {"type": "vl"}
+    blobs = 0
+
+    for key in reader.members():
+        if key == "blobs_v2":
+            for _ in reader.elements():
+                info = {"type": "blob", "blob": blobs}
+                for entry_key in reader.members():
+                    if entry_key == "blob":
+                        yield from _stream_blob(reader, blobs, info)
+                    else:
+                        info[entry_key] = reader.value()
+                blobs += 1
+                yield info
+        elif key == "blob":
+            info = {"type": "blob", "blob": blobs}
+            yield from _stream_blob(reader, blobs, info)
+            header["_v1_blob"] = info
+            blobs += 1
+        else:
+            header[key] = reader.value()
+
+    if reader.peek() != "":
+        raise VLStreamError("trailing data after VL document")
+
+    # A v1 signature lives beside the blob, so emit its record once known
+    v1 = header.pop("_v1_blob", None)
+    if v1 is not None:
+        if "signature" in header:
+            v1["signature"] = header.pop("signature")
+        yield v1
+
+    header["blobs"] = blobs
+    yield header
+
+
+def summarize(
+    source: Union[str, "object"],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_validator: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """Stream one VL and return a compact summary (no validator list kept)."""
+    summary = {"blobs": []}
+    for record in iter_vl_records(source, chunk_size):
+        kind = record.pop("type")
+        if kind == "validator":
+            if on_validator is not None:
+                on_validator(record)
+        elif kind == "blob":
+            record.pop("signature", None)
+            summary["blobs"].append(record)
+        else:
+            record.pop("manifest", None)
+            record.pop("blobs", None)
+            summary.update(record)
+    return summary
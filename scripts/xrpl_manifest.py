@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Zero-copy parser for serialized XRPL manifests (STObject binary).
+
+A manifest binds a validator's or publisher's master key to an ephemeral
+signing key. The serialized form is a canonical STObject: a sequence of
+fields sorted by (type code, field code), each introduced by a field ID:
+
+    high nibble = type code, low nibble = field code
+    if either is 0, the next byte(s) contain the extended code
+
+Fields used by manifests (see Manifest.cpp, deserializeManifest):
+
+    sfVersion          UINT16  (1, 16)  optional, must be 0
+    sfSequence         UINT32  (2, 4)   required
+    sfPublicKey        VL      (7, 1)   required, master public key
+    sfSigningPubKey    VL      (7, 3)   optional, ephemeral public key
+    sfSignature        VL      (7, 6)   optional, ephemeral key signature
+    sfDomain           VL      (7, 7)   optional
+    sfMasterSignature  VL      (7, 18)  required, master key signature
+
+Parsing works on a memoryview and records (offset, length) pairs instead
+of slicing, so thousands of manifests can be parsed out of one
+concatenated buffer without per-field copies. Field values are only
+materialized when a property is read.
+
+Verification mirrors deserializeManifest() and Manifest::verify(): the
+ephemeral key's sfSignature and the master key's sfMasterSignature must
+both cover HashPrefix::manifest plus the signing fields. Results are kept
+in an LRU cache keyed by the SHA-512-Half of the manifest bytes, so
+re-checking an unchanged validator set costs one hash per manifest.
+
+Usage:
+    python3 scripts/xrpl_manifest.py <manifest_base64> [...]
+"""
+
+import base64
+import hashlib
+import re
+import struct
+import sys
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Serialized type codes (SField.h / STObject wire format)
+STI_UINT16 = 1
+STI_UINT32 = 2
+STI_UINT64 = 3
+STI_UINT128 = 4
+STI_UINT256 = 5
+STI_AMOUNT = 6
+STI_VL = 7
+STI_ACCOUNT = 8
+STI_OBJECT = 14
+STI_ARRAY = 15
+STI_UINT8 = 16
+STI_UINT160 = 17
+STI_UINT192 = 21
+
+# Fixed-width types; anything else must be length-prefixed or is rejected
+FIXED_WIDTHS = {
+    STI_UINT16: 2,
+    STI_UINT32: 4,
+    STI_UINT64: 8,
+    STI_UINT128: 16,
+    STI_UINT256: 32,
+    STI_UINT8: 1,
+    STI_UINT160: 20,
+    STI_UINT192: 24,
+}
+VL_ENCODED = (STI_VL, STI_ACCOUNT)
+
+# (type code, field code) -> Manifest attribute
+FIELDS = {
+    (STI_UINT16, 16): "version",
+    (STI_UINT32, 4): "sequence",
+    (STI_VL, 1): "public_key",
+    (STI_VL, 3): "signing_public_key",
+    (STI_VL, 6): "signature",
+    (STI_VL, 7): "domain",
+    (STI_VL, 18): "master_signature",
+}
+
+# Fields excluded from the signed serialization (SField notSigning)
+NOT_SIGNING = ((STI_VL, 6), (STI_VL, 18))
+
+# HashPrefix::manifest ('M', 'A', 'N', 0)
+HASH_PREFIX_MANIFEST = b"MAN\x00"
+
+# Sequence number of a master key revocation
+REVOKED_SEQUENCE = 0xFFFFFFFF
+
+# Big-endian Ed25519 subgroup order (ed25519Canonical in PublicKey.cpp)
+ED25519_ORDER = bytes.fromhex(
+    "1000000000000000000000000000000014DEF9DEA2F79CD65812631A5CF5D3ED"
+)
+
+# isProperlyFormedTomlDomain
+_DOMAIN_RE = re.compile(r"^((?!-)[a-zA-Z0-9-]{1,63}(?<!-)\.)+[A-Za-z]{2,63}$")
+
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+
+
+class ManifestParseError(ValueError):
+    """The buffer does not hold a well-formed manifest."""
+
+
+class Manifest:
+    """
+    One parsed manifest. Blob fields are kept as (offset, length) pairs
+    into the shared buffer; `spans` records every field as
+    (type, field, start, end) offsets, header included.
+    """
+
+    __slots__ = (
+        "buffer",
+        "start",
+        "end",
+        "version",
+        "sequence",
+        "_public_key",
+        "_signing_public_key",
+        "_signature",
+        "_domain",
+        "_master_signature",
+        "spans",
+    )
+
+    def __init__(self, buffer: memoryview, start: int):
+        self.buffer = buffer
+        self.start = start
+        self.end = start
+        self.version = None
+        self.sequence = None
+        self._public_key = None
+        self._signing_public_key = None
+        self._signature = None
+        self._domain = None
+        self._master_signature = None
+        self.spans: List[Tuple[int, int, int, int]] = []
+
+    def _get(self, loc: Optional[Tuple[int, int]]) -> Optional[bytes]:
+        if loc is None:
+            return None
+        off, length = loc
+        return self.buffer[off : off + length].tobytes()
+
+    @property
+    def public_key(self) -> Optional[bytes]:
+        return self._get(self._public_key)
+
+    @property
+    def signing_public_key(self) -> Optional[bytes]:
+        return self._get(self._signing_public_key)
+
+    @property
+    def signature(self) -> Optional[bytes]:
+        return self._get(self._signature)
+
+    @property
+    def domain(self) -> Optional[bytes]:
+        return self._get(self._domain)
+
+    @property
+    def master_signature(self) -> Optional[bytes]:
+        return self._get(self._master_signature)
+
+    @property
+    def raw(self) -> memoryview:
+        """The serialized manifest itself (a view, not a copy)."""
+        return self.buffer[self.start : self.end]
+
+    @property
+    def revoked(self) -> bool:
+        return self.sequence == REVOKED_SEQUENCE
+
+    @property
+    def signing_key_type(self) -> Optional[str]:
+        if self._signing_public_key is None:
+            return None
+        prefix = self.buffer[self._signing_public_key[0]]
+        if prefix == 0xED:
+            return "ed25519"
+        if prefix in (0x02, 0x03):
+            return "secp256k1"
+        return None
+
+    def signing_data(self) -> bytes:
+        """HashPrefix::manifest followed by every signing field, as both signatures cover."""
+        parts = [HASH_PREFIX_MANIFEST]
+        for type_code, field_code, start, end in self.spans:
+            if (type_code, field_code) not in NOT_SIGNING:
+                parts.append(self.buffer[start:end])
+        return b"".join(parts)
+
+    def to_dict(self) -> dict:
+        """Hex view of the key fields, in the shape parse_manifest() returns."""
+        result = {}
+        if self._public_key is not None:
+            result["master_public_key"] = self.public_key.hex().upper()
+        if self._signing_public_key is not None:
+            result["signing_public_key"] = self.signing_public_key.hex().upper()
+            key_type = self.signing_key_type
+            if key_type:
+                result["signing_key_type"] = key_type
+        if self.sequence is not None:
+            result["sequence"] = self.sequence
+        if self._domain is not None:
+            result["domain"] = self.domain.decode("ascii", "replace")
+        return result
+
+
+def _read_vl_length(buf: memoryview, i: int, end: int) -> Tuple[int, int]:
+    """Decode an XRPL variable-length prefix; returns (length, new offset)."""
+    if i >= end:
+        raise ManifestParseError("truncated length prefix")
+    b1 = buf[i]
+    if b1 <= 192:
+        return b1, i + 1
+    if b1 <= 240:
+        if i + 1 >= end:
+            raise ManifestParseError("truncated length prefix")
+        return 193 + (b1 - 193) * 256 + buf[i + 1], i + 2
+    if b1 <= 254:
+        if i + 2 >= end:
+            raise ManifestParseError("truncated length prefix")
+        return 12481 + (b1 - 241) * 65536 + buf[i + 1] * 256 + buf[i + 2], i + 3
+    raise ManifestParseError(f"invalid length prefix 0x{b1:02X}")
+
+
+def _read_field_id(buf: memoryview, i: int, end: int) -> Tuple[int, int, int]:
+    """Decode a field ID; returns (type code, field code, new offset)."""
+    byte = buf[i]
+    i += 1
+    type_code = byte >> 4
+    field_code = byte & 0x0F
+    if type_code == 0:
+        if i >= end:
+            raise ManifestParseError("truncated field id")
+        type_code = buf[i]
+        i += 1
+    if field_code == 0:
+        if i >= end:
+            raise ManifestParseError("truncated field id")
+        field_code = buf[i]
+        i += 1
+    return type_code, field_code, i
+
+
+def parse_manifests(
+    data: Union[bytes, bytearray, memoryview],
+    offset: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[Manifest]:
+    """
+    Yield every manifest found in `data[offset:end]`.
+
+    Manifests are canonical STObjects, so field IDs strictly increase
+    within one manifest; a field ID that does not increase marks the start
+    of the next manifest in a concatenated buffer.
+    """
+    buf = data if isinstance(data, memoryview) else memoryview(data)
+    if end is None:
+        end = len(buf)
+
+    i = offset
+    current: Optional[Manifest] = None
+    last_id = (-1, -1)
+
+    while i < end:
+        field_start = i
+        type_code, field_code, i = _read_field_id(buf, i, end)
+        field_id = (type_code, field_code)
+
+        if current is None or field_id <= last_id:
+            if current is not None:
+                current.end = field_start
+                yield current
+            current = Manifest(buf, field_start)
+        last_id = field_id
+
+        width = FIXED_WIDTHS.get(type_code)
+        if width is not None:
+            value_start = i
+            i += width
+            if i > end:
+                raise ManifestParseError(f"truncated field ({type_code}, {field_code})")
+        elif type_code in VL_ENCODED:
+            length, value_start = _read_vl_length(buf, i, end)
+            i = value_start + length
+            if i > end:
+                raise ManifestParseError(f"truncated field ({type_code}, {field_code})")
+        else:
+            raise ManifestParseError(
+                f"unsupported field type {type_code} (field {field_code}) in manifest"
+            )
+
+        current.spans.append((type_code, field_code, field_start, i))
+
+        name = FIELDS.get(field_id)
+        if name == "sequence":
+            current.sequence = _U32.unpack_from(buf, value_start)[0]
+        elif name == "version":
+            current.version = _U16.unpack_from(buf, value_start)[0]
+        elif name is not None:
+            setattr(current, "_" + name, (value_start, i - value_start))
+
+    if current is not None:
+        current.end = i
+        yield current
+
+
+def parse_manifest_bytes(data: Union[bytes, bytearray, memoryview]) -> Manifest:
+    """Parse exactly one manifest; trailing data is an error."""
+    manifests = list(parse_manifests(data))
+    if len(manifests) != 1:
+        raise ManifestParseError(
+            f"expected one manifest, found {len(manifests)} in buffer"
+        )
+    return manifests[0]
+
+
+def decode_manifests(manifests_b64: Iterable[str]) -> List[Manifest]:
+    """
+    Batch-decode base64 manifests: the decoded bytes are joined into one
+    buffer and parsed in a single pass, one Manifest per input in order.
+    """
+    buffer = bytearray()
+    bounds = []
+    for m in manifests_b64:
+        start = len(buffer)
+        buffer += base64.b64decode(m)
+        bounds.append((start, len(buffer)))
+
+    view = memoryview(bytes(buffer))
+    result = []
+    for start, stop in bounds:
+        parsed = list(parse_manifests(view, start, stop))
+        if len(parsed) != 1:
+            raise ManifestParseError(f"manifest at offset {start} is not canonical")
+        result.append(parsed[0])
+    return result
+
+
+def sha512_half(data) -> bytes:
+    """XRPL SHA-512-Half: first 32 bytes of SHA-512."""
+    return hashlib.sha512(data).digest()[:32]
+
+
+def public_key_type(key: Optional[bytes]) -> Optional[str]:
+    """Mirror of publicKeyType(): 33-byte 0xED / 0x02 / 0x03 prefixed keys only."""
+    if key is None or len(key) != 33:
+        return None
+    if key[0] == 0xED:
+        return "ed25519"
+    if key[0] in (0x02, 0x03):
+        return "secp256k1"
+    return None
+
+
+def verify_signature(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    """
+    Mirror of ripple::verify() with mustBeFullyCanonical: secp256k1 signs the
+    SHA-512-Half of the message with a strict low-S DER signature, Ed25519
+    signs the raw message with a canonical S.
+    """
+    key_type = public_key_type(public_key)
+    if key_type == "secp256k1":
+        from secp256k1_backend import get_backend, is_low_s_der
+
+        if not is_low_s_der(signature):
+            return False
+        return get_backend().verify_digest(public_key, sha512_half(message), signature)
+
+    if key_type == "ed25519":
+        if len(signature) != 64 or signature[32:][::-1] >= ED25519_ORDER:
+            return False
+        import nacl.exceptions
+        import nacl.signing
+
+        try:
+            nacl.signing.VerifyKey(public_key[1:]).verify(message, signature)
+            return True
+        except nacl.exceptions.BadSignatureError:
+            return False
+
+    return False
+
+
+def check_manifest(manifest: Manifest) -> str:
+    """
+    Run the node's acceptance checks on a parsed manifest.
+
+    Returns "" when the manifest is valid, otherwise a short reason code:
+    malformed, unsupported_version, bad_master_key, bad_domain,
+    revocation_has_signing_key, missing_signing_key, bad_signing_key,
+    same_keys, bad_signature or bad_master_signature.
+    """
+    if any((t, f) not in FIELDS for t, f, _, _ in manifest.spans):
+        return "malformed"
+    if manifest.sequence is None or manifest._master_signature is None:
+        return "malformed"
+    if manifest.version not in (None, 0):
+        return "unsupported_version"
+
+    master = manifest.public_key
+    if public_key_type(master) is None:
+        return "bad_master_key"
+
+    if manifest._domain is not None:
+        try:
+            domain = manifest.domain.decode("ascii")
+        except UnicodeDecodeError:
+            return "bad_domain"
+        if not 4 <= len(domain) <= 128 or not _DOMAIN_RE.match(domain):
+            return "bad_domain"
+
+    signing_data = manifest.signing_data()
+    if manifest.revoked:
+        if manifest._signing_public_key is not None or manifest._signature is not None:
+            return "revocation_has_signing_key"
+    else:
+        if manifest._signing_public_key is None or manifest._signature is None:
+            return "missing_signing_key"
+        signing_key = manifest.signing_public_key
+        if public_key_type(signing_key) is None:
+            return "bad_signing_key"
+        if signing_key == master:
+            return "same_keys"
+        if not verify_signature(signing_key, signing_data, manifest.signature):
+            return "bad_signature"
+
+    if not verify_signature(master, signing_data, manifest.master_signature):
+        return "bad_master_signature"
+    return ""
+
+
+class ManifestVerifier:
+    """
+    Manifest verification behind an LRU cache keyed by SHA-512-Half of the
+    serialized manifest. Only the outcome (a reason code) is cached.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    def check(self, data: Union[bytes, memoryview, Manifest]) -> str:
+        """Return "" for a valid manifest, else the check_manifest() reason code."""
+        manifest = data if isinstance(data, Manifest) else None
+        raw = manifest.raw if manifest is not None else data
+        key = sha512_half(raw)
+
+        reason = self._cache.get(key)
+        if reason is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return reason
+
+        self.misses += 1
+        if manifest is None:
+            try:
+                manifest = parse_manifest_bytes(raw)
+            except ManifestParseError:
+                manifest = None
+        reason = check_manifest(manifest) if manifest is not None else "malformed"
+
+        self._cache[key] = reason
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return reason
+
+    def verify(self, data: Union[bytes, memoryview, Manifest]) -> bool:
+        return self.check(data) == ""
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_default_verifier = ManifestVerifier()
+
+
+def verify_manifest(data: Union[bytes, memoryview, Manifest]) -> bool:
+    """Verify both manifest signatures using the shared LRU-cached verifier."""
+    return _default_verifier.verify(data)
+
+
+def manifest_problem(data: Union[bytes, memoryview, Manifest]) -> str:
+    """Reason code from the shared verifier ("" when the manifest is valid)."""
+    return _default_verifier.check(data)
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit("Usage: xrpl_manifest.py <manifest_base64> [...]")
+    for manifest in decode_manifests(sys.argv[1:]):
+        reason = manifest_problem(manifest)
+        print(f"Manifest ({manifest.end - manifest.start} bytes): "
+              f"{'valid' if not reason else 'INVALID (' + reason + ')'}")
+        for key, value in manifest.to_dict().items():
+            print(f"  {key}: {value}")
+        for type_code, field_code, start, end in manifest.spans:
+            name = FIELDS.get((type_code, field_code), f"({type_code}, {field_code})")
+            print(f"    {name:<20} offset {start - manifest.start:>4} length {end - start}")
+
+
+if __name__ == "__main__":
+    main()
@@ -81,6 +81,9 @@ STValidation::validationFormat()
         // featurePF_AccountExclusion - validators can add/remove exclusions via validations
         {sfExclusionAdd,          soeOPTIONAL},
         {sfExclusionRemove,       soeOPTIONAL},
+        // featurePF_ExclusionBatch - several of each, as sfExclusionEntry objects
+        {sfExclusionAdds,         soeOPTIONAL},
+        {sfExclusionRemoves,      soeOPTIONAL},
     };
     // clang-format on
 
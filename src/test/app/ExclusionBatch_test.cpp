@@ -0,0 +1,369 @@
+#include <test/jtx.h>
+
+#include <xrpld/app/ledger/Ledger.h>
+#include <xrpld/app/misc/ValidatorExclusionManager.h>
+#include <xrpld/app/tx/apply.h>
+
+#include <xrpl/ledger/OpenView.h>
+#include <xrpl/protocol/Feature.h>
+#include <xrpl/protocol/Indexes.h>
+#include <xrpl/protocol/Protocol.h>
+#include <xrpl/protocol/STArray.h>
+#include <xrpl/protocol/STTx.h>
+
+namespace ripple {
+namespace test {
+
+class ExclusionBatch_test : public beast::unit_test::suite
+{
+    static std::vector<AccountID>
+    makeAccounts(std::string const& prefix, std::size_t n)
+    {
+        std::vector<AccountID> accounts;
+        for (std::size_t i = 0; i < n; ++i)
+            accounts.push_back(jtx::Account(prefix + std::to_string(i)).id());
+        return accounts;
+    }
+
+    static STArray
+    toArray(std::vector<AccountID> const& accounts, SField const& name = sfExclusionEntry)
+    {
+        STArray array(accounts.size());
+        for (auto const& account : accounts)
+        {
+            array.push_back(STObject(name));
+            array.back().setAccountID(sfAccount, account);
+        }
+        return array;
+    }
+
+    static std::shared_ptr<SLE>
+    validatorAccount(AccountID const& validator, std::vector<AccountID> const& exclusions)
+    {
+        auto sle = std::make_shared<SLE>(keylet::account(validator));
+        sle->setAccountID(sfAccount, validator);
+        sle->setFieldAmount(sfBalance, STAmount{0});
+        sle->setFieldU32(sfSequence, 1);
+        if (!exclusions.empty())
+            sle->setFieldArray(sfExclusionList, toArray(exclusions));
+        return sle;
+    }
+
+    static std::vector<AccountID>
+    readExclusions(ReadView const& view, AccountID const& validator)
+    {
+        std::vector<AccountID> exclusions;
+        auto const sle = view.read(keylet::account(validator));
+        if (sle && sle->isFieldPresent(sfExclusionList))
+        {
+            for (auto const& entry : sle->getFieldArray(sfExclusionList))
+                exclusions.push_back(entry.getAccountID(sfAccount));
+        }
+        return exclusions;
+    }
+
+    static STTx
+    makeVote(
+        LedgerIndex seq,
+        PublicKey const& validator,
+        std::function<void(STObject&)> const& exclusions)
+    {
+        return STTx(ttVALIDATOR_VOTE, [&](auto& obj) {
+            obj.setAccountID(sfAccount, AccountID());
+            obj.setFieldU32(sfLedgerSequence, seq);
+            obj.setFieldH256(sfLedgerHash, uint256(1));
+            obj.setFieldVL(sfValidatorPublicKey, validator.slice());
+            obj.setFieldH256(sfValidationHash, uint256(2));
+            exclusions(obj);
+        });
+    }
+
+    static std::shared_ptr<Ledger>
+    nextLedger(jtx::Env& env)
+    {
+        auto const genesis = std::make_shared<Ledger>(
+            create_genesis,
+            env.app().config(),
+            std::vector<uint256>{},
+            env.app().getNodeFamily());
+        return std::make_shared<Ledger>(*genesis, env.app().timeKeeper().closeTime());
+    }
+
+    static TER
+    applyVote(jtx::Env& env, OpenView& view, STTx const& tx)
+    {
+        return apply(env.app(), view, tx, tapNONE, env.journal).ter;
+    }
+
+    // What RCLConsensus puts on the validation for a batch
+    static std::size_t
+    serializedSize(ValidatorExclusionManager::ExclusionBatch const& batch)
+    {
+        STObject obj(sfGeneric);
+        if (!batch.adds.empty())
+            obj.setFieldArray(sfExclusionAdds, toArray(batch.adds));
+        if (!batch.removes.empty())
+            obj.setFieldArray(sfExclusionRemoves, toArray(batch.removes));
+        Serializer s;
+        obj.add(s);
+        return s.size();
+    }
+
+    void
+    testPreflight()
+    {
+        testcase("Preflight of batch fields");
+
+        using namespace jtx;
+
+        auto const validator = randomKeyPair(KeyType::secp256k1).first;
+        auto const accounts = makeAccounts("excluded", 3);
+
+        // Batch fields need PF_ExclusionBatch; the single fields do not
+        {
+            Env env(*this, testable_amendments() - featurePF_ExclusionBatch);
+            auto const ledger = nextLedger(env);
+            OpenView view(ledger.get());
+
+            auto const adds = makeVote(ledger->seq(), validator, [&](STObject& obj) {
+                obj.setFieldArray(sfExclusionAdds, toArray(accounts));
+            });
+            BEAST_EXPECT(applyVote(env, view, adds) == temDISABLED);
+
+            auto const removes = makeVote(ledger->seq(), validator, [&](STObject& obj) {
+                obj.setFieldArray(sfExclusionRemoves, toArray(accounts));
+            });
+            BEAST_EXPECT(applyVote(env, view, removes) == temDISABLED);
+
+            auto const single = makeVote(ledger->seq(), validator, [&](STObject& obj) {
+                obj.setAccountID(sfExclusionAdd, accounts[0]);
+            });
+            BEAST_EXPECT(applyVote(env, view, single) == tesSUCCESS);
+        }
+
+        Env env(*this);
+        auto const ledger = nextLedger(env);
+        OpenView view(ledger.get());
+
+        auto const expect = [&](TER ter, std::function<void(STObject&)> const& fields) {
+            BEAST_EXPECT(applyVote(env, view, makeVote(ledger->seq(), validator, fields)) == ter);
+        };
+
+        // Empty arrays
+        expect(temMALFORMED, [](STObject& obj) {
+            obj.setFieldArray(sfExclusionAdds, STArray{});
+        });
+        expect(temMALFORMED, [](STObject& obj) {
+            obj.setFieldArray(sfExclusionRemoves, STArray{});
+        });
+
+        // More entries than a list can hold
+        auto const tooMany = makeAccounts("many", maxExclusionListSize + 1);
+        expect(temMALFORMED, [&](STObject& obj) {
+            obj.setFieldArray(sfExclusionAdds, toArray(tooMany));
+        });
+        expect(temMALFORMED, [&](STObject& obj) {
+            obj.setFieldArray(sfExclusionRemoves, toArray(tooMany));
+        });
+
+        // Entries of the wrong type or without an account
+        expect(temMALFORMED, [&](STObject& obj) {
+            obj.setFieldArray(sfExclusionAdds, toArray(accounts, sfSignerEntry));
+        });
+        expect(temMALFORMED, [&](STObject& obj) {
+            STArray array;
+            array.push_back(STObject(sfExclusionEntry));
+            obj.setFieldArray(sfExclusionRemoves, array);
+        });
+
+        // A bad remove array fails even with a good add array
+        expect(temMALFORMED, [&](STObject& obj) {
+            obj.setFieldArray(sfExclusionAdds, toArray(accounts));
+            obj.setFieldArray(sfExclusionRemoves, STArray{});
+        });
+
+        // A full batch is accepted
+        auto const full = makeAccounts("full", maxExclusionListSize);
+        expect(tesSUCCESS, [&](STObject& obj) {
+            obj.setFieldArray(sfExclusionAdds, toArray(full));
+        });
+    }
+
+    void
+    testRemovesBeforeAdds()
+    {
+        testcase("Removes apply before adds on a full list");
+
+        using namespace jtx;
+
+        Env env(*this);
+        auto const validator = randomKeyPair(KeyType::secp256k1).first;
+        auto const validatorID = calcAccountID(validator);
+        auto const current = makeAccounts("current", maxExclusionListSize);
+        auto const added = makeAccounts("added", 3);
+
+        auto const ledger = nextLedger(env);
+        ledger->rawInsert(validatorAccount(validatorID, current));
+
+        {
+            // Batch: the adds follow the removes in the same vote
+            OpenView view(ledger.get());
+            auto const tx = makeVote(ledger->seq(), validator, [&](STObject& obj) {
+                obj.setFieldArray(sfExclusionAdds, toArray({added[0], added[1]}));
+                obj.setFieldArray(sfExclusionRemoves, toArray({current[0], current[1]}));
+            });
+            BEAST_EXPECT(applyVote(env, view, tx) == tesSUCCESS);
+            view.apply(*ledger);
+        }
+        {
+            // Single fields, in the same order
+            OpenView view(ledger.get());
+            auto const tx = makeVote(ledger->seq(), validator, [&](STObject& obj) {
+                obj.setAccountID(sfExclusionAdd, added[2]);
+                obj.setAccountID(sfExclusionRemove, current[2]);
+            });
+            BEAST_EXPECT(applyVote(env, view, tx) == tesSUCCESS);
+            view.apply(*ledger);
+        }
+
+        auto const exclusions = readExclusions(*ledger, validatorID);
+        auto const has = [&exclusions](AccountID const& account) {
+            return std::find(exclusions.begin(), exclusions.end(), account) !=
+                exclusions.end();
+        };
+        BEAST_EXPECT(exclusions.size() == maxExclusionListSize);
+        for (auto const& account : added)
+            BEAST_EXPECT(has(account));
+        for (std::size_t i = 0; i < 3; ++i)
+            BEAST_EXPECT(!has(current[i]));
+
+        {
+            // Without a remove, an add to the full list is dropped
+            OpenView view(ledger.get());
+            auto const extra = makeAccounts("extra", 1);
+            auto const tx = makeVote(ledger->seq(), validator, [&](STObject& obj) {
+                obj.setFieldArray(sfExclusionAdds, toArray(extra));
+            });
+            BEAST_EXPECT(applyVote(env, view, tx) == tesSUCCESS);
+            view.apply(*ledger);
+
+            auto const after = readExclusions(*ledger, validatorID);
+            BEAST_EXPECT(after.size() == maxExclusionListSize);
+            BEAST_EXPECT(std::find(after.begin(), after.end(), extra[0]) == after.end());
+        }
+    }
+
+    void
+    testBatchPairing()
+    {
+        testcase("Batches pair a remove with each add on a full list");
+
+        using namespace jtx;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+        auto const validator = randomKeyPair(KeyType::secp256k1).first;
+        auto const current = makeAccounts("current", maxExclusionListSize);
+        auto const wanted = makeAccounts("wanted", 5);
+
+        // Drop the first three, add five
+        auto cfg = envconfig();
+        cfg->VALIDATOR_EXCLUSIONS.insert(current.begin() + 3, current.end());
+        cfg->VALIDATOR_EXCLUSIONS.insert(wanted.begin(), wanted.end());
+        std::unordered_set<AccountID> const toRemove(current.begin(), current.begin() + 3);
+        std::unordered_set<AccountID> const toAdd(wanted.begin(), wanted.end());
+
+        OpenView view(&*env.current());
+        view.rawInsert(validatorAccount(calcAccountID(validator), current));
+
+        ValidatorExclusionManager mgr(env.app(), *cfg, env.journal);
+        mgr.initialize(validator, view);
+
+        auto const check = [&](auto const& batch, std::size_t pairs) {
+            if (!BEAST_EXPECT(batch))
+                return;
+            BEAST_EXPECT(batch->adds.size() == pairs);
+            BEAST_EXPECT(batch->removes.size() == pairs);
+            for (auto const& account : batch->adds)
+                BEAST_EXPECT(toAdd.count(account));
+            for (auto const& account : batch->removes)
+                BEAST_EXPECT(toRemove.count(account));
+        };
+
+        // Room for three entries: a pair cannot be split, so only one fits
+        std::size_t const threeEntries = 2 * ValidatorExclusionManager::BATCH_ARRAY_BYTES +
+            3 * ValidatorExclusionManager::BATCH_ENTRY_BYTES;
+        check(mgr.getExclusionBatch(10, threeEntries), 1);
+
+        // Rate limited
+        BEAST_EXPECT(!mgr.getExclusionBatch(15, 4096));
+
+        // The other two removes pair with two more adds
+        check(mgr.getExclusionBatch(20, 4096), 2);
+
+        // Only adds are left and the list is full again
+        BEAST_EXPECT(!mgr.getExclusionBatch(30, 4096));
+    }
+
+    void
+    testBatchBudget()
+    {
+        testcase("Batches stay within the byte budget");
+
+        using namespace jtx;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+        auto const validator = randomKeyPair(KeyType::secp256k1).first;
+        auto const wanted = makeAccounts("wanted", 10);
+
+        auto cfg = envconfig();
+        cfg->VALIDATOR_EXCLUSIONS.insert(wanted.begin(), wanted.end());
+
+        ValidatorExclusionManager mgr(env.app(), *cfg, env.journal);
+        mgr.initialize(validator, *env.current());
+
+        std::unordered_set<AccountID> seen;
+        auto const take = [&](LedgerIndex seq, std::size_t maxBytes, std::size_t expected) {
+            auto const batch = mgr.getExclusionBatch(seq, maxBytes);
+            if (!BEAST_EXPECT(batch))
+                return;
+            BEAST_EXPECT(batch->adds.size() == expected);
+            BEAST_EXPECT(batch->removes.empty());
+            BEAST_EXPECT(serializedSize(*batch) <= maxBytes);
+            seen.insert(batch->adds.begin(), batch->adds.end());
+        };
+
+        // The smallest configurable budget still carries two entries
+        take(10, 64, 2);
+        // One byte short of a fourth entry
+        std::size_t const fourEntries = 2 * ValidatorExclusionManager::BATCH_ARRAY_BYTES +
+            4 * ValidatorExclusionManager::BATCH_ENTRY_BYTES;
+        take(20, fourEntries - 1, 3);
+        take(30, fourEntries, 4);
+        take(40, 4096, 1);
+
+        BEAST_EXPECT(seen.size() == wanted.size());
+        BEAST_EXPECT(!mgr.getExclusionBatch(50, 4096));
+
+        // The budget constants match the serialized arrays exactly
+        ValidatorExclusionManager::ExclusionBatch batch{{wanted[0], wanted[1]}, {wanted[2]}};
+        BEAST_EXPECT(
+            serializedSize(batch) ==
+            2 * ValidatorExclusionManager::BATCH_ARRAY_BYTES +
+                3 * ValidatorExclusionManager::BATCH_ENTRY_BYTES);
+    }
+
+public:
+    void
+    run() override
+    {
+        testPreflight();
+        testRemovesBeforeAdds();
+        testBatchPairing();
+        testBatchBudget();
+    }
+};
+
+BEAST_DEFINE_TESTSUITE(ExclusionBatch, app, ripple);
+
+}  // namespace test
+}  // namespace ripple
@@ -0,0 +1,204 @@
+#include <test/jtx.h>
+
+#include <xrpld/app/misc/ExclusionManager.h>
+#include <xrpld/consensus/ConsensusParms.h>
+
+#include <xrpl/ledger/OpenView.h>
+#include <xrpl/protocol/Indexes.h>
+#include <xrpl/protocol/STArray.h>
+
+#include <algorithm>
+#include <random>
+
+namespace ripple {
+namespace test {
+
+class ExclusionManager_test : public beast::unit_test::suite
+{
+    using Lists = std::unordered_map<AccountID, std::unordered_set<AccountID>>;
+
+    /** Compare the incremental state against a recalculation from model. */
+    void
+    expectConsistent(ExclusionManager const& mgr, Lists const& model)
+    {
+        std::unordered_map<AccountID, std::size_t> counts;
+        for (auto const& [validator, list] : model)
+        {
+            for (auto const& account : list)
+                ++counts[account];
+        }
+
+        std::size_t threshold = 1;
+        if (!model.empty())
+            threshold = std::max<std::size_t>(
+                1, (model.size() * ConsensusParms{}.minCONSENSUS_PCT + 99) / 100);
+
+        std::unordered_set<AccountID> expected;
+        for (auto const& [account, count] : counts)
+        {
+            if (count >= threshold)
+                expected.insert(account);
+        }
+
+        std::lock_guard lock(mgr.mutable_);
+
+        BEAST_EXPECT(mgr.validatorExclusions_ == model);
+        BEAST_EXPECT(mgr.totalValidators_ == model.size());
+        BEAST_EXPECT(mgr.threshold_ == threshold);
+        BEAST_EXPECT(mgr.exclusionCounts_ == counts);
+
+        std::size_t bucketed = 0;
+        for (std::size_t n = 0; n < mgr.countBuckets_.size(); ++n)
+        {
+            for (auto const& account : mgr.countBuckets_[n])
+            {
+                auto const it = counts.find(account);
+                BEAST_EXPECT(it != counts.end() && it->second == n);
+            }
+            bucketed += mgr.countBuckets_[n].size();
+        }
+        BEAST_EXPECT(bucketed == counts.size());
+
+        BEAST_EXPECT(mgr.consensusExcluded_ == expected);
+        BEAST_EXPECT(!mgr.excludedChanged_);
+        auto const snapshot = mgr.loadSnapshot();
+        BEAST_EXPECT(snapshot && *snapshot == expected);
+    }
+
+    void
+    testRandomSequences()
+    {
+        testcase("Incremental updates match a recalculation");
+
+        using namespace jtx;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+
+        std::vector<AccountID> validators;
+        for (int i = 0; i < 15; ++i)
+            validators.push_back(Account("validator" + std::to_string(i)).id());
+        std::vector<AccountID> accounts;
+        for (int i = 0; i < 12; ++i)
+            accounts.push_back(Account("account" + std::to_string(i)).id());
+
+        std::mt19937 rng{42};
+        auto const pick = [&rng](auto const& v) {
+            return v[std::uniform_int_distribution<std::size_t>(0, v.size() - 1)(rng)];
+        };
+        auto const chance = [&rng](int percent) {
+            return std::uniform_int_distribution<int>(0, 99)(rng) < percent;
+        };
+        // Mostly overlapping lists, so counts keep crossing the threshold
+        auto const randomList = [&]() {
+            std::unordered_set<AccountID> list;
+            for (auto const& account : accounts)
+            {
+                if (chance(60))
+                    list.insert(account);
+            }
+            return list;
+        };
+
+        ExclusionManager mgr(env.app());
+        mgr.rebuildCache(*env.current());  // no UNL in the test environment
+        BEAST_EXPECT(mgr.isInitialized());
+
+        Lists model;
+        std::unordered_set<AccountID> unl;
+        expectConsistent(mgr, model);
+
+        for (int step = 0; step < 1000; ++step)
+        {
+            switch (std::uniform_int_distribution<int>(0, 2)(rng))
+            {
+                case 0: {
+                    auto const validator = pick(validators);
+                    auto list = chance(10) ? std::unordered_set<AccountID>{} : randomList();
+                    mgr.updateValidatorExclusions(validator, list);
+                    if (list.empty())
+                        model.erase(validator);
+                    else
+                        model[validator] = std::move(list);
+                    break;
+                }
+                case 1: {
+                    auto const validator = pick(validators);
+                    mgr.removeValidator(validator);
+                    model.erase(validator);
+                    break;
+                }
+                case 2: {
+                    // A new UNL, with the ledger lists its new members bring
+                    std::unordered_set<AccountID> trusted;
+                    for (auto const& validator : validators)
+                    {
+                        if (chance(60))
+                            trusted.insert(validator);
+                    }
+
+                    OpenView view(&*env.current());
+                    Lists ledger;
+                    for (auto const& validator : validators)
+                    {
+                        if (chance(20))
+                            continue;  // no account yet
+
+                        auto sle = std::make_shared<SLE>(keylet::account(validator));
+                        sle->setAccountID(sfAccount, validator);
+                        if (auto list = randomList(); !list.empty() && chance(80))
+                        {
+                            STArray entries(sfExclusionList);
+                            for (auto const& account : list)
+                            {
+                                STObject entry(sfExclusionEntry);
+                                entry.setAccountID(sfAccount, account);
+                                entries.push_back(std::move(entry));
+                            }
+                            sle->setFieldArray(sfExclusionList, entries);
+                            ledger[validator] = std::move(list);
+                        }
+                        view.rawInsert(sle);
+                    }
+
+                    mgr.applyTrustChange(view, trusted);
+
+                    for (auto const& validator : unl)
+                    {
+                        if (!trusted.count(validator))
+                            model.erase(validator);
+                    }
+                    for (auto const& validator : trusted)
+                    {
+                        if (unl.count(validator))
+                            continue;
+                        if (auto const it = ledger.find(validator); it != ledger.end())
+                            model[validator] = it->second;
+                    }
+                    unl = std::move(trusted);
+                    break;
+                }
+            }
+
+            expectConsistent(mgr, model);
+        }
+
+        for (auto const& account : accounts)
+        {
+            std::lock_guard lock(mgr.mutable_);
+            BEAST_EXPECT(
+                mgr.isExcluded(account) == (mgr.consensusExcluded_.count(account) != 0));
+        }
+    }
+
+public:
+    void
+    run() override
+    {
+        testRandomSequences();
+    }
+};
+
+BEAST_DEFINE_TESTSUITE(ExclusionManager, app, ripple);
+
+}  // namespace test
+}  // namespace ripple
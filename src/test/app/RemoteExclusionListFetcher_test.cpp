@@ -0,0 +1,456 @@
+#include <test/jtx.h>
+#include <test/unit_test/FileDirGuard.h>
+
+#include <xrpld/app/misc/RemoteExclusionListFetcher.h>
+
+#include <xrpl/basics/strHex.h>
+#include <xrpl/protocol/digest.h>
+#include <xrpl/protocol/PublicKey.h>
+#include <xrpl/protocol/SecretKey.h>
+
+#include <boost/asio.hpp>
+#include <boost/beast/core/flat_buffer.hpp>
+#include <boost/beast/http.hpp>
+#include <boost/filesystem.hpp>
+
+#include <algorithm>
+#include <chrono>
+#include <fstream>
+#include <functional>
+#include <map>
+#include <mutex>
+#include <thread>
+
+namespace ripple {
+namespace test {
+
+/** Serves files over HTTP with strong ETags, answering If-None-Match with 304. */
+class ListServer : public std::enable_shared_from_this<ListServer>
+{
+    using tcp = boost::asio::ip::tcp;
+    using error_code = boost::system::error_code;
+
+    struct File
+    {
+        std::string body;
+        std::string etag;
+    };
+
+    struct Session
+    {
+        explicit Session(tcp::socket&& s) : socket(std::move(s))
+        {
+        }
+
+        tcp::socket socket;
+        boost::beast::flat_buffer buffer;
+        boost::beast::http::request<boost::beast::http::string_body> req;
+        boost::beast::http::response<boost::beast::http::string_body> res;
+    };
+
+    tcp::acceptor acceptor_;
+    std::mutex mutex_;
+    std::map<std::string, File> files_;
+    std::map<std::string, std::size_t> notModified_;
+
+    void
+    accept()
+    {
+        acceptor_.async_accept(
+            [self = shared_from_this()](error_code const& ec, tcp::socket socket) {
+                if (ec)
+                    return;
+                self->serve(std::make_shared<Session>(std::move(socket)));
+                self->accept();
+            });
+    }
+
+    void
+    serve(std::shared_ptr<Session> const& session)
+    {
+        boost::beast::http::async_read(
+            session->socket,
+            session->buffer,
+            session->req,
+            [self = shared_from_this(), session](error_code const& ec, std::size_t) {
+                if (ec)
+                    return;
+                self->respond(*session);
+                boost::beast::http::async_write(
+                    session->socket, session->res, [session](error_code const&, std::size_t) {
+                        error_code ec;
+                        session->socket.shutdown(tcp::socket::shutdown_both, ec);
+                    });
+            });
+    }
+
+    void
+    respond(Session& session)
+    {
+        using namespace boost::beast::http;
+
+        auto& res = session.res;
+        res.version(session.req.version());
+        res.keep_alive(false);
+
+        std::string const path(session.req.target());
+        std::lock_guard lock(mutex_);
+        auto const it = files_.find(path);
+        if (it == files_.end())
+        {
+            res.result(status::not_found);
+        }
+        else if (session.req[field::if_none_match] == it->second.etag)
+        {
+            res.result(status::not_modified);
+            res.set(field::etag, it->second.etag);
+            ++notModified_[path];
+        }
+        else
+        {
+            res.result(status::ok);
+            res.set(field::etag, it->second.etag);
+            res.body() = it->second.body;
+        }
+        res.prepare_payload();
+    }
+
+public:
+    explicit ListServer(boost::asio::io_context& ioc)
+        : acceptor_(ioc, tcp::endpoint(boost::asio::ip::address_v4::loopback(), 0))
+    {
+    }
+
+    void
+    start()
+    {
+        accept();
+    }
+
+    void
+    stop()
+    {
+        error_code ec;
+        acceptor_.close(ec);
+    }
+
+    std::string
+    url(std::string const& path) const
+    {
+        return "http://127.0.0.1:" + std::to_string(acceptor_.local_endpoint().port()) +
+            path;
+    }
+
+    void
+    set(std::string const& path, std::string body)
+    {
+        std::lock_guard lock(mutex_);
+        auto const etag = "\"" + to_string(sha512Half(makeSlice(body))) + "\"";
+        files_[path] = {std::move(body), etag};
+    }
+
+    std::size_t
+    notModified(std::string const& path)
+    {
+        std::lock_guard lock(mutex_);
+        return notModified_[path];
+    }
+};
+
+class RemoteExclusionListFetcher_test : public beast::unit_test::suite
+{
+    static constexpr char const* version = "1.0";
+    static constexpr char const* timestamp = "2024-01-01T00:00:00Z";
+
+    // The message a full list is signed over
+    static std::string
+    listMessage(AccountID const& issuer, std::vector<AccountID> const& addresses)
+    {
+        std::vector<std::string> sorted;
+        for (auto const& addr : addresses)
+            sorted.push_back(toBase58(addr));
+        std::sort(sorted.begin(), sorted.end());
+
+        std::string message = std::string("v1:") + version + ":" + timestamp +
+            ":" + toBase58(issuer) + ":";
+        for (auto const& addr : sorted)
+            message += addr + "\n";
+        return message;
+    }
+
+    static std::string
+    signature(std::pair<PublicKey, SecretKey> const& keys, std::string const& message)
+    {
+        auto const sig = sign(keys.first, keys.second, makeSlice(message));
+        return R"({"algorithm":"ed25519","public_key":")" +
+            toBase58(TokenType::NodePublic, keys.first) + R"(","signature":")" +
+            strHex(sig) + R"("})";
+    }
+
+    // A list in the format published by scripts/sign_exclusion_list.py
+    static std::string
+    signedList(
+        std::pair<PublicKey, SecretKey> const& keys,
+        std::vector<AccountID> const& addresses)
+    {
+        auto const issuer = calcAccountID(keys.first);
+
+        std::string exclusions;
+        for (auto const& addr : addresses)
+        {
+            if (!exclusions.empty())
+                exclusions += ",";
+            exclusions += R"({"address":")" + toBase58(addr) +
+                R"(","reason":"test","date_added":"2024-01-01"})";
+        }
+
+        return std::string(R"({"version":")") + version +
+            R"(","timestamp":")" + timestamp + R"(","issuer_address":")" +
+            toBase58(issuer) + R"(","exclusions":[)" + exclusions +
+            R"(],"signature":)" + signature(keys, listMessage(issuer, addresses)) +
+            "}";
+    }
+
+    // A correctly signed delta from base that adds the given addresses but
+    // names snapshot as its result
+    static std::string
+    signedDelta(
+        std::pair<PublicKey, SecretKey> const& keys,
+        std::vector<AccountID> const& base,
+        std::vector<AccountID> const& snapshot,
+        std::vector<AccountID> const& added)
+    {
+        auto const issuer = calcAccountID(keys.first);
+        auto const baseHash = to_string(sha512Half(makeSlice(listMessage(issuer, base))));
+        auto const snapshotHash =
+            to_string(sha512Half(makeSlice(listMessage(issuer, snapshot))));
+
+        std::vector<std::string> sorted;
+        for (auto const& addr : added)
+            sorted.push_back(toBase58(addr));
+        std::sort(sorted.begin(), sorted.end());
+
+        std::string message = "v1-delta:" + baseHash + ":" + snapshotHash + ":" +
+            version + ":" + timestamp + ":" + toBase58(issuer) + ":";
+        std::string entries;
+        for (auto const& addr : sorted)
+        {
+            message += "+" + addr + "\n";
+            if (!entries.empty())
+                entries += ",";
+            entries += R"({"address":")" + addr + R"("})";
+        }
+
+        return R"({"type":"delta","base_hash":")" + baseHash +
+            R"(","snapshot_hash":")" + snapshotHash + R"(","version":")" +
+            version + R"(","timestamp":")" + timestamp +
+            R"(","issuer_address":")" + toBase58(issuer) + R"(","added":[)" +
+            entries + R"(],"removed":[],"signature":)" + signature(keys, message) +
+            "}";
+    }
+
+    static bool
+    waitForInitialFetch(RemoteExclusionListFetcher const& fetcher)
+    {
+        using namespace std::chrono_literals;
+        for (int i = 0; i < 1000 && !fetcher.isInitialFetchComplete(); ++i)
+            std::this_thread::sleep_for(10ms);
+        return fetcher.isInitialFetchComplete();
+    }
+
+    static bool
+    waitFor(std::function<bool()> const& done)
+    {
+        using namespace std::chrono_literals;
+        for (int i = 0; i < 1000 && !done(); ++i)
+            std::this_thread::sleep_for(10ms);
+        return done();
+    }
+
+    void
+    testStartWithSource()
+    {
+        testcase("Start with a configured source");
+
+        using namespace jtx;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+
+        auto const keys = randomKeyPair(KeyType::ed25519);
+        auto const excluded = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+
+        detail::FileDirGuard const list(
+            *this, "exclusions", "list.json", signedList(keys, {excluded}));
+
+        auto cfg = envconfig();
+        cfg->VALIDATOR_EXCLUSIONS_SOURCES.push_back(
+            {"file://" + boost::filesystem::absolute(list.file()).string(),
+             toBase58(TokenType::NodePublic, keys.first)});
+
+        RemoteExclusionListFetcher fetcher(env.app(), *cfg, env.journal);
+
+        // start() used to hold its lock across the first fetch, which
+        // takes the same lock, and never returned
+        fetcher.start();
+        BEAST_EXPECT(fetcher.isRunning());
+        BEAST_EXPECT(waitForInitialFetch(fetcher));
+        BEAST_EXPECT(fetcher.areAllSourcesAccessible());
+
+        auto const combined = fetcher.getCombinedExclusions();
+        BEAST_EXPECT(combined.size() == 1 && combined.count(excluded));
+
+        fetcher.stop();
+        BEAST_EXPECT(!fetcher.isRunning());
+    }
+
+    void
+    testStartWithMissingSource()
+    {
+        testcase("Start with an unreachable source");
+
+        using namespace jtx;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+
+        detail::DirGuard const dir(*this, "exclusions");
+        auto const keys = randomKeyPair(KeyType::ed25519);
+
+        auto cfg = envconfig();
+        cfg->VALIDATOR_EXCLUSIONS_SOURCES.push_back(
+            {"file://" +
+                 boost::filesystem::absolute(dir.subdir() / "missing.json").string(),
+             toBase58(TokenType::NodePublic, keys.first)});
+
+        RemoteExclusionListFetcher fetcher(env.app(), *cfg, env.journal);
+
+        fetcher.start();
+        BEAST_EXPECT(waitForInitialFetch(fetcher));
+        BEAST_EXPECT(!fetcher.areAllSourcesAccessible());
+        BEAST_EXPECT(fetcher.getCombinedExclusions().empty());
+
+        fetcher.stop();
+        BEAST_EXPECT(!fetcher.isRunning());
+    }
+
+    void
+    testDeltaSnapshotMismatch()
+    {
+        testcase("Delta that does not rebuild its snapshot");
+
+        using namespace jtx;
+        using namespace std::chrono_literals;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+
+        auto const keys = randomKeyPair(KeyType::ed25519);
+        auto const a = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+        auto const b = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+        auto const c = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+
+        detail::FileDirGuard const list(
+            *this, "exclusions", "list.json", signedList(keys, {a}));
+        // Signed, based on the cached list, but adds c while claiming the
+        // snapshot {a, b}
+        detail::FileDirGuard const delta(
+            *this,
+            list.subdir(),
+            "list.json.delta",
+            signedDelta(keys, {a}, {a, b}, {c}),
+            false);
+
+        auto cfg = envconfig();
+        cfg->VALIDATOR_EXCLUSIONS_INTERVAL = 1s;
+        cfg->VALIDATOR_EXCLUSIONS_SOURCES.push_back(
+            {"file://" + boost::filesystem::absolute(list.file()).string(),
+             toBase58(TokenType::NodePublic, keys.first)});
+
+        RemoteExclusionListFetcher fetcher(env.app(), *cfg, env.journal);
+        fetcher.start();
+        BEAST_EXPECT(waitForInitialFetch(fetcher));
+        BEAST_EXPECT(fetcher.getCombinedExclusions().size() == 1);
+
+        {
+            std::ofstream o(list.file().string(), std::ios::trunc);
+            o << signedList(keys, {a, b});
+        }
+
+        // The next fetch must reject the delta and take the full list
+        std::unordered_set<AccountID> combined;
+        for (int i = 0; i < 1000; ++i)
+        {
+            combined = fetcher.getCombinedExclusions();
+            if (combined.size() != 1)
+                break;
+            std::this_thread::sleep_for(10ms);
+        }
+        BEAST_EXPECT(combined.size() == 2 && combined.count(a) && combined.count(b));
+        BEAST_EXPECT(!combined.count(c));
+
+        fetcher.stop();
+    }
+
+    void
+    testDeltaNotModified()
+    {
+        testcase("Unchanged delta after the full list was re-signed");
+
+        using namespace jtx;
+        using namespace std::chrono_literals;
+
+        Env env(*this, envconfig(), nullptr, beast::severities::kDisabled);
+
+        auto const keys = randomKeyPair(KeyType::ed25519);
+        auto const a = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+        auto const b = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+        auto const c = calcAccountID(randomKeyPair(KeyType::ed25519).first);
+
+        auto server = std::make_shared<ListServer>(env.app().getIOService());
+        server->set("/list.json", signedList(keys, {a}));
+        server->set("/list.json.delta", signedDelta(keys, {a}, {a, b}, {b}));
+        server->start();
+
+        auto cfg = envconfig();
+        cfg->VALIDATOR_EXCLUSIONS_INTERVAL = 1s;
+        cfg->VALIDATOR_EXCLUSIONS_SOURCES.push_back(
+            {server->url("/list.json"), toBase58(TokenType::NodePublic, keys.first)});
+
+        RemoteExclusionListFetcher fetcher(env.app(), *cfg, env.journal);
+        fetcher.start();
+        BEAST_EXPECT(waitForInitialFetch(fetcher));
+        BEAST_EXPECT(fetcher.getCombinedExclusions().size() == 1);
+
+        // The next fetch applies the delta
+        BEAST_EXPECT(waitFor([&] { return fetcher.getCombinedExclusions().size() == 2; }));
+
+        // Re-signed without a new delta: the old one still answers 304,
+        // which must not stand for the full list
+        server->set("/list.json", signedList(keys, {a, b, c}));
+        BEAST_EXPECT(waitFor([&] { return fetcher.getCombinedExclusions().size() == 3; }));
+        BEAST_EXPECT(server->notModified("/list.json.delta") > 0);
+
+        // Nothing changes from here on: the full list is answered with 304
+        BEAST_EXPECT(waitFor([&] { return server->notModified("/list.json") > 0; }));
+        auto const combined = fetcher.getCombinedExclusions();
+        BEAST_EXPECT(
+            combined.size() == 3 && combined.count(a) && combined.count(b) &&
+            combined.count(c));
+
+        fetcher.stop();
+        server->stop();
+    }
+
+public:
+    void
+    run() override
+    {
+        testStartWithSource();
+        testStartWithMissingSource();
+        testDeltaSnapshotMismatch();
+        testDeltaNotModified();
+    }
+};
+
+BEAST_DEFINE_TESTSUITE(RemoteExclusionListFetcher, app, ripple);
+
+}  // namespace test
+}  // namespace ripple
@@ -1495,6 +1495,52 @@ r.ripple.com:51235
         BEAST_EXPECT(!testDiverged("901"));
     }
 
+    void
+    testExclusionBatchBytes()
+    {
+        testcase("validator_exclusions_batch_bytes");
+
+        auto testBytes = [](std::string value) -> std::optional<std::size_t> {
+            try
+            {
+                Config c;
+                c.loadFromString(
+                    "[validator_exclusions_batch_bytes]\n" + value);
+                return c.VALIDATOR_EXCLUSIONS_BATCH_BYTES;
+            }
+            catch (std::runtime_error const&)
+            {
+                return {};
+            }
+        };
+
+        // Default: one change per validation
+        {
+            Config c;
+            c.loadFromString("");
+            BEAST_EXPECT(c.VALIDATOR_EXCLUSIONS_BATCH_BYTES == 0);
+        }
+
+        // Failures
+        BEAST_EXPECT(!testBytes("none"));
+        BEAST_EXPECT(!testBytes("-1"));
+
+        // Batching disabled
+        BEAST_EXPECT(testBytes("0") == 0);
+
+        // Below lower bound
+        BEAST_EXPECT(!testBytes("1"));
+        BEAST_EXPECT(!testBytes("63"));
+
+        // In bounds
+        BEAST_EXPECT(testBytes("64") == 64);
+        BEAST_EXPECT(testBytes("1024") == 1024);
+        BEAST_EXPECT(testBytes("4096") == 4096);
+
+        // Above upper bound
+        BEAST_EXPECT(!testBytes("4097"));
+    }
+
     void
     run() override
     {
@@ -1513,6 +1559,7 @@ r.ripple.com:51235
         testAmendment();
         testOverlay();
         testNetworkID();
+        testExclusionBatchBytes();
     }
 };
 
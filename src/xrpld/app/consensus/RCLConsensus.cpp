@@ -45,6 +45,7 @@
 #include <xrpl/beast/utility/instrumentation.h>
 #include <xrpl/protocol/BuildInfo.h>
 #include <xrpl/protocol/Feature.h>
+#include <xrpl/protocol/STArray.h>
 #include <xrpl/protocol/digest.h>
 
 #include <algorithm>
@@ -885,7 +886,35 @@ RCLConsensus::Adaptor::validate(
             }
 
             // PF_AccountExclusion: Include any exclusion list changes in validation
-            if (ledger.ledger_->rules().enabled(featurePF_AccountExclusion))
+            auto const batchBytes = app_.config().VALIDATOR_EXCLUSIONS_BATCH_BYTES;
+            if (ledger.ledger_->rules().enabled(featurePF_AccountExclusion) &&
+                ledger.ledger_->rules().enabled(featurePF_ExclusionBatch) &&
+                batchBytes != 0)
+            {
+                // Several changes at once, within the configured byte budget
+                if (auto const batch = app_.getValidatorExclusionManager()
+                        .getExclusionBatch(ledger.seq(), batchBytes))
+                {
+                    auto const toArray = [](std::vector<AccountID> const& accounts) {
+                        STArray array(accounts.size());
+                        for (auto const& account : accounts)
+                        {
+                            array.push_back(STObject::makeInnerObject(sfExclusionEntry));
+                            array.back().setAccountID(sfAccount, account);
+                        }
+                        return array;
+                    };
+
+                    if (!batch->adds.empty())
+                        v.setFieldArray(sfExclusionAdds, toArray(batch->adds));
+                    if (!batch->removes.empty())
+                        v.setFieldArray(sfExclusionRemoves, toArray(batch->removes));
+
+                    JLOG(j_.info()) << "Adding " << batch->adds.size() << " exclusions and "
+                                   << batch->removes.size() << " exclusion removals to validation";
+                }
+            }
+            else if (ledger.ledger_->rules().enabled(featurePF_AccountExclusion))
             {
                 // Check if validator has pending exclusion changes
                 if (auto const changes = app_.getValidatorExclusionManager()
@@ -30,6 +30,7 @@
 
 #include <xrpl/basics/Log.h>
 #include <xrpl/basics/chrono.h>
+#include <xrpl/protocol/STArray.h>
 
 #include <memory>
 
@@ -206,6 +207,23 @@ handleNewValidation(
             if (val->isFieldPresent(sfExclusionRemove))
                 exclusionRemove = val->getAccountID(sfExclusionRemove);
 
+            // PF_ExclusionBatch: several of each, as sfExclusionEntry objects
+            auto const readBatch = [&val](SField const& field) {
+                std::vector<AccountID> accounts;
+                if (!val->isFieldPresent(field))
+                    return accounts;
+                auto const& array = val->getFieldArray(field);
+                accounts.reserve(array.size());
+                for (auto const& entry : array)
+                {
+                    if (entry.isFieldPresent(sfAccount))
+                        accounts.push_back(entry.getAccountID(sfAccount));
+                }
+                return accounts;
+            };
+            auto exclusionAdds = readBatch(sfExclusionAdds);
+            auto exclusionRemoves = readBatch(sfExclusionRemoves);
+
             auto const keyForVote = masterKey.value_or(signingKey);
             JLOG(app.journal("Validations").info())
                 << "RCLValidations: Recording vote with "
@@ -220,7 +238,9 @@ handleNewValidation(
                 val->getSigningHash(),  // Validation signing hash as proof
                 app.timeKeeper().closeTime(),
                 exclusionAdd,
-                exclusionRemove);
+                exclusionRemove,
+                std::move(exclusionAdds),
+                std::move(exclusionRemoves));
             
             if (bypassAccept == BypassAccept::yes)
             {
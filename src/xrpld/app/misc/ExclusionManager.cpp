@@ -20,7 +20,6 @@
 #include <xrpld/app/misc/ExclusionManager.h>
 #include <xrpld/app/main/Application.h>
 #include <xrpld/app/misc/ValidatorList.h>
-#include <xrpld/app/misc/RemoteExclusionListFetcher.h>
 #include <xrpl/ledger/ReadView.h>
 #include <xrpl/protocol/Feature.h>
 #include <xrpl/protocol/Indexes.h>
@@ -41,11 +40,39 @@ ExclusionManager::ExclusionManager(Application& app)
 bool
 ExclusionManager::isExcluded(AccountID const& account) const
 {
-    std::lock_guard lock(mutable_);
+    auto const snapshot = loadSnapshot();
     // If not initialized yet, nothing is excluded
-    if (!initialized_)
+    if (!snapshot)
         return false;
-    return consensusExcluded_.find(account) != consensusExcluded_.end();
+    return snapshot->find(account) != snapshot->end();
+}
+
+std::shared_ptr<ExclusionManager::ExcludedSet const>
+ExclusionManager::loadSnapshot() const
+{
+#if defined(__cpp_lib_atomic_shared_ptr)
+    return published_.load(std::memory_order_acquire);
+#else
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wdeprecated-declarations"
+    return std::atomic_load_explicit(&published_, std::memory_order_acquire);
+#pragma GCC diagnostic pop
+#endif
+}
+
+void
+ExclusionManager::publishSnapshot()
+{
+    // Copied off to the side; readers of the previous snapshot are unaffected
+    auto next = std::make_shared<ExcludedSet const>(consensusExcluded_);
+#if defined(__cpp_lib_atomic_shared_ptr)
+    published_.store(std::move(next), std::memory_order_release);
+#else
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wdeprecated-declarations"
+    std::atomic_store_explicit(&published_, std::move(next), std::memory_order_release);
+#pragma GCC diagnostic pop
+#endif
 }
 
 bool
@@ -62,94 +89,146 @@ ExclusionManager::updateValidatorExclusions(
 {
     std::lock_guard lock(mutable_);
 
+    replaceExclusions(validator, exclusions);
+
+    // Update the total validator count to match the actual map size
+    setTotalValidators(validatorExclusions_.size());
+    publishIfChanged();
+
+    JLOG(j_.debug()) << "Updated exclusions for validator " << toBase58(validator)
+                     << " - " << exclusions.size() << " addresses excluded";
+}
+
+void
+ExclusionManager::removeValidator(AccountID const& validator)
+{
+    std::lock_guard lock(mutable_);
+
+    if (validatorExclusions_.find(validator) == validatorExclusions_.end())
+        return;
+
+    // Decrement counts for all addresses this validator was excluding
+    replaceExclusions(validator, {});
+
+    // Update the total validator count to match the actual map size
+    setTotalValidators(validatorExclusions_.size());
+    publishIfChanged();
+
+    JLOG(j_.debug()) << "Removed validator " << toBase58(validator)
+                     << " from exclusion tracking";
+}
+
+void
+ExclusionManager::replaceExclusions(
+    AccountID const& validator,
+    std::unordered_set<AccountID> const& exclusions)
+{
     // Get the old exclusion list for this validator (if any)
-    auto oldExclusionsIt = validatorExclusions_.find(validator);
     std::unordered_set<AccountID> oldExclusions;
-
-    if (oldExclusionsIt != validatorExclusions_.end())
+    if (auto it = validatorExclusions_.find(validator); it != validatorExclusions_.end())
     {
-        oldExclusions = std::move(oldExclusionsIt->second);
+        oldExclusions = std::move(it->second);
+        validatorExclusions_.erase(it);
     }
 
-    // Update to new exclusion list
-    if (exclusions.empty())
+    // Only addresses that were added or removed change their count
+    for (auto const& account : oldExclusions)
     {
-        validatorExclusions_.erase(validator);
+        if (exclusions.find(account) == exclusions.end())
+            adjustCount(account, false);
     }
-    else
+    for (auto const& account : exclusions)
     {
-        validatorExclusions_[validator] = exclusions;
+        if (oldExclusions.find(account) == oldExclusions.end())
+            adjustCount(account, true);
     }
 
-    // Update the total validator count to match the actual map size
-    totalValidators_ = validatorExclusions_.size();
+    if (!exclusions.empty())
+        validatorExclusions_[validator] = exclusions;
+}
 
-    // Update exclusion counts
-    // First, decrement counts for addresses that were in old list
-    for (auto const& account : oldExclusions)
+void
+ExclusionManager::adjustCount(AccountID const& account, bool increment)
+{
+    std::size_t oldCount = 0;
+    auto it = exclusionCounts_.find(account);
+    if (it != exclusionCounts_.end())
+        oldCount = it->second;
+    else if (!increment)
+        return;
+
+    std::size_t const newCount = increment ? oldCount + 1 : oldCount - 1;
+
+    if (oldCount)
+        countBuckets_[oldCount].erase(account);
+    if (newCount)
     {
-        auto it = exclusionCounts_.find(account);
+        if (countBuckets_.size() <= newCount)
+            countBuckets_.resize(newCount + 1);
+        countBuckets_[newCount].insert(account);
         if (it != exclusionCounts_.end())
-        {
-            if (it->second > 1)
-            {
-                it->second--;
-            }
-            else
-            {
-                exclusionCounts_.erase(it);
-            }
-        }
+            it->second = newCount;
+        else
+            exclusionCounts_.emplace(account, newCount);
     }
-
-    // Then, increment counts for addresses in new list
-    for (auto const& account : exclusions)
+    else
     {
-        exclusionCounts_[account]++;
+        exclusionCounts_.erase(it);
     }
 
-    // Recalculate which addresses meet consensus threshold
-    recalculateConsensusExclusions();
-
-    JLOG(j_.debug()) << "Updated exclusions for validator " << toBase58(validator)
-                     << " - " << exclusions.size() << " addresses excluded";
+    if (oldCount < threshold_ && newCount >= threshold_)
+    {
+        consensusExcluded_.insert(account);
+        excludedChanged_ = true;
+    }
+    else if (oldCount >= threshold_ && newCount < threshold_)
+    {
+        consensusExcluded_.erase(account);
+        excludedChanged_ = true;
+    }
 }
 
 void
-ExclusionManager::removeValidator(AccountID const& validator)
+ExclusionManager::setTotalValidators(std::size_t total)
 {
-    std::lock_guard lock(mutable_);
+    totalValidators_ = total;
+    std::size_t const oldThreshold = threshold_;
+    threshold_ = getConsensusThreshold();
 
-    auto it = validatorExclusions_.find(validator);
-    if (it == validatorExclusions_.end())
-        return;
+    // Accounts below both thresholds or at/above both keep their state
+    std::size_t const low = std::min(oldThreshold, threshold_);
+    std::size_t const high = std::min(std::max(oldThreshold, threshold_), countBuckets_.size());
+    bool const lowered = threshold_ < oldThreshold;
 
-    // Decrement counts for all addresses this validator was excluding
-    for (auto const& account : it->second)
+    for (std::size_t count = low; count < high; ++count)
     {
-        auto countIt = exclusionCounts_.find(account);
-        if (countIt != exclusionCounts_.end())
+        for (auto const& account : countBuckets_[count])
         {
-            if (countIt->second > 1)
-            {
-                countIt->second--;
-            }
+            if (lowered)
+                consensusExcluded_.insert(account);
             else
-            {
-                exclusionCounts_.erase(countIt);
-            }
+                consensusExcluded_.erase(account);
+            excludedChanged_ = true;
         }
     }
 
-    validatorExclusions_.erase(it);
-
-    // Update the total validator count to match the actual map size
-    totalValidators_ = validatorExclusions_.size();
-
-    recalculateConsensusExclusions();
+    if (oldThreshold != threshold_)
+    {
+        JLOG(j_.trace()) << "Consensus threshold moved from " << oldThreshold << " to "
+                         << threshold_ << "/" << totalValidators_ << ": "
+                         << consensusExcluded_.size() << " addresses excluded";
+    }
+}
 
-    JLOG(j_.debug()) << "Removed validator " << toBase58(validator)
-                     << " from exclusion tracking";
+void
+ExclusionManager::publishIfChanged()
+{
+    // rebuildCache() publishes once it has marked the cache initialized
+    if (initialized_ && excludedChanged_)
+    {
+        publishSnapshot();
+        excludedChanged_ = false;
+    }
 }
 
 void
@@ -161,6 +240,7 @@ ExclusionManager::rebuildCache(ReadView const& view)
     {
         JLOG(j_.debug()) << "PF_AccountExclusion feature not enabled, skipping cache rebuild";
         initialized_ = true;
+        publishSnapshot();
         return;
     }
 
@@ -168,6 +248,7 @@ ExclusionManager::rebuildCache(ReadView const& view)
     validatorExclusions_.clear();
     exclusionCounts_.clear();
     consensusExcluded_.clear();
+    unlValidators_.clear();
     totalValidators_ = 0;
 
     JLOG(j_.info()) << "Rebuilding exclusion cache from ledger";
@@ -185,6 +266,7 @@ ExclusionManager::rebuildCache(ReadView const& view)
     {
         // Convert public key to account ID
         AccountID validatorAccount = calcAccountID(pubKey);
+        unlValidators_.insert(validatorAccount);
 
         // Get the validator's account to check their exclusion list
         auto const accountSLE = view.read(keylet::account(validatorAccount));
@@ -232,6 +314,8 @@ ExclusionManager::rebuildCache(ReadView const& view)
 
     // Mark as initialized
     initialized_ = true;
+    publishSnapshot();
+    excludedChanged_ = false;
 
     JLOG(j_.info()) << "Exclusion cache rebuilt: "
                     << validatorsProcessed << " validators, "
@@ -243,23 +327,86 @@ void
 ExclusionManager::recalculateConsensusExclusions()
 {
     consensusExcluded_.clear();
+    countBuckets_.clear();
+    threshold_ = getConsensusThreshold();
 
-    if (totalValidators_ == 0)
+    for (auto const& [account, count] : exclusionCounts_)
+    {
+        if (countBuckets_.size() <= count)
+            countBuckets_.resize(count + 1);
+        countBuckets_[count].insert(account);
+
+        // With no validators there are no counts, so nothing is excluded
+        if (count >= threshold_)
+            consensusExcluded_.insert(account);
+    }
+    excludedChanged_ = true;
+
+    JLOG(j_.trace()) << "Consensus exclusions recalculated: "
+                     << consensusExcluded_.size() << " addresses excluded "
+                     << "(threshold: " << threshold_ << "/" << totalValidators_ << ")";
+}
+
+void
+ExclusionManager::trustChanged(ReadView const& view)
+{
+    std::unordered_set<AccountID> trusted;
+    for (auto const& pubKey : app_.validators().getTrustedMasterKeys())
+        trusted.insert(calcAccountID(pubKey));
+
+    applyTrustChange(view, std::move(trusted));
+}
+
+void
+ExclusionManager::applyTrustChange(
+    ReadView const& view,
+    std::unordered_set<AccountID> trusted)
+{
+    std::lock_guard lock(mutable_);
+
+    // Until the first rebuild there is nothing to update incrementally
+    if (!initialized_ || !view.rules().enabled(featurePF_AccountExclusion))
         return;
 
-    std::size_t const threshold = getConsensusThreshold();
+    std::size_t removed = 0;
+    std::size_t added = 0;
 
-    for (auto const& [account, count] : exclusionCounts_)
+    for (auto const& validator : unlValidators_)
+    {
+        if (trusted.find(validator) != trusted.end())
+            continue;
+        replaceExclusions(validator, {});
+        ++removed;
+    }
+
+    for (auto const& validator : trusted)
     {
-        if (count >= threshold)
+        if (unlValidators_.find(validator) != unlValidators_.end())
+            continue;
+        ++added;
+
+        auto const accountSLE = view.read(keylet::account(validator));
+        if (!accountSLE || !accountSLE->isFieldPresent(sfExclusionList))
+            continue;
+
+        std::unordered_set<AccountID> exclusions;
+        for (auto const& entry : accountSLE->getFieldArray(sfExclusionList))
         {
-            consensusExcluded_.insert(account);
+            if (entry.isFieldPresent(sfAccount))
+                exclusions.insert(entry.getAccountID(sfAccount));
         }
+        replaceExclusions(validator, exclusions);
     }
 
-    JLOG(j_.trace()) << "Consensus exclusions recalculated: "
-                     << consensusExcluded_.size() << " addresses excluded "
-                     << "(threshold: " << threshold << "/" << totalValidators_ << ")";
+    unlValidators_ = std::move(trusted);
+
+    // Moving the threshold only visits the buckets between old and new
+    setTotalValidators(validatorExclusions_.size());
+    publishIfChanged();
+
+    JLOG(j_.info()) << "Exclusion cache updated for UNL change: " << added << " added, "
+                    << removed << " removed, " << consensusExcluded_.size()
+                    << " addresses meet consensus threshold";
 }
 
 std::size_t
@@ -285,13 +432,8 @@ ExclusionManager::getStats() const
     stats.totalValidators = totalValidators_;
     stats.totalExcludedAddresses = consensusExcluded_.size();
 
-    // Count total unique exclusions across all validators
-    std::unordered_set<AccountID> allExclusions;
-    for (auto const& [validator, exclusions] : validatorExclusions_)
-    {
-        allExclusions.insert(exclusions.begin(), exclusions.end());
-    }
-    stats.totalUniqueExclusions = allExclusions.size();
+    // Every address on some validator's list has a nonzero count
+    stats.totalUniqueExclusions = exclusionCounts_.size();
 
     return stats;
 }
@@ -300,31 +442,27 @@ std::optional<ExclusionManager::ExclusionInfo>
 ExclusionManager::getExclusionInfo(AccountID const& account) const
 {
     std::lock_guard lock(mutable_);
+    return lookupExclusionInfo(account);
+}
 
-    // Check if remote fetcher has updates and apply them
-    if (remoteFetcher_ && remoteFetcher_->hasBeenModified(false))
-    {
-        // Get updated reasons from remote fetcher
-        auto reasons = remoteFetcher_->getExclusionReasons();
-        if (!reasons.empty())
-        {
-            // Update the exclusion info map
-            // Note: We need to cast away const here since we're updating cache
-            // This is safe because the method is logically const (query operation)
-            auto* mutableThis = const_cast<ExclusionManager*>(this);
-            for (auto const& [acct, reasonPair] : reasons)
-            {
-                ExclusionInfo info;
-                info.reason = reasonPair.first;
-                info.dateAdded = reasonPair.second;
-                mutableThis->exclusionInfoMap_[acct] = info;
-            }
+std::unordered_map<AccountID, ExclusionManager::ExclusionInfo>
+ExclusionManager::getExclusionInfos(std::vector<AccountID> const& accounts) const
+{
+    std::unordered_map<AccountID, ExclusionInfo> infos;
+    infos.reserve(accounts.size());
 
-            JLOG(j_.debug()) << "ExclusionManager: Updated reasons from remote fetcher for "
-                            << reasons.size() << " addresses";
-        }
+    std::lock_guard lock(mutable_);
+    for (auto const& account : accounts)
+    {
+        if (auto info = lookupExclusionInfo(account))
+            infos.emplace(account, std::move(*info));
     }
+    return infos;
+}
 
+std::optional<ExclusionManager::ExclusionInfo>
+ExclusionManager::lookupExclusionInfo(AccountID const& account) const
+{
     auto it = exclusionInfoMap_.find(account);
     if (it != exclusionInfoMap_.end())
     {
@@ -352,26 +490,20 @@ ExclusionManager::getExclusionInfo(AccountID const& account) const
 
 void
 ExclusionManager::updateExclusionReasons(
-    std::unordered_map<AccountID, ExclusionInfo> const& reasons)
+    std::unordered_map<AccountID, ExclusionInfo> reasons,
+    std::uint64_t generation)
 {
     std::lock_guard lock(mutable_);
 
-    // Merge new reasons with existing map
-    for (auto const& [account, info] : reasons)
-    {
-        exclusionInfoMap_[account] = info;
-    }
-
-    JLOG(j_.debug()) << "Updated exclusion reasons for " << reasons.size() << " addresses";
-}
+    // Late or repeated pushes must not roll reasons back
+    if (generation <= reasonsGeneration_)
+        return;
 
-void
-ExclusionManager::setRemoteFetcher(RemoteExclusionListFetcher* fetcher)
-{
-    std::lock_guard lock(mutable_);
-    remoteFetcher_ = fetcher;
+    exclusionInfoMap_ = std::move(reasons);
+    reasonsGeneration_ = generation;
 
-    JLOG(j_.debug()) << "Remote fetcher " << (fetcher ? "connected" : "disconnected");
+    JLOG(j_.debug()) << "Updated exclusion reasons for " << exclusionInfoMap_.size()
+                     << " addresses (generation " << generation << ")";
 }
 
 } // namespace ripple
\ No newline at end of file
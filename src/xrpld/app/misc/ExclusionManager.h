@@ -23,16 +23,22 @@
 #include <xrpl/protocol/AccountID.h>
 #include <xrpl/basics/Log.h>
 #include <xrpld/consensus/ConsensusParms.h>
+#include <atomic>
+#include <cstdint>
 #include <memory>
 #include <mutex>
 #include <unordered_map>
 #include <unordered_set>
+#include <vector>
 
 namespace ripple {
 
 class ReadView;
 class Application;
-class RemoteExclusionListFetcher;
+
+namespace test {
+class ExclusionManager_test;
+}  // namespace test
 
 /**
  * ExclusionManager maintains an in-memory cache of validator exclusion lists
@@ -54,7 +60,9 @@ public:
 
     /**
      * Check if an account is excluded by consensus
-     * This is a fast O(1) lookup in the pre-calculated cache
+     * This is a fast O(1) lookup in the pre-calculated cache. It reads the
+     * last published snapshot and never takes mutable_, so it does not
+     * wait for rebuilds, updates or RPC queries.
      */
     bool isExcluded(AccountID const& account) const;
 
@@ -74,10 +82,18 @@ public:
 
     /**
      * Rebuild the entire cache from the ledger
-     * Called on startup or when the UNL changes significantly
+     * Called on startup, before the cache is initialized
      */
     void rebuildCache(ReadView const& view);
 
+    /**
+     * Apply a UNL change to an initialized cache
+     * Only validators that joined or left the UNL are read or dropped, and
+     * only addresses whose counts lie between the old and new threshold
+     * are re-evaluated
+     */
+    void trustChanged(ReadView const& view);
+
     /**
      * Check if the cache has been initialized from ledger
      */
@@ -111,17 +127,20 @@ public:
     std::optional<ExclusionInfo> getExclusionInfo(AccountID const& account) const;
 
     /**
-     * Update exclusion reasons from remote fetcher
-     * Called when remote exclusion lists are fetched
+     * Get exclusion info for many accounts from one consistent snapshot
+     * Accounts with neither a reason nor any votes are left out
      */
-    void updateExclusionReasons(
-        std::unordered_map<AccountID, ExclusionInfo> const& reasons);
+    std::unordered_map<AccountID, ExclusionInfo> getExclusionInfos(
+        std::vector<AccountID> const& accounts) const;
 
     /**
-     * Set the remote exclusion list fetcher
-     * Called during initialization to enable automatic updates
+     * Replace the exclusion reasons with those of a remote fetch generation
+     * Pushed by RemoteExclusionListFetcher once per changed generation;
+     * generations at or below the one already held are ignored
      */
-    void setRemoteFetcher(RemoteExclusionListFetcher* fetcher);
+    void updateExclusionReasons(
+        std::unordered_map<AccountID, ExclusionInfo> reasons,
+        std::uint64_t generation);
 
 private:
     Application& app_;
@@ -135,14 +154,37 @@ private:
     // Map from potentially excluded account to count of validators excluding it
     std::unordered_map<AccountID, std::size_t> exclusionCounts_;
 
+    // countBuckets_[n] holds the accounts excluded by exactly n validators,
+    // so a threshold move only visits the buckets it passes over
+    std::vector<std::unordered_set<AccountID>> countBuckets_;
+
     // Pre-calculated set of accounts that meet the consensus threshold for exclusion
     std::unordered_set<AccountID> consensusExcluded_;
 
+    // getConsensusThreshold() for the current totalValidators_
+    std::size_t threshold_ = 1;
+
+    // consensusExcluded_ differs from the published snapshot
+    bool excludedChanged_ = false;
+
+    // UNL validator accounts the cache was last built or updated for
+    std::unordered_set<AccountID> unlValidators_;
+
+    // Immutable copy of consensusExcluded_ read by isExcluded(). Writers
+    // build the next set under mutable_ and swap it in; readers keep the
+    // snapshot they loaded alive. Null until the cache is initialized.
+    using ExcludedSet = std::unordered_set<AccountID>;
+#if defined(__cpp_lib_atomic_shared_ptr)
+    std::atomic<std::shared_ptr<ExcludedSet const>> published_;
+#else
+    std::shared_ptr<ExcludedSet const> published_;
+#endif
+
     // Map from excluded account to exclusion info (reason, date, etc)
     std::unordered_map<AccountID, ExclusionInfo> exclusionInfoMap_;
 
-    // Pointer to remote fetcher for checking updates
-    RemoteExclusionListFetcher* remoteFetcher_ = nullptr;
+    // Fetch generation exclusionInfoMap_ was taken from
+    std::uint64_t reasonsGeneration_ = 0;
 
     // Total number of active validators
     std::size_t totalValidators_ = 0;
@@ -151,15 +193,63 @@ private:
     bool initialized_ = false;
 
     /**
-     * Recalculate which addresses meet the consensus threshold
-     * Called internally after any change to validator exclusion lists
+     * trustChanged() for an already computed set of trusted validator
+     * accounts
+     */
+    void applyTrustChange(
+        ReadView const& view,
+        std::unordered_set<AccountID> trusted);
+
+    /**
+     * Recalculate count buckets and consensus exclusions from scratch
+     * Only used by rebuildCache(); later changes are applied incrementally
      */
     void recalculateConsensusExclusions();
 
+    /**
+     * Replace one validator's exclusion list, adjusting only the counts of
+     * addresses that were added or removed
+     */
+    void replaceExclusions(
+        AccountID const& validator,
+        std::unordered_set<AccountID> const& exclusions);
+
+    /**
+     * Move an account to the next count bucket up or down, entering or
+     * leaving consensusExcluded_ if it crosses the threshold
+     */
+    void adjustCount(AccountID const& account, bool increment);
+
+    /**
+     * Set totalValidators_ and move the threshold, re-evaluating only the
+     * buckets between the old and new threshold
+     */
+    void setTotalValidators(std::size_t total);
+
+    /**
+     * Publish a snapshot if consensusExcluded_ changed since the last one
+     */
+    void publishIfChanged();
+
     /**
      * Calculate the minimum number of validators needed for consensus
      */
     std::size_t getConsensusThreshold() const;
+
+    /**
+     * Publish a copy of consensusExcluded_ for isExcluded()
+     * Must be called with mutable_ held, once initialized_ is set
+     */
+    void publishSnapshot();
+
+    std::shared_ptr<ExcludedSet const> loadSnapshot() const;
+
+    /**
+     * Look up reason and vote count; mutable_ must be held
+     */
+    std::optional<ExclusionInfo> lookupExclusionInfo(AccountID const& account) const;
+
+    friend class test::ExclusionManager_test;
 };
 
 } // namespace ripple
@@ -31,6 +31,7 @@
 #include <xrpld/app/main/Tuning.h>
 #include <xrpld/app/misc/AmendmentTable.h>
 #include <xrpld/app/misc/DeliverMax.h>
+#include <xrpld/app/misc/ExclusionManager.h>
 #include <xrpld/app/misc/HashRouter.h>
 #include <xrpld/app/misc/LoadFeeTrack.h>
 #include <xrpld/app/misc/NetworkOPs.h>
@@ -2094,6 +2095,8 @@ NetworkOPsImp::beginConsensus(
         // Update the AmendmentTable so it tracks the current validators.
         app_.getAmendmentTable().trustChanged(
             app_.validators().getQuorumKeys().second);
+        // Shift exclusion counts and threshold to the new UNL
+        app_.getExclusionManager().trustChanged(*prevLedger);
     }
 
     mConsensus.startRound(
@@ -1,5 +1,6 @@
 #include <xrpld/app/misc/RemoteExclusionListFetcher.h>
 #include <xrpld/app/main/Application.h>
+#include <xrpld/app/misc/ExclusionManager.h>
 #include <xrpld/app/misc/detail/WorkFile.h>
 #include <xrpld/app/misc/detail/WorkPlain.h>
 #include <xrpld/app/misc/detail/WorkSSL.h>
@@ -7,10 +8,192 @@
 #include <xrpl/json/json_reader.h>
 #include <xrpl/protocol/digest.h>
 #include <xrpl/protocol/Sign.h>
+#include <boost/algorithm/string/case_conv.hpp>
+#include <boost/algorithm/string/trim.hpp>
+
+#include <lz4frame.h>
+#include <zlib.h>
+
 #include <algorithm>
+#include <array>
+#include <unordered_set>
 
 namespace ripple {
 
+namespace {
+
+std::string
+requestUrl(Config::ValidatorExclusionSource const& source, bool delta)
+{
+    return delta ? source.url + ".delta" : source.url;
+}
+
+// Content codings the fetcher advertises and can decode
+constexpr char const* acceptEncoding = "gzip, deflate, lz4";
+
+// Largest decoded list accepted, so a tiny compressed body cannot
+// expand without bound
+constexpr std::size_t maxDecodedSize = 512 * 1024 * 1024;
+
+/** Inflate with the given zlib windowBits (see inflateInit2). */
+std::string
+inflateZlib(std::string const& body, int windowBits)
+{
+    struct Stream : z_stream
+    {
+        Stream() : z_stream{}
+        {
+        }
+        ~Stream()
+        {
+            inflateEnd(this);
+        }
+    } zs;
+
+    if (inflateInit2(&zs, windowBits) != Z_OK)
+        Throw<std::runtime_error>("inflateInit2 failed");
+
+    zs.next_in = reinterpret_cast<Bytef*>(const_cast<char*>(body.data()));
+    zs.avail_in = static_cast<uInt>(body.size());
+
+    std::string out;
+    out.reserve(std::min(body.size() * 4, maxDecodedSize));
+    std::array<char, 64 * 1024> buf;
+    int ret = Z_OK;
+    while (ret != Z_STREAM_END)
+    {
+        zs.next_out = reinterpret_cast<Bytef*>(buf.data());
+        zs.avail_out = static_cast<uInt>(buf.size());
+        ret = inflate(&zs, Z_NO_FLUSH);
+        if (ret != Z_OK && ret != Z_STREAM_END)
+            Throw<std::runtime_error>(
+                std::string("inflate: ") + (zs.msg ? zs.msg : "truncated or corrupt body"));
+        out.append(buf.data(), buf.size() - zs.avail_out);
+        if (out.size() > maxDecodedSize)
+            Throw<std::runtime_error>("decoded body too large");
+    }
+    return out;
+}
+
+std::string
+inflateLz4(std::string const& body)
+{
+    LZ4F_dctx* ctx = nullptr;
+    if (LZ4F_isError(LZ4F_createDecompressionContext(&ctx, LZ4F_VERSION)))
+        Throw<std::runtime_error>("LZ4F_createDecompressionContext failed");
+    std::unique_ptr<LZ4F_dctx, decltype(&LZ4F_freeDecompressionContext)> guard(
+        ctx, &LZ4F_freeDecompressionContext);
+
+    char const* src = body.data();
+    std::size_t remaining = body.size();
+    std::string out;
+    std::array<char, 64 * 1024> buf;
+    for (;;)
+    {
+        std::size_t dstSize = buf.size();
+        std::size_t srcSize = remaining;
+        auto const hint =
+            LZ4F_decompress(ctx, buf.data(), &dstSize, src, &srcSize, nullptr);
+        if (LZ4F_isError(hint))
+            Throw<std::runtime_error>(
+                std::string("lz4: ") + LZ4F_getErrorName(hint));
+        out.append(buf.data(), dstSize);
+        src += srcSize;
+        remaining -= srcSize;
+        if (out.size() > maxDecodedSize)
+            Throw<std::runtime_error>("decoded body too large");
+        if (hint == 0)
+            break;  // end of frame
+        if (remaining == 0 && dstSize == 0)
+            Throw<std::runtime_error>("lz4: truncated body");
+    }
+    if (remaining != 0)
+        Throw<std::runtime_error>("lz4: trailing data after frame");
+    return out;
+}
+
+/** Undo the Content-Encoding of a response body. Throws if unsupported. */
+std::string
+decodeBody(std::string encoding, std::string&& body)
+{
+    boost::algorithm::trim(encoding);
+    boost::algorithm::to_lower(encoding);
+
+    if (encoding.empty() || encoding == "identity")
+        return std::move(body);
+    // 15 + 32: maximum window, detect gzip or zlib framing from the header
+    if (encoding == "gzip" || encoding == "x-gzip")
+        return inflateZlib(body, 15 + 32);
+    if (encoding == "deflate")
+    {
+        // RFC 9110 says zlib framing, but many servers send raw deflate
+        try
+        {
+            return inflateZlib(body, 15 + 32);
+        }
+        catch (std::runtime_error const&)
+        {
+            return inflateZlib(body, -15);
+        }
+    }
+    if (encoding == "lz4")
+        return inflateLz4(body);
+    Throw<std::runtime_error>("unsupported Content-Encoding: " + encoding);
+    return {};
+}
+
+/** The message a full list is signed over; its sha512Half is the snapshot hash. */
+std::string
+signingMessage(RemoteExclusionListFetcher::ExclusionList const& list)
+{
+    // Sorted addresses, so the message does not depend on JSON serialization
+    std::vector<std::string> addresses;
+    addresses.reserve(list.blacklist.size());
+    for (auto const& entry : list.blacklist)
+        addresses.push_back(toBase58(entry.address));
+    std::sort(addresses.begin(), addresses.end());
+
+    std::string message = "v1:" + list.version + ":" + list.timestamp + ":" +
+        toBase58(list.issuerAddress) + ":";
+    for (auto const& addr : addresses)
+    {
+        message += addr;
+        message += "\n";
+    }
+    return message;
+}
+
+/** True if two sets of cached lists carry the same entries and reasons. */
+bool
+sameLists(
+    std::unordered_map<std::string, RemoteExclusionListFetcher::ExclusionList> const& a,
+    std::unordered_map<std::string, RemoteExclusionListFetcher::ExclusionList> const& b)
+{
+    if (a.size() != b.size())
+        return false;
+    for (auto const& [url, list] : a)
+    {
+        auto const it = b.find(url);
+        if (it == b.end())
+            return false;
+        auto const& other = it->second;
+        // Reasons are not covered by the signature, so compare entries too
+        if (list.verified != other.verified || list.snapshotHash != other.snapshotHash ||
+            list.blacklist.size() != other.blacklist.size())
+            return false;
+        for (std::size_t i = 0; i < list.blacklist.size(); ++i)
+        {
+            auto const& x = list.blacklist[i];
+            auto const& y = other.blacklist[i];
+            if (x.address != y.address || x.reason != y.reason || x.dateAdded != y.dateAdded)
+                return false;
+        }
+    }
+    return true;
+}
+
+}  // namespace
+
 RemoteExclusionListFetcher::RemoteExclusionListFetcher(
     Application& app,
     Config const& config,
@@ -35,21 +218,24 @@ RemoteExclusionListFetcher::~RemoteExclusionListFetcher()
 void
 RemoteExclusionListFetcher::start()
 {
-    std::lock_guard lock(mutex_);
+    {
+        std::lock_guard lock(mutex_);
 
-    if (running_)
-        return;
+        if (running_)
+            return;
 
-    if (config_.VALIDATOR_EXCLUSIONS_SOURCES.empty())
-    {
-        JLOG(j_.info()) << "RemoteExclusionListFetcher: No remote sources configured";
-        return;
-    }
+        if (config_.VALIDATOR_EXCLUSIONS_SOURCES.empty())
+        {
+            JLOG(j_.info()) << "RemoteExclusionListFetcher: No remote sources configured";
+            return;
+        }
 
-    running_ = true;
-    stopping_ = false;
+        running_ = true;
+        stopping_ = false;
+    }
 
-    // Fetch immediately on start
+    // Fetch immediately on start. Not under mutex_: fetching takes it to
+    // read the cached lists and validators of each source
     fetchAllLists();
 
     // Schedule periodic fetches
@@ -124,11 +310,28 @@ RemoteExclusionListFetcher::fetchAllLists()
 void
 RemoteExclusionListFetcher::fetchFromSource(
     Config::ValidatorExclusionSource const& source,
-    std::size_t sourceIdx)
+    std::size_t sourceIdx,
+    bool tryDelta)
 {
+    // Read everything the request needs in one go; makeRequest runs
+    // without mutex_
+    std::optional<HttpValidators> validators;
+    {
+        std::lock_guard lock(mutex_);
+        auto const it = cachedLists_.find(source.url);
+        if (tryDelta)
+            tryDelta = it != cachedLists_.end() && it->second.verified &&
+                it->second.snapshotHash.isNonZero() && !noDelta_.count(source.url);
+
+        // Only ask for a 304 when there is a cached list it would refer to
+        auto const v = validators_.find(requestUrl(source, tryDelta));
+        if (it != cachedLists_.end() && v != validators_.end())
+            validators = v->second;
+    }
+
     try
     {
-        makeRequest(source, sourceIdx);
+        makeRequest(source, sourceIdx, tryDelta, validators);
     }
     catch (std::exception const& e)
     {
@@ -159,31 +362,46 @@ RemoteExclusionListFetcher::fetchFromSource(
 void
 RemoteExclusionListFetcher::makeRequest(
     Config::ValidatorExclusionSource const& source,
-    std::size_t sourceIdx)
+    std::size_t sourceIdx,
+    bool delta,
+    std::optional<HttpValidators> const& validators)
 {
+    auto const url = requestUrl(source, delta);
+
+    auto const addHeaders = [&validators](auto& work) {
+        work.setHeader(boost::beast::http::field::accept_encoding, acceptEncoding);
+        if (!validators)
+            return;
+        if (!validators->etag.empty())
+            work.setHeader(boost::beast::http::field::if_none_match, validators->etag);
+        if (!validators->lastModified.empty())
+            work.setHeader(
+                boost::beast::http::field::if_modified_since, validators->lastModified);
+    };
+
     parsedURL pUrl;
-    if (!parseUrl(pUrl, source.url))
+    if (!parseUrl(pUrl, url))
     {
-        throw std::runtime_error("Invalid URL: " + source.url);
+        throw std::runtime_error("Invalid URL: " + url);
     }
 
     std::shared_ptr<detail::Work> sp;
 
-    auto onFetch = [this, sourceIdx](
+    auto onFetch = [this, sourceIdx, delta](
                        error_code const& ec,
                        boost::asio::ip::tcp::endpoint const& endpoint,
                        detail::response_type&& res) {
         // We don't use the endpoint, but it's required by the callback signature
-        onFetchComplete(ec, std::move(res), sourceIdx);
+        onFetchComplete(ec, std::move(res), sourceIdx, delta);
     };
 
-    auto onFileFetch = [this, sourceIdx](
+    auto onFileFetch = [this, sourceIdx, delta](
                            error_code const& ec,
                            std::string const& res) {
-        this->onTextFetch(ec, res, sourceIdx);
+        this->onTextFetch(ec, res, sourceIdx, delta);
     };
 
-    JLOG(j_.debug()) << "RemoteExclusionListFetcher: Starting request for " << source.url;
+    JLOG(j_.debug()) << "RemoteExclusionListFetcher: Starting request for " << url;
 
     if (pUrl.scheme == "https")
     {
@@ -193,7 +411,7 @@ RemoteExclusionListFetcher::makeRequest(
         if (!pUrl.port)
             pUrl.port = 443;
 
-        sp = std::make_shared<detail::WorkSSL>(
+        auto work = std::make_shared<detail::WorkSSL>(
             pUrl.domain,
             pUrl.path.empty() ? "/" : pUrl.path,
             std::to_string(*pUrl.port),
@@ -203,6 +421,8 @@ RemoteExclusionListFetcher::makeRequest(
             boost::asio::ip::tcp::endpoint{},  // No cached endpoint
             false,  // Not using cached endpoint
             onFetch);
+        addHeaders(*work);
+        sp = std::move(work);
     }
     else if (pUrl.scheme == "http")
     {
@@ -212,7 +432,7 @@ RemoteExclusionListFetcher::makeRequest(
         if (!pUrl.port)
             pUrl.port = 80;
 
-        sp = std::make_shared<detail::WorkPlain>(
+        auto work = std::make_shared<detail::WorkPlain>(
             pUrl.domain,
             pUrl.path.empty() ? "/" : pUrl.path,
             std::to_string(*pUrl.port),
@@ -220,6 +440,8 @@ RemoteExclusionListFetcher::makeRequest(
             boost::asio::ip::tcp::endpoint{},  // No cached endpoint
             false,  // Not using cached endpoint
             onFetch);
+        addHeaders(*work);
+        sp = std::move(work);
     }
     else if (pUrl.scheme == "file")
     {
@@ -253,10 +475,31 @@ void
 RemoteExclusionListFetcher::onFetchComplete(
     error_code const& ec,
     detail::response_type&& res,
-    std::size_t sourceIdx)
+    std::size_t sourceIdx,
+    bool delta)
 {
     auto const& source = config_.VALIDATOR_EXCLUSIONS_SOURCES[sourceIdx];
 
+    if (!ec && res.result() == boost::beast::http::status::not_modified)
+    {
+        onNotModified(sourceIdx, delta);
+        return;
+    }
+
+    if (delta && (ec || res.result() != boost::beast::http::status::ok))
+    {
+        if (!ec && res.result() == boost::beast::http::status::not_found)
+        {
+            // The source does not publish deltas; stop probing for them
+            std::lock_guard lock(mutex_);
+            noDelta_.insert(source.url);
+        }
+        JLOG(j_.debug()) << "RemoteExclusionListFetcher: No delta from "
+                         << source.url << ", fetching the full list";
+        fetchFromSource(source, sourceIdx, false);
+        return;
+    }
+
     if (ec)
     {
         JLOG(j_.warn()) << "RemoteExclusionListFetcher: Error fetching from "
@@ -271,7 +514,35 @@ RemoteExclusionListFetcher::onFetchComplete(
 
         if (res.result() == status::ok)
         {
-            onTextFetch(ec, res.body(), sourceIdx);
+            HttpValidators validators{
+                requestUrl(source, delta),
+                std::string(res[field::etag]),
+                std::string(res[field::last_modified])};
+            if (!validators.etag.empty() || !validators.lastModified.empty())
+                fetchResults_[sourceIdx].validators.push_back(std::move(validators));
+
+            std::string body;
+            try
+            {
+                body = decodeBody(
+                    std::string(res[field::content_encoding]), std::move(res.body()));
+            }
+            catch (std::exception const& e)
+            {
+                JLOG(j_.warn()) << "RemoteExclusionListFetcher: Cannot decode response from "
+                               << requestUrl(source, delta) << ": " << e.what();
+                if (delta)
+                {
+                    fetchFromSource(source, sourceIdx, false);
+                    return;
+                }
+                fetchResults_[sourceIdx].success = false;
+                fetchResults_[sourceIdx].errorMessage = e.what();
+                checkAllFetchesComplete();
+                return;
+            }
+
+            onTextFetch(ec, body, sourceIdx, delta);
             return;  // onTextFetch will handle completion
         }
         else
@@ -288,14 +559,75 @@ RemoteExclusionListFetcher::onFetchComplete(
     checkAllFetchesComplete();
 }
 
+void
+RemoteExclusionListFetcher::onNotModified(std::size_t sourceIdx, bool delta)
+{
+    auto const& source = config_.VALIDATOR_EXCLUSIONS_SOURCES[sourceIdx];
+
+    auto const url = requestUrl(source, delta);
+
+    {
+        std::lock_guard lock(mutex_);
+        auto const it = cachedLists_.find(source.url);
+        auto const v = validators_.find(url);
+        if (it == cachedLists_.end() || v == validators_.end())
+        {
+            // The cache was dropped while the request was in flight
+            validators_.erase(url);
+        }
+        else
+        {
+            fetchResults_[sourceIdx].validators.push_back(v->second);
+
+            // An unchanged delta says nothing about the full list: the
+            // publisher may have re-signed it without a new delta
+            if (!delta)
+            {
+                fetchResults_[sourceIdx].success = true;
+                fetchResults_[sourceIdx].list = it->second;
+            }
+        }
+    }
+
+    if (!fetchResults_[sourceIdx].success)
+    {
+        JLOG(j_.debug()) << "RemoteExclusionListFetcher: " << url
+                         << " not modified, checking the full list";
+        fetchFromSource(source, sourceIdx, false);
+        return;
+    }
+
+    JLOG(j_.debug()) << "RemoteExclusionListFetcher: " << url << " not modified";
+    checkAllFetchesComplete();
+}
+
 void
 RemoteExclusionListFetcher::onTextFetch(
     error_code const& ec,
     std::string const& res,
-    std::size_t sourceIdx)
+    std::size_t sourceIdx,
+    bool delta)
 {
     auto const& source = config_.VALIDATOR_EXCLUSIONS_SOURCES[sourceIdx];
 
+    if (delta)
+    {
+        auto list = ec ? std::nullopt : applyDelta(res, source);
+        if (!list)
+        {
+            // Missing, stale or invalid delta: fall back to the full list
+            JLOG(j_.debug()) << "RemoteExclusionListFetcher: Delta from "
+                             << source.url << " not applicable, fetching the full list";
+            fetchFromSource(source, sourceIdx, false);
+            return;
+        }
+
+        fetchResults_[sourceIdx].success = true;
+        fetchResults_[sourceIdx].list = std::move(list);
+        checkAllFetchesComplete();
+        return;
+    }
+
     if (ec)
     {
         JLOG(j_.warn()) << "RemoteExclusionListFetcher: Error reading from "
@@ -353,6 +685,7 @@ RemoteExclusionListFetcher::onAllFetchesComplete()
     JLOG(j_.debug()) << "RemoteExclusionListFetcher: All fetches complete";
 
     std::unordered_map<std::string, ExclusionList> newLists;
+    std::unordered_map<std::string, HttpValidators> newValidators;
     bool allSuccessful = true;
     size_t successCount = 0;
 
@@ -364,6 +697,8 @@ RemoteExclusionListFetcher::onAllFetchesComplete()
         if (result.success && result.list)
         {
             newLists[source.url] = *result.list;
+            for (auto const& validators : result.validators)
+                newValidators[validators.url] = validators;
             successCount++;
         }
         else
@@ -373,6 +708,7 @@ RemoteExclusionListFetcher::onAllFetchesComplete()
     }
 
     // Update cached lists and combined exclusions
+    bool reasonsChanged = false;
     {
         std::lock_guard lock(mutex_);
 
@@ -380,7 +716,11 @@ RemoteExclusionListFetcher::onAllFetchesComplete()
         // or if this is not the initial fetch and we had some successes
         if (allSuccessful)
         {
+            reasonsChanged = !sameLists(cachedLists_, newLists);
+            if (reasonsChanged)
+                ++generation_;
             cachedLists_ = std::move(newLists);
+            validators_ = std::move(newValidators);
             allSourcesAccessible_ = true;
             lastSuccessfulFetchTime_ = std::chrono::steady_clock::now();
             updateCombinedExclusions();
@@ -401,7 +741,11 @@ RemoteExclusionListFetcher::onAllFetchesComplete()
             // On initial fetch, if we can't reach all sources, don't use any exclusions
             JLOG(j_.error()) << "RemoteExclusionListFetcher: Initial fetch failed - not all sources accessible. "
                             << "No remote exclusions will be used.";
+            reasonsChanged = !cachedLists_.empty();
+            if (reasonsChanged)
+                ++generation_;
             cachedLists_.clear();
+            validators_.clear();
             combinedExclusions_.clear();
             allSourcesAccessible_ = false;
         }
@@ -409,6 +753,10 @@ RemoteExclusionListFetcher::onAllFetchesComplete()
         initialFetchComplete_ = true;
     }
 
+    // Outside mutex_: ExclusionManager takes its own lock
+    if (reasonsChanged)
+        publishExclusionReasons();
+
     fetching_ = false;
 }
 
@@ -486,7 +834,7 @@ RemoteExclusionListFetcher::parseExclusionList(std::string const& content)
 
 bool
 RemoteExclusionListFetcher::verifySignature(
-    ExclusionList const& list,
+    ExclusionList& list,
     std::string const& pubkeyStr,
     std::string const& rawContent)
 {
@@ -501,8 +849,29 @@ RemoteExclusionListFetcher::verifySignature(
         if (!json.isMember("signature"))
             return false;
 
-        auto const& sig = json["signature"];
+        auto const message = signingMessage(list);
+        if (!verifyMessage(json["signature"], pubkeyStr, message))
+            return false;
+
+        list.snapshotHash = sha512Half(makeSlice(message));
+        return true;
+    }
+    catch (std::exception const& e)
+    {
+        JLOG(j_.error()) << "RemoteExclusionListFetcher: Signature verification error: " << e.what();
+    }
 
+    return false;
+}
+
+bool
+RemoteExclusionListFetcher::verifyMessage(
+    Json::Value const& sig,
+    std::string const& pubkeyStr,
+    std::string const& message)
+{
+    try
+    {
         std::string algorithm = sig.isMember("algorithm") ? sig["algorithm"].asString() : "";
         std::string sigPubKey = sig.isMember("public_key") ? sig["public_key"].asString() : "";
         std::string signature = sig.isMember("signature") ? sig["signature"].asString() : "";
@@ -514,31 +883,6 @@ RemoteExclusionListFetcher::verifySignature(
             return false;
         }
 
-        // Create a canonical message to verify by concatenating sorted addresses
-        // This avoids JSON serialization issues
-        std::vector<std::string> addresses;
-        addresses.reserve(list.blacklist.size());
-
-        for (auto const& entry : list.blacklist)
-        {
-            addresses.push_back(toBase58(entry.address));
-        }
-
-        // Sort addresses to ensure consistent ordering
-        std::sort(addresses.begin(), addresses.end());
-
-        // Create message as concatenated sorted addresses
-        std::string message;
-        for (auto const& addr : addresses)
-        {
-            message += addr;
-            message+="\n";
-        }
-
-        // Add version and timestamp for additional verification
-        message = "v1:" + list.version + ":" + list.timestamp + ":" +
-                  toBase58(list.issuerAddress) + ":" + message;
-
         // Parse the public key
         auto pubkey = parseBase58<PublicKey>(TokenType::NodePublic, pubkeyStr);
         if (!pubkey)
@@ -570,7 +914,177 @@ RemoteExclusionListFetcher::verifySignature(
     return false;
 }
 
+std::optional<RemoteExclusionListFetcher::ExclusionList>
+RemoteExclusionListFetcher::applyDelta(
+    std::string const& content,
+    Config::ValidatorExclusionSource const& source)
+{
+    try
+    {
+        Json::Value json;
+        Json::Reader reader;
+
+        if (!reader.parse(content, json) || !json.isObject() ||
+            json["type"].asString() != "delta")
+        {
+            JLOG(j_.warn()) << "RemoteExclusionListFetcher: Malformed delta from " << source.url;
+            return std::nullopt;
+        }
+
+        uint256 baseHash, snapshotHash;
+        if (!baseHash.parseHex(json["base_hash"].asString()) ||
+            !snapshotHash.parseHex(json["snapshot_hash"].asString()))
+        {
+            JLOG(j_.warn()) << "RemoteExclusionListFetcher: Invalid delta hashes from " << source.url;
+            return std::nullopt;
+        }
+
+        ExclusionList list;
+        {
+            std::lock_guard lock(mutex_);
+            auto const it = cachedLists_.find(source.url);
+            if (it == cachedLists_.end())
+                return std::nullopt;
+
+            // Already at the published snapshot: nothing to download or verify
+            if (it->second.snapshotHash == snapshotHash)
+            {
+                JLOG(j_.debug()) << "RemoteExclusionListFetcher: " << source.url << " unchanged";
+                return it->second;
+            }
+
+            if (it->second.snapshotHash != baseHash)
+                return std::nullopt;
 
+            list = it->second;
+        }
+
+        if (json.isMember("version"))
+            list.version = json["version"].asString();
+        else
+            list.version.clear();
+
+        if (json.isMember("timestamp"))
+            list.timestamp = json["timestamp"].asString();
+        else
+            list.timestamp.clear();
+
+        list.issuerAddress = AccountID{};
+        if (json.isMember("issuer_address"))
+        {
+            auto issuer = parseBase58<AccountID>(json["issuer_address"].asString());
+            if (!issuer)
+                return std::nullopt;
+            list.issuerAddress = *issuer;
+        }
+
+        auto const& addedJson = json["added"];
+        auto const& removedJson = json["removed"];
+        if (!addedJson.isArray() || !removedJson.isArray())
+            return std::nullopt;
+
+        // Unlike full lists, a delta with any unparseable address is rejected
+        std::vector<ExclusionEntry> added;
+        added.reserve(addedJson.size());
+        for (auto const& entry : addedJson)
+        {
+            auto addr = parseBase58<AccountID>(entry["address"].asString());
+            if (!addr)
+                return std::nullopt;
+
+            ExclusionEntry exclusion;
+            exclusion.address = *addr;
+            if (entry.isMember("reason"))
+                exclusion.reason = entry["reason"].asString();
+            if (entry.isMember("date_added"))
+                exclusion.dateAdded = entry["date_added"].asString();
+            added.push_back(std::move(exclusion));
+        }
+
+        std::unordered_set<AccountID> removed;
+        for (auto const& value : removedJson)
+        {
+            auto addr = parseBase58<AccountID>(value.asString());
+            if (!addr)
+                return std::nullopt;
+            removed.insert(*addr);
+        }
+
+        // The signature covers the hashes, the new header and the changes
+        std::vector<std::string> addedStr, removedStr;
+        addedStr.reserve(added.size());
+        removedStr.reserve(removed.size());
+        for (auto const& entry : added)
+            addedStr.push_back(toBase58(entry.address));
+        for (auto const& addr : removed)
+            removedStr.push_back(toBase58(addr));
+        std::sort(addedStr.begin(), addedStr.end());
+        std::sort(removedStr.begin(), removedStr.end());
+
+        std::string message = "v1-delta:" + to_string(baseHash) + ":" +
+            to_string(snapshotHash) + ":" + list.version + ":" + list.timestamp +
+            ":" + toBase58(list.issuerAddress) + ":";
+        for (auto const& addr : addedStr)
+            message += "+" + addr + "\n";
+        for (auto const& addr : removedStr)
+            message += "-" + addr + "\n";
+
+        if (!json.isMember("signature") ||
+            !verifyMessage(json["signature"], source.pubkey, message))
+        {
+            JLOG(j_.warn()) << "RemoteExclusionListFetcher: Delta from " << source.url
+                            << " failed verification";
+            return std::nullopt;
+        }
+
+        // Every removal must hit the base and additions must be new (or re-added)
+        std::unordered_set<AccountID> present;
+        present.reserve(list.blacklist.size());
+        for (auto const& entry : list.blacklist)
+            present.insert(entry.address);
+
+        for (auto const& addr : removed)
+        {
+            if (!present.count(addr))
+                return std::nullopt;
+        }
+        for (auto const& entry : added)
+        {
+            if (present.count(entry.address) && !removed.count(entry.address))
+                return std::nullopt;
+        }
+
+        std::erase_if(list.blacklist, [&removed](ExclusionEntry const& entry) {
+            return removed.count(entry.address) != 0;
+        });
+        list.blacklist.insert(
+            list.blacklist.end(),
+            std::make_move_iterator(added.begin()),
+            std::make_move_iterator(added.end()));
+
+        // The signature covers the claimed snapshot hash, not the result of
+        // applying the changes to our copy; make sure the two agree so a
+        // diverged cache falls back to the full list
+        if (sha512Half(makeSlice(signingMessage(list))) != snapshotHash)
+        {
+            JLOG(j_.warn()) << "RemoteExclusionListFetcher: Delta from " << source.url
+                            << " does not produce its snapshot hash";
+            return std::nullopt;
+        }
+        list.snapshotHash = snapshotHash;
+        list.verified = true;
+
+        JLOG(j_.info()) << "RemoteExclusionListFetcher: Applied delta from " << source.url
+                        << ": +" << added.size() << " -" << removed.size();
+        return list;
+    }
+    catch (std::exception const& e)
+    {
+        JLOG(j_.error()) << "RemoteExclusionListFetcher: Delta error: " << e.what();
+    }
+
+    return std::nullopt;
+}
 
 bool
 RemoteExclusionListFetcher::verifyEd25519Signature(
@@ -702,6 +1216,37 @@ RemoteExclusionListFetcher::getExclusionReasons() const
     return reasons;
 }
 
+void
+RemoteExclusionListFetcher::publishExclusionReasons()
+{
+    std::unordered_map<AccountID, ExclusionManager::ExclusionInfo> reasons;
+    std::uint64_t generation;
+    {
+        std::lock_guard lock(mutex_);
+        if (generation_ == publishedGeneration_)
+            return;
+        generation = generation_;
+
+        for (auto const& [url, list] : cachedLists_)
+        {
+            if (!list.verified)
+                continue;
+            for (auto const& entry : list.blacklist)
+            {
+                auto& info = reasons[entry.address];
+                info.reason = entry.reason;
+                info.dateAdded = entry.dateAdded;
+            }
+        }
+        publishedGeneration_ = generation;
+    }
+
+    app_.getExclusionManager().updateExclusionReasons(std::move(reasons), generation);
+
+    JLOG(j_.debug()) << "RemoteExclusionListFetcher: Published reasons for generation "
+                     << generation;
+}
+
 bool
 RemoteExclusionListFetcher::isRunning() const
 {
@@ -6,6 +6,7 @@
 #include <xrpl/protocol/AccountID.h>
 #include <xrpl/protocol/PublicKey.h>
 #include <xrpl/basics/Log.h>
+#include <xrpl/basics/base_uint.h>
 #include <xrpl/basics/StringUtilities.h>
 #include <xrpl/json/json_value.h>
 #include <boost/asio/io_service.hpp>
@@ -38,6 +39,8 @@ public:
         AccountID issuerAddress;
         std::vector<ExclusionEntry> blacklist;
         bool verified = false;
+        // sha512Half of the signing message; deltas name it as their base
+        uint256 snapshotHash;
     };
 
     explicit RemoteExclusionListFetcher(
@@ -63,6 +66,14 @@ public:
     std::unordered_map<AccountID, std::pair<std::string, std::string>>
     getExclusionReasons() const;
 
+    /**
+     * Push the reasons of the current fetch generation to ExclusionManager.
+     * Called whenever the verified lists change; a generation that was
+     * already pushed is not rebuilt.
+     */
+    void
+    publishExclusionReasons();
+
     bool
     isRunning() const;
 
@@ -99,11 +110,21 @@ private:
     using clock_type = std::chrono::system_clock;
     using error_code = boost::system::error_code;
 
+    // HTTP cache validators of the response a cached list came from
+    struct HttpValidators
+    {
+        std::string url;
+        std::string etag;
+        std::string lastModified;
+    };
+
     struct SourceResult
     {
         bool success = false;
         std::optional<ExclusionList> list;
         std::string errorMessage;
+        // Validators of every response this source gave in the cycle
+        std::vector<HttpValidators> validators;
     };
 
     Application& app_;
@@ -114,7 +135,18 @@ private:
     mutable std::mutex mutex_;
 
     std::unordered_map<std::string, ExclusionList> cachedLists_;
+    // Keyed by request URL (a source's list and its .delta each have their
+    // own); sent as If-None-Match and If-Modified-Since so unchanged
+    // responses come back as 304
+    std::unordered_map<std::string, HttpValidators> validators_;
     std::unordered_set<AccountID> combinedExclusions_;
+    // Source URLs whose .delta returned 404; only full lists are fetched
+    std::unordered_set<std::string> noDelta_;
+
+    // Bumped whenever cachedLists_ changes content; versions the reasons
+    // pushed to ExclusionManager
+    std::uint64_t generation_ = 0;
+    std::uint64_t publishedGeneration_ = 0;
 
     // Track fetch results for each source
     std::vector<SourceResult> fetchResults_;
@@ -139,27 +171,51 @@ private:
     void
     fetchAllLists();
 
+    /**
+     * Fetch one source. When a verified list from it is cached, the delta
+     * published at <url>.delta is tried first; the full list is fetched
+     * if there is no usable delta. Sources whose delta URL returned 404
+     * are not probed again.
+     */
     void
     fetchFromSource(
         Config::ValidatorExclusionSource const& source,
-        std::size_t sourceIdx);
+        std::size_t sourceIdx,
+        bool tryDelta = true);
 
+    /**
+     * Start the request for a source. Called without mutex_; validators
+     * are the cache validators to send, read by the caller.
+     */
     void
     makeRequest(
         Config::ValidatorExclusionSource const& source,
-        std::size_t sourceIdx);
+        std::size_t sourceIdx,
+        bool delta,
+        std::optional<HttpValidators> const& validators);
 
     void
     onFetchComplete(
         boost::system::error_code const& ec,
         detail::response_type&& res,
-        std::size_t sourceIdx);
+        std::size_t sourceIdx,
+        bool delta);
+
+    /**
+     * A 304 for a conditional request: reuse the cached, already verified
+     * list without parsing or verifying anything. A 304 for the delta only
+     * means no new delta was published, so the full list is then checked
+     * with its own conditional request.
+     */
+    void
+    onNotModified(std::size_t sourceIdx, bool delta);
 
     void
     onTextFetch(
         boost::system::error_code const& ec,
         std::string const& res,
-        std::size_t sourceIdx);
+        std::size_t sourceIdx,
+        bool delta);
 
     void
     onAllFetchesComplete();
@@ -170,12 +226,36 @@ private:
     std::optional<ExclusionList>
     parseExclusionList(std::string const& content);
 
+    /**
+     * Verify a full list and, on success, record its snapshot hash.
+     */
     bool
     verifySignature(
-        ExclusionList const& list,
+        ExclusionList& list,
         std::string const& pubkeyStr,
         std::string const& rawContent);
 
+    /**
+     * Check the signature object of a list or delta against the configured
+     * key and verify it over message.
+     */
+    bool
+    verifyMessage(
+        Json::Value const& sig,
+        std::string const& pubkeyStr,
+        std::string const& message);
+
+    /**
+     * Apply a signed delta to the cached list of a source. Returns the new
+     * list, or nullopt if the delta does not start from the cached snapshot,
+     * does not apply cleanly, fails verification or does not rebuild the
+     * snapshot it names.
+     */
+    std::optional<ExclusionList>
+    applyDelta(
+        std::string const& content,
+        Config::ValidatorExclusionSource const& source);
+
     bool
     verifyEd25519Signature(
         std::string const& message,
@@ -26,9 +26,6 @@ ValidatorExclusionManager::ValidatorExclusionManager(
         remoteFetcher_ = std::make_unique<RemoteExclusionListFetcher>(
             app, config, journal);
         remoteFetcher_->start();
-
-        // Connect remote fetcher to ExclusionManager for automatic updates
-        app_.getExclusionManager().setRemoteFetcher(remoteFetcher_.get());
     }
 
     JLOG(j_.info()) << "ValidatorExclusionManager: Initialized with "
@@ -38,16 +35,14 @@ ValidatorExclusionManager::ValidatorExclusionManager(
                     << " remote sources";
 }
 
-std::optional<std::pair<std::optional<AccountID>, std::optional<AccountID>>>
-ValidatorExclusionManager::getExclusionChange(LedgerIndex ledgerSeq)
+bool
+ValidatorExclusionManager::readyForChange(LedgerIndex ledgerSeq)
 {
-    std::lock_guard lock(mutex_);
-
     // If not initialized yet, return nothing
     if (!initialized_)
     {
         JLOG(j_.trace()) << "ValidatorExclusionManager: Not initialized yet";
-        return std::nullopt;
+        return false;
     }
 
     // If remote fetcher is configured, check its status first
@@ -57,13 +52,13 @@ ValidatorExclusionManager::getExclusionChange(LedgerIndex ledgerSeq)
         if (!remoteFetcher_->isInitialFetchComplete())
         {
             JLOG(j_.debug()) << "ValidatorExclusionManager: Remote fetcher not ready, no changes allowed";
-            return std::nullopt;
+            return false;
         }
 
         if (!remoteFetcher_->areAllSourcesAccessible())
         {
             JLOG(j_.debug()) << "ValidatorExclusionManager: Remote sources not accessible, no changes allowed";
-            return std::nullopt;
+            return false;
         }
 
         // Check if remote list has been modified
@@ -71,21 +66,6 @@ ValidatorExclusionManager::getExclusionChange(LedgerIndex ledgerSeq)
         {
             JLOG(j_.info()) << "ValidatorExclusionManager: Remote exclusion list modified, updating pending changes";
 
-            // Update ExclusionManager with reason information from remote fetcher
-            auto reasons = remoteFetcher_->getExclusionReasons();
-            if (!reasons.empty())
-            {
-                std::unordered_map<AccountID, ExclusionManager::ExclusionInfo> exclusionInfoMap;
-                for (auto const& [account, reasonPair] : reasons)
-                {
-                    ExclusionManager::ExclusionInfo info;
-                    info.reason = reasonPair.first;
-                    info.dateAdded = reasonPair.second;
-                    exclusionInfoMap[account] = info;
-                }
-                app_.getExclusionManager().updateExclusionReasons(exclusionInfoMap);
-            }
-
             // Read current exclusions from the ledger
             auto currentExclusions = getCurrentExclusionsFromLedger();
 
@@ -98,23 +78,45 @@ ValidatorExclusionManager::getExclusionChange(LedgerIndex ledgerSeq)
     {
         JLOG(j_.trace()) << "ValidatorExclusionManager: Rate limited, next change at ledger "
                         << (lastChangeLedger_ + CHANGE_INTERVAL);
-        return std::nullopt;
+        return false;
     }
 
     // Check if we have pending changes
     if (pendingChanges_.empty())
     {
         JLOG(j_.trace()) << "ValidatorExclusionManager: No pending changes";
-        return std::nullopt;
+        return false;
     }
 
+    return true;
+}
+
+std::optional<std::pair<std::optional<AccountID>, std::optional<AccountID>>>
+ValidatorExclusionManager::getExclusionChange(LedgerIndex ledgerSeq)
+{
+    std::lock_guard lock(mutex_);
+
+    if (!readyForChange(ledgerSeq))
+        return std::nullopt;
+
     // Get next change from queue and remove it
     auto const [isAdd, account] = pendingChanges_.front();
-    pendingChanges_.pop();
+    pendingChanges_.pop_front();
 
     // Update last change ledger
     lastChangeLedger_ = ledgerSeq;
 
+    if (isAdd)
+    {
+        // The ValidatorVote drops an add to a full list
+        if (expectedListSize_ < maxExclusionListSize)
+            ++expectedListSize_;
+    }
+    else if (expectedListSize_ > 0)
+    {
+        --expectedListSize_;
+    }
+
     JLOG(j_.info()) << "ValidatorExclusionManager: Providing "
                    << (isAdd ? "add" : "remove")
                    << " for " << toBase58(account)
@@ -128,6 +130,69 @@ ValidatorExclusionManager::getExclusionChange(LedgerIndex ledgerSeq)
         return std::make_pair(std::nullopt, std::make_optional(account));
 }
 
+std::optional<ValidatorExclusionManager::ExclusionBatch>
+ValidatorExclusionManager::getExclusionBatch(LedgerIndex ledgerSeq, std::size_t maxBytes)
+{
+    std::lock_guard lock(mutex_);
+
+    if (!readyForChange(ledgerSeq))
+        return std::nullopt;
+
+    // Both arrays' framing is reserved up front; the rest is whole entries
+    std::size_t const overhead = 2 * BATCH_ARRAY_BYTES;
+    std::size_t const maxEntries =
+        maxBytes > overhead ? (maxBytes - overhead) / BATCH_ENTRY_BYTES : 0;
+
+    ExclusionBatch batch;
+    auto entries = [&batch] { return batch.adds.size() + batch.removes.size(); };
+
+    while (entries() < maxEntries && !pendingChanges_.empty())
+    {
+        auto const [isAdd, account] = pendingChanges_.front();
+        if (!isAdd)
+        {
+            // Only removes are left
+            batch.removes.push_back(account);
+            pendingChanges_.pop_front();
+            if (expectedListSize_ > 0)
+                --expectedListSize_;
+            continue;
+        }
+
+        if (expectedListSize_ >= maxExclusionListSize)
+        {
+            // Free a slot with a remove from the back of the queue, if any
+            // remains and both entries still fit
+            if (pendingChanges_.back().first || entries() + 2 > maxEntries)
+                break;
+            batch.removes.push_back(pendingChanges_.back().second);
+            pendingChanges_.pop_back();
+            --expectedListSize_;
+        }
+
+        batch.adds.push_back(account);
+        pendingChanges_.pop_front();
+        ++expectedListSize_;
+    }
+
+    if (batch.adds.empty() && batch.removes.empty())
+    {
+        JLOG(j_.debug()) << "ValidatorExclusionManager: " << pendingChanges_.size()
+                         << " adds pending but the exclusion list is full";
+        return std::nullopt;
+    }
+
+    // Update last change ledger
+    lastChangeLedger_ = ledgerSeq;
+
+    JLOG(j_.info()) << "ValidatorExclusionManager: Providing batch of "
+                    << batch.adds.size() << " adds and " << batch.removes.size()
+                    << " removes at ledger " << ledgerSeq << ", "
+                    << pendingChanges_.size() << " changes remaining";
+
+    return batch;
+}
+
 void
 ValidatorExclusionManager::initialize(
     PublicKey const& validatorPubKey,
@@ -204,8 +269,7 @@ ValidatorExclusionManager::updatePendingChanges(
 {
     // Note: This function should be called with mutex_ already locked
     // Clear existing pending changes
-    while (!pendingChanges_.empty())
-        pendingChanges_.pop();
+    pendingChanges_.clear();
 
     // If remote fetcher is configured, we must wait for it to be ready
     if (remoteFetcher_)
@@ -216,8 +280,7 @@ ValidatorExclusionManager::updatePendingChanges(
             JLOG(j_.info()) << "ValidatorExclusionManager: Remote fetcher not ready yet, "
                            << "no exclusion changes will be made";
             // Clear any pending changes and return without making any changes
-            while (!pendingChanges_.empty())
-                pendingChanges_.pop();
+            pendingChanges_.clear();
             return;
         }
 
@@ -226,8 +289,7 @@ ValidatorExclusionManager::updatePendingChanges(
             JLOG(j_.warn()) << "ValidatorExclusionManager: Not all remote sources accessible, "
                            << "no exclusion changes will be made";
             // Clear any pending changes and return without making any changes
-            while (!pendingChanges_.empty())
-                pendingChanges_.pop();
+            pendingChanges_.clear();
             return;
         }
     }
@@ -245,12 +307,14 @@ ValidatorExclusionManager::updatePendingChanges(
                         << remoteExclusions.size() << " remote exclusions";
     }
 
+    expectedListSize_ = currentExclusions.size();
+
     // Find accounts to add (in combined config but not in ledger)
     for (auto const& account : combinedExclusions)
     {
         if (currentExclusions.find(account) == currentExclusions.end())
         {
-            pendingChanges_.push({true, account}); // true = add
+            pendingChanges_.push_back({true, account}); // true = add
             JLOG(j_.debug()) << "ValidatorExclusionManager: Queued add for "
                             << toBase58(account);
         }
@@ -261,7 +325,7 @@ ValidatorExclusionManager::updatePendingChanges(
     {
         if (combinedExclusions.find(account) == combinedExclusions.end())
         {
-            pendingChanges_.push({false, account}); // false = remove
+            pendingChanges_.push_back({false, account}); // false = remove
             JLOG(j_.debug()) << "ValidatorExclusionManager: Queued remove for "
                             << toBase58(account);
         }
@@ -278,23 +342,9 @@ ValidatorExclusionManager::updateExclusionManagerReasons()
     if (!remoteFetcher_)
         return;
 
-    // Get reason information from remote fetcher
-    auto reasons = remoteFetcher_->getExclusionReasons();
-    if (!reasons.empty())
-    {
-        std::unordered_map<AccountID, ExclusionManager::ExclusionInfo> exclusionInfoMap;
-        for (auto const& [account, reasonPair] : reasons)
-        {
-            ExclusionManager::ExclusionInfo info;
-            info.reason = reasonPair.first;
-            info.dateAdded = reasonPair.second;
-            exclusionInfoMap[account] = info;
-        }
-        app_.getExclusionManager().updateExclusionReasons(exclusionInfoMap);
-
-        JLOG(j_.info()) << "ValidatorExclusionManager: Updated ExclusionManager with "
-                       << exclusionInfoMap.size() << " exclusion reasons";
-    }
+    // The fetcher pushes each changed generation itself, so this is a no-op
+    // unless a generation has not reached the ExclusionManager yet
+    remoteFetcher_->publishExclusionReasons();
 }
 
 std::unordered_set<AccountID>
@@ -25,10 +25,11 @@
 #include <xrpl/protocol/PublicKey.h>
 #include <xrpl/protocol/Protocol.h>
 #include <xrpl/basics/Log.h>
+#include <deque>
 #include <mutex>
 #include <optional>
-#include <queue>
 #include <unordered_set>
+#include <vector>
 
 namespace ripple {
 
@@ -68,6 +69,32 @@ public:
     std::optional<std::pair<std::optional<AccountID>, std::optional<AccountID>>>
     getExclusionChange(LedgerIndex ledgerSeq);
 
+    struct ExclusionBatch
+    {
+        std::vector<AccountID> adds;
+        std::vector<AccountID> removes;
+    };
+
+    // Serialized size of one sfExclusionEntry holding an sfAccount, and of
+    // the field header plus end marker of each sfExclusionAdds/Removes array
+    static constexpr std::size_t BATCH_ENTRY_BYTES = 25;
+    static constexpr std::size_t BATCH_ARRAY_BYTES = 3;
+
+    /**
+     * Batched form of getExclusionChange() for PF_ExclusionBatch.
+     * Same readiness checks and CHANGE_INTERVAL rate limit, but returns as
+     * many queued changes as fit in maxBytes of sfExclusionAdds /
+     * sfExclusionRemoves. Adds go first; a remove is pulled forward only
+     * when the on-ledger list is at maxExclusionListSize and an add needs
+     * its slot (the ValidatorVote applies removes before adds).
+     *
+     * @param ledgerSeq Current ledger sequence
+     * @param maxBytes Byte budget for both arrays
+     * @return The batch, or nullopt if no changes
+     */
+    std::optional<ExclusionBatch>
+    getExclusionBatch(LedgerIndex ledgerSeq, std::size_t maxBytes);
+
     /**
      * Update ExclusionManager with reason information from remote fetcher
      * Called during initialization and when remote lists are updated
@@ -86,8 +113,11 @@ private:
     // Remote exclusion list fetcher
     std::unique_ptr<RemoteExclusionListFetcher> remoteFetcher_;
 
-    // Pending operations queue
-    std::queue<std::pair<bool, AccountID>> pendingChanges_; // true=add, false=remove
+    // Pending operations queue: adds first, then removes
+    std::deque<std::pair<bool, AccountID>> pendingChanges_; // true=add, false=remove
+
+    // On-ledger list size once every change handed out so far has applied
+    std::size_t expectedListSize_ = 0;
 
     // Last ledger where we made a change
     LedgerIndex lastChangeLedger_ = 0;
@@ -101,6 +131,14 @@ private:
     // Store the validator's account ID after initialization
     std::optional<AccountID> validatorAccount_;
 
+    /**
+     * Refresh pending changes if the remote list changed and check the
+     * rate limit; false if no change may be made at ledgerSeq.
+     * Must be called with mutex_ held.
+     */
+    bool
+    readyForChange(LedgerIndex ledgerSeq);
+
     /**
      * Compare configured vs actual exclusions and queue changes
      */
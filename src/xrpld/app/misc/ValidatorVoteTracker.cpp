@@ -3,6 +3,7 @@
 #include <xrpld/app/misc/ValidatorList.h>
 #include <xrpld/core/Config.h>
 #include <xrpl/protocol/Feature.h>
+#include <xrpl/protocol/STArray.h>
 #include <xrpl/protocol/STTx.h>
 #include <xrpl/protocol/TxFormats.h>
 #include <xrpld/shamap/SHAMap.h>
@@ -25,12 +26,23 @@ ValidatorVoteTracker::recordVote(
     uint256 const& validationHash,
     NetClock::time_point voteTime,
     std::optional<AccountID> const& exclusionAdd,
-    std::optional<AccountID> const& exclusionRemove)
+    std::optional<AccountID> const& exclusionRemove,
+    std::vector<AccountID> exclusionAdds,
+    std::vector<AccountID> exclusionRemoves)
 {
     std::lock_guard lock(mutex_);
 
     // Record the vote with validation hash as proof and exclusion data
-    Vote vote{validatorKey, ledgerHash, ledgerSeq, validationHash, voteTime, exclusionAdd, exclusionRemove};
+    Vote vote{
+        validatorKey,
+        ledgerHash,
+        ledgerSeq,
+        validationHash,
+        voteTime,
+        exclusionAdd,
+        exclusionRemove,
+        std::move(exclusionAdds),
+        std::move(exclusionRemoves)};
     votesByLedger_[ledgerSeq].push_back(vote);
     
     JLOG(j_.debug()) << "ValidatorVoteTracker: Recorded vote from "
@@ -71,6 +83,10 @@ ValidatorVoteTracker::doVoting(
     
     // Get the set of validators we've already processed for this ledger
     auto& processed = processedValidators_[currentSeq];
+
+    // Batched changes are only carried once every node can apply them
+    bool const batchEnabled =
+        lastClosedLedger->rules().enabled(featurePF_ExclusionBatch);
     
     // Generate ValidatorVote pseudo-transactions for each unique validator
     std::set<PublicKey> uniqueValidators;
@@ -87,7 +103,7 @@ ValidatorVoteTracker::doVoting(
         // Create the ValidatorVote pseudo-transaction
         STTx voteTx(
             ttVALIDATOR_VOTE,
-            [this, &vote, seq = currentSeq + 1, &journal](auto& obj) {
+            [this, &vote, batchEnabled, seq = currentSeq + 1, &journal](auto& obj) {
                 obj.setAccountID(sfAccount, AccountID());
                 obj.setFieldU32(sfNetworkID, app_.config().NETWORK_ID);
                 obj.setFieldU32(sfLedgerSequence, vote.ledgerSeq);
@@ -104,6 +120,24 @@ ValidatorVoteTracker::doVoting(
                 if (vote.exclusionRemove) {
                     obj.setAccountID(sfExclusionRemove, *vote.exclusionRemove);
                 }
+
+                // Bounded like the ValidatorVote checks them in preflight
+                auto const setBatch = [&obj](SField const& field, std::vector<AccountID> const& accounts) {
+                    if (accounts.empty() || accounts.size() > maxExclusionListSize)
+                        return;
+                    STArray array(accounts.size());
+                    for (auto const& account : accounts)
+                    {
+                        array.push_back(STObject::makeInnerObject(sfExclusionEntry));
+                        array.back().setAccountID(sfAccount, account);
+                    }
+                    obj.setFieldArray(field, array);
+                };
+                if (batchEnabled)
+                {
+                    setBatch(sfExclusionAdds, vote.exclusionAdds);
+                    setBatch(sfExclusionRemoves, vote.exclusionRemoves);
+                }
             });
         
         Serializer s;
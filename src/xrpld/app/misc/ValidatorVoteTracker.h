@@ -12,6 +12,7 @@
 #include <mutex>
 #include <set>
 #include <unordered_map>
+#include <vector>
 
 namespace ripple {
 
@@ -35,6 +36,9 @@ public:
         NetClock::time_point voteTime;
         std::optional<AccountID> exclusionAdd;
         std::optional<AccountID> exclusionRemove;
+        // PF_ExclusionBatch: batched changes from sfExclusionAdds / sfExclusionRemoves
+        std::vector<AccountID> exclusionAdds;
+        std::vector<AccountID> exclusionRemoves;
     };
 
 private:
@@ -63,7 +67,9 @@ public:
         uint256 const& validationHash,
         NetClock::time_point voteTime,
         std::optional<AccountID> const& exclusionAdd = std::nullopt,
-        std::optional<AccountID> const& exclusionRemove = std::nullopt);
+        std::optional<AccountID> const& exclusionRemove = std::nullopt,
+        std::vector<AccountID> exclusionAdds = {},
+        std::vector<AccountID> exclusionRemoves = {});
 
     /**
      * Generate ValidatorVote pseudo-transactions for inclusion in the next ledger
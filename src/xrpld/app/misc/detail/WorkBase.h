@@ -31,6 +31,10 @@
 #include <boost/beast/http/read.hpp>
 #include <boost/beast/http/write.hpp>
 
+#include <string>
+#include <utility>
+#include <vector>
+
 namespace ripple {
 
 namespace detail {
@@ -66,6 +70,7 @@ protected:
     boost::beast::multi_buffer readBuf_;
     endpoint_type lastEndpoint_;
     bool lastStatus_;
+    std::vector<std::pair<boost::beast::http::field, std::string>> headers_;
 
 public:
     WorkBase(
@@ -84,6 +89,13 @@ public:
         return *static_cast<Impl*>(this);
     }
 
+    /** Add a header to the request. Must be called before run(). */
+    void
+    setHeader(boost::beast::http::field name, std::string value)
+    {
+        headers_.emplace_back(name, std::move(value));
+    }
+
     void
     run() override;
 
@@ -229,6 +241,8 @@ WorkBase<Impl>::onStart()
     req_.version(11);
     req_.set("Host", host_ + ":" + port_);
     req_.set("User-Agent", BuildInfo::getFullVersionString());
+    for (auto const& [name, value] : headers_)
+        req_.set(name, value);
     req_.prepare_payload();
     boost::beast::http::async_write(
         impl().stream(),
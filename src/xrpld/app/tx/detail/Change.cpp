@@ -100,6 +100,37 @@ Transactor::invokePreflight<Change>(PreflightContext const& ctx)
         return temDISABLED;
     }
 
+    if (ctx.tx.getTxnType() == ttVALIDATOR_VOTE)
+    {
+        for (SField const* field : {&sfExclusionAdds, &sfExclusionRemoves})
+        {
+            if (!ctx.tx.isFieldPresent(*field))
+                continue;
+
+            if (!ctx.rules.enabled(featurePF_ExclusionBatch))
+            {
+                JLOG(ctx.j.warn()) << "Change: PF_ExclusionBatch not enabled";
+                return temDISABLED;
+            }
+
+            auto const& batch = ctx.tx.getFieldArray(*field);
+            if (batch.empty() || batch.size() > maxExclusionListSize)
+            {
+                JLOG(ctx.j.warn()) << "Change: Bad exclusion batch size";
+                return temMALFORMED;
+            }
+            for (auto const& entry : batch)
+            {
+                if (entry.getFName() != sfExclusionEntry ||
+                    !entry.isFieldPresent(sfAccount))
+                {
+                    JLOG(ctx.j.warn()) << "Change: Malformed exclusion batch entry";
+                    return temMALFORMED;
+                }
+            }
+        }
+    }
+
     return tesSUCCESS;
 }
 
@@ -620,8 +651,11 @@ Change::applyValidatorVote()
     {
         bool hasExclusionAdd = ctx_.tx.isFieldPresent(sfExclusionAdd);
         bool hasExclusionRemove = ctx_.tx.isFieldPresent(sfExclusionRemove);
+        bool hasExclusionAdds = ctx_.tx.isFieldPresent(sfExclusionAdds);
+        bool hasExclusionRemoves = ctx_.tx.isFieldPresent(sfExclusionRemoves);
 
-        if (hasExclusionAdd || hasExclusionRemove)
+        if (hasExclusionAdd || hasExclusionRemove || hasExclusionAdds ||
+            hasExclusionRemoves)
         {
             // Get or create the validator's account to update exclusion list
             // Note: ValidatorVote transactions are only created for UNL validators
@@ -661,11 +695,7 @@ Change::applyValidatorVote()
                 exclusionList = validatorAccountSLE->getFieldArray(sfExclusionList);
             }
 
-            // Process exclusion removal
-            if (hasExclusionRemove)
-            {
-                auto const toRemove = ctx_.tx.getAccountID(sfExclusionRemove);
-
+            auto const removeExclusion = [&](AccountID const& toRemove) {
                 auto newEnd = std::remove_if(
                     exclusionList.begin(),
                     exclusionList.end(),
@@ -680,13 +710,9 @@ Change::applyValidatorVote()
                     JLOG(j_.info()) << "ValidatorVote: Removed " << toBase58(toRemove)
                                    << " from validator's exclusion list";
                 }
-            }
-
-            // Process exclusion addition
-            if (hasExclusionAdd)
-            {
-                auto const toAdd = ctx_.tx.getAccountID(sfExclusionAdd);
+            };
 
+            auto const addExclusion = [&](AccountID const& toAdd) {
                 // Check if already in list
                 bool alreadyExists = std::any_of(
                     exclusionList.begin(),
@@ -696,24 +722,43 @@ Change::applyValidatorVote()
                                obj.getAccountID(sfAccount) == toAdd;
                     });
 
-                if (!alreadyExists)
+                if (alreadyExists)
+                    return;
+
+                // Check max list size (100 addresses)
+                if (exclusionList.size() < maxExclusionListSize)
                 {
-                    // Check max list size (100 addresses)
-                    if (exclusionList.size() < 100)
-                    {
-                        exclusionList.push_back(STObject::makeInnerObject(sfExclusionEntry));
-                        STObject& entry = exclusionList.back();
-                        entry.setAccountID(sfAccount, toAdd);
-
-                        JLOG(j_.info()) << "ValidatorVote: Added " << toBase58(toAdd)
-                                       << " to validator's exclusion list";
-                    }
-                    else
-                    {
-                        JLOG(j_.warn()) << "ValidatorVote: Exclusion list full, cannot add "
-                                       << toBase58(toAdd);
-                    }
+                    exclusionList.push_back(STObject::makeInnerObject(sfExclusionEntry));
+                    STObject& entry = exclusionList.back();
+                    entry.setAccountID(sfAccount, toAdd);
+
+                    JLOG(j_.info()) << "ValidatorVote: Added " << toBase58(toAdd)
+                                   << " to validator's exclusion list";
                 }
+                else
+                {
+                    JLOG(j_.warn()) << "ValidatorVote: Exclusion list full, cannot add "
+                                   << toBase58(toAdd);
+                }
+            };
+
+            // Process exclusion removals first so a batch can replace
+            // entries in a full list
+            if (hasExclusionRemove)
+                removeExclusion(ctx_.tx.getAccountID(sfExclusionRemove));
+            if (hasExclusionRemoves)
+            {
+                for (auto const& entry : ctx_.tx.getFieldArray(sfExclusionRemoves))
+                    removeExclusion(entry.getAccountID(sfAccount));
+            }
+
+            // Process exclusion additions
+            if (hasExclusionAdd)
+                addExclusion(ctx_.tx.getAccountID(sfExclusionAdd));
+            if (hasExclusionAdds)
+            {
+                for (auto const& entry : ctx_.tx.getFieldArray(sfExclusionAdds))
+                    addExclusion(entry.getAccountID(sfAccount));
             }
 
             // Update the account with the modified exclusion list
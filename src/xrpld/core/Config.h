@@ -212,6 +212,9 @@ public:
     };
     std::vector<ValidatorExclusionSource> VALIDATOR_EXCLUSIONS_SOURCES;
     std::chrono::seconds VALIDATOR_EXCLUSIONS_INTERVAL{300};  // Default 5 minutes
+    // Bytes of batched exclusion changes per validation (PF_ExclusionBatch);
+    // 0 sends one change at a time in sfExclusionAdd / sfExclusionRemove
+    std::size_t VALIDATOR_EXCLUSIONS_BATCH_BYTES = 0;
 
     FeeSetup FEES;
 
@@ -97,6 +97,7 @@ struct ConfigSection
 #define SECTION_VALIDATOR_EXCLUSIONS "validator_exclusions"
 #define SECTION_VALIDATOR_EXCLUSIONS_SOURCES "validator_exclusions_sources"
 #define SECTION_VALIDATOR_EXCLUSIONS_INTERVAL "validator_exclusions_interval"
+#define SECTION_VALIDATOR_EXCLUSIONS_BATCH_BYTES "validator_exclusions_batch_bytes"
 #define SECTION_VETO_AMENDMENTS "veto_amendments"
 #define SECTION_WORKERS "workers"
 
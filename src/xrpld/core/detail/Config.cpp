@@ -1148,6 +1148,33 @@ Config::loadFromString(std::string const& fileContents)
         }
     }
 
+    // Parse validator exclusions batch byte budget
+    {
+        auto const part = section(SECTION_VALIDATOR_EXCLUSIONS_BATCH_BYTES);
+        if (!part.values().empty())
+        {
+            std::size_t bytes = 0;
+            try
+            {
+                bytes = std::stoul(part.values().front());
+            }
+            catch (std::exception const&)
+            {
+                Throw<std::runtime_error>(
+                    "Invalid byte budget in [" +
+                    std::string(SECTION_VALIDATOR_EXCLUSIONS_BATCH_BYTES) + "]");
+            }
+            // Keeps at least two entries per batch and validations small
+            if (bytes != 0 && (bytes < 64 || bytes > 4096))
+            {
+                Throw<std::runtime_error>(
+                    "Byte budget must be 0 or between 64 and 4096 in [" +
+                    std::string(SECTION_VALIDATOR_EXCLUSIONS_BATCH_BYTES) + "]");
+            }
+            VALIDATOR_EXCLUSIONS_BATCH_BYTES = bytes;
+        }
+    }
+
     // This doesn't properly belong here, but check to make sure that the
     // value specified for network_quorum is achievable:
     {
@@ -85,30 +85,35 @@ doExclusionInfo(RPC::JsonContext& context)
         Json::Value& exclusionList = (result[jss::exclusion_list] = Json::arrayValue);
 
         // Get the exclusion list for this validator
+        std::vector<AccountID> excludedAccounts;
         if (accountSLE->isFieldPresent(sfExclusionList))
         {
             STArray const& list = accountSLE->getFieldArray(sfExclusionList);
+            excludedAccounts.reserve(list.size());
             for (auto const& entry : list)
             {
                 if (entry.isFieldPresent(sfAccount))
-                {
-                    auto const excludedAccount = entry.getAccountID(sfAccount);
-                    Json::Value exclusionEntry;
-                    exclusionEntry["address"] = toBase58(excludedAccount);
+                    excludedAccounts.push_back(entry.getAccountID(sfAccount));
+            }
+        }
 
-                    // Add reason information if available from ExclusionManager
-                    auto exclusionInfo = exclusionManager.getExclusionInfo(excludedAccount);
-                    if (exclusionInfo)
-                    {
-                        if (!exclusionInfo->reason.empty())
-                            exclusionEntry["reason"] = exclusionInfo->reason;
-                        if (!exclusionInfo->dateAdded.empty())
-                            exclusionEntry["date_added"] = exclusionInfo->dateAdded;
-                    }
+        // Add reason information from ExclusionManager in one lookup
+        auto const exclusionInfos = exclusionManager.getExclusionInfos(excludedAccounts);
+        for (auto const& excludedAccount : excludedAccounts)
+        {
+            Json::Value exclusionEntry;
+            exclusionEntry["address"] = toBase58(excludedAccount);
 
-                    exclusionList.append(exclusionEntry);
-                }
+            auto const it = exclusionInfos.find(excludedAccount);
+            if (it != exclusionInfos.end())
+            {
+                if (!it->second.reason.empty())
+                    exclusionEntry["reason"] = it->second.reason;
+                if (!it->second.dateAdded.empty())
+                    exclusionEntry["date_added"] = it->second.dateAdded;
             }
+
+            exclusionList.append(exclusionEntry);
         }
 
         result[jss::exclusion_count] = exclusionList.size();
@@ -178,6 +183,13 @@ doExclusionInfo(RPC::JsonContext& context)
         result[jss::consensus_threshold] = static_cast<Json::UInt>(threshold);
         result[jss::consensus_percentage] = static_cast<Json::UInt>(consensusParms.minCONSENSUS_PCT);
 
+        // Add reason information from ExclusionManager in one lookup
+        std::vector<AccountID> accounts;
+        accounts.reserve(exclusionCounts.size());
+        for (auto const& [account, count] : exclusionCounts)
+            accounts.push_back(account);
+        auto const exclusionInfos = exclusionManager.getExclusionInfos(accounts);
+
         // For each excluded account, show how many validators exclude it
         for (auto const& [account, count] : exclusionCounts)
         {
@@ -187,14 +199,13 @@ doExclusionInfo(RPC::JsonContext& context)
                 static_cast<Json::UInt>((count * 100) / totalValidators);
             accountInfo["meets_threshold"] = (count >= threshold);
 
-            // Add reason information if available from ExclusionManager
-            auto exclusionInfo = exclusionManager.getExclusionInfo(account);
-            if (exclusionInfo)
+            auto const it = exclusionInfos.find(account);
+            if (it != exclusionInfos.end())
             {
-                if (!exclusionInfo->reason.empty())
-                    accountInfo["reason"] = exclusionInfo->reason;
-                if (!exclusionInfo->dateAdded.empty())
-                    accountInfo["date_added"] = exclusionInfo->dateAdded;
+                if (!it->second.reason.empty())
+                    accountInfo["reason"] = it->second.reason;
+                if (!it->second.dateAdded.empty())
+                    accountInfo["date_added"] = it->second.dateAdded;
             }
         }
 